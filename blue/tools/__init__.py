@@ -288,6 +288,7 @@ from .media_library import (
     search_media_cmd,
     get_recently_played_cmd,
     get_in_progress_cmd,
+    refresh_subscriptions_cmd,
     execute_media_library_command,
 )
 
@@ -605,6 +606,7 @@ __all__ = [
     'search_media_cmd',
     'get_recently_played_cmd',
     'get_in_progress_cmd',
+    'refresh_subscriptions_cmd',
     'execute_media_library_command',
 
     # Locations
@@ -15,12 +15,12 @@ Features:
 
 from __future__ import annotations
 
-import datetime
 import json
 import math
 import os
 import re
 import sqlite3
+import time
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
@@ -34,6 +34,9 @@ import requests
 
 LOCATIONS_DB = os.environ.get("BLUE_LOCATIONS_DB", "data/locations.db")
 
+# Bump when the schema below changes; stored in PRAGMA user_version
+SCHEMA_VERSION = 1
+
 
 class LocationCategory(Enum):
     HOME = "home"
@@ -50,6 +53,10 @@ class LocationCategory(Enum):
     OTHER = "other"
 
 
+# Value -> member lookup used when decoding rows (skips Enum.__call__)
+_CAT_MAP: Dict[str, LocationCategory] = {c.value: c for c in LocationCategory}
+
+
 @dataclass
 class Location:
     """Represents a saved location."""
@@ -66,8 +73,8 @@ class Location:
     visit_count: int = 0
     last_visited: Optional[float] = None
     favorite: bool = False
-    created_at: float = field(default_factory=lambda: datetime.datetime.now().timestamp())
-    updated_at: float = field(default_factory=lambda: datetime.datetime.now().timestamp())
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -116,12 +123,22 @@ class LocationManager:
         self._ensure_db()
 
     def _ensure_db(self):
-        """Ensure database and tables exist."""
+        """Ensure database and tables exist.
+
+        The schema version is tracked in ``PRAGMA user_version`` so an
+        up-to-date database costs a single pragma read instead of DDL.
+        """
         os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
+        cursor.execute("PRAGMA user_version")
+        version = cursor.fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            conn.close()
+            return
+
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS locations (
                 id TEXT PRIMARY KEY,
@@ -153,6 +170,13 @@ class LocationManager:
             )
         """)
 
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_location_visits_location
+            ON location_visits (location_id)
+        """)
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
         conn.commit()
         conn.close()
 
@@ -268,16 +292,17 @@ class LocationManager:
 
     def search_locations(self, query: str) -> List[Location]:
         """Search locations by name, address, or notes."""
-        query_lower = query.lower()
-
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
+        # One case-insensitive LIKE over the joined text instead of a
+        # LOWER() per column
         cursor.execute("""
             SELECT * FROM locations
-            WHERE LOWER(name) LIKE ? OR LOWER(address) LIKE ? OR LOWER(notes) LIKE ?
+            WHERE (name || ' ' || COALESCE(address, '') || ' ' || COALESCE(notes, ''))
+                LIKE ? COLLATE NOCASE
             ORDER BY favorite DESC, name
-        """, (f"%{query_lower}%", f"%{query_lower}%", f"%{query_lower}%"))
+        """, (f"%{query}%",))
 
         rows = cursor.fetchall()
         conn.close()
@@ -301,7 +326,7 @@ class LocationManager:
             if coords:
                 location.latitude, location.longitude = coords
 
-        location.updated_at = datetime.datetime.now().timestamp()
+        location.updated_at = time.time()
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -348,7 +373,7 @@ class LocationManager:
         if not location:
             return False
 
-        now = datetime.datetime.now().timestamp()
+        now = time.time()
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -425,7 +450,7 @@ class LocationManager:
             address=row[2] or "",
             latitude=row[3],
             longitude=row[4],
-            category=LocationCategory(row[5]),
+            category=_CAT_MAP[row[5]],
             notes=row[6],
             phone=row[7],
             website=row[8],
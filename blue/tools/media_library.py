@@ -15,24 +15,119 @@ Features:
 from __future__ import annotations
 
 import datetime
+import email.utils
+import functools
 import json
+import logging
 import os
 import re
 import sqlite3
+import threading
 import time
 import uuid
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
 
+from ..utils import DATACLASS_SLOTS, json_dumps
+
+logger = logging.getLogger("blue.media_library")
+
 # ================================================================================
 # CONFIGURATION
 # ================================================================================
 
 MEDIA_LIBRARY_DB = os.environ.get("BLUE_MEDIA_LIBRARY_DB", "data/media_library.db")
+FEED_TIMEOUT = 15  # seconds per feed request
+FEED_WORKERS = 8
+
+_ITUNES_NS = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
+
+def _json_default(obj: Any) -> Any:
+    """Serialize library dataclasses through their ``to_dict``."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> str:
+    return json_dumps(obj, default=_json_default)
+
+
+# Statement text is shared across calls so the connection's prepared
+# statement cache hits instead of re-parsing
+_SQL_INSERT_COLLECTION = """
+    INSERT INTO collections (
+        uuid, title, description, media_type, author, feed_url, image_url,
+        subscribed, auto_download, created_at, updated_at, last_checked
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_MEDIA_ITEM = """
+    INSERT INTO media_items (
+        uuid, parent_id, title, description, duration_seconds, media_url,
+        published_date, episode_number, season_number, progress_seconds,
+        status, created_at, last_played
+    )
+    VALUES (?, (SELECT id FROM collections WHERE uuid = ?), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_COLLECTION_TAG = (
+    "INSERT OR IGNORE INTO collection_tags (collection_id, tag) VALUES (?, ?)"
+)
+_SQL_GET_COLLECTION = "SELECT * FROM collections WHERE uuid = ?"
+# Items are joined to their collection to expose the parent's UUID
+_SQL_SELECT_ITEMS = """
+    SELECT m.*, c.uuid AS parent_uuid
+    FROM media_items m
+    JOIN collections c ON c.id = m.parent_id
+"""
+_SQL_UPDATE_PROGRESS = """
+    UPDATE media_items SET
+        progress_seconds = ?,
+        status = ?,
+        last_played = ?
+    WHERE uuid = ?
+"""
+_SQL_INSERT_PLAYBACK = """
+    INSERT INTO playback_history (media_item_id, played_at, duration_seconds)
+    SELECT id, ?, ? FROM media_items WHERE uuid = ?
+"""
+# FTS rows share the rowid of the row they index, so triggers and lookups
+# address them directly instead of scanning the FTS table
+_SQL_SEARCH_COLLECTIONS_FTS = """
+    SELECT rowid FROM collections_fts
+    WHERE collections_fts MATCH ?
+    ORDER BY rank
+    LIMIT ? OFFSET ?
+"""
+_SQL_SEARCH_ITEMS_FTS = """
+    SELECT rowid FROM media_items_fts
+    WHERE media_items_fts MATCH ?
+    ORDER BY rank
+    LIMIT ? OFFSET ?
+"""
+_SQL_SUBSCRIBED_FEEDS = """
+    SELECT id, uuid, feed_url FROM collections
+    WHERE subscribed = 1 AND feed_url IS NOT NULL AND feed_url != ''
+"""
+_SQL_KNOWN_MEDIA_URLS = (
+    "SELECT media_url FROM media_items WHERE parent_id = ? AND media_url IS NOT NULL"
+)
+_SQL_MARK_CHECKED = "UPDATE collections SET last_checked = ? WHERE id = ?"
+_SQL_RECENTLY_PLAYED = _SQL_SELECT_ITEMS + """
+    WHERE m.last_played IS NOT NULL
+    ORDER BY m.last_played DESC
+    LIMIT ?
+"""
+_SQL_IN_PROGRESS = _SQL_SELECT_ITEMS + """
+    WHERE m.status = ?
+    ORDER BY m.last_played DESC
+"""
 
 
 class MediaType(Enum):
@@ -50,7 +145,75 @@ class MediaStatus(Enum):
     ARCHIVED = "archived"
 
 
-@dataclass
+# Value -> member lookups used when decoding rows (skips Enum.__call__)
+_MEDIA_TYPE_MAP: Dict[str, MediaType] = {t.value: t for t in MediaType}
+_MEDIA_STATUS_MAP: Dict[str, MediaStatus] = {s.value: s for s in MediaStatus}
+
+
+
+def _fts_match_expression(query: str) -> str:
+    """Build an FTS5 MATCH expression requiring every word as a prefix."""
+    words = re.findall(r"\w+", query)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def _parse_duration(value: Optional[str]) -> int:
+    """Parse an itunes:duration value ("SS", "MM:SS" or "HH:MM:SS")."""
+    if not value:
+        return 0
+    seconds = 0
+    try:
+        for part in value.strip().split(":"):
+            seconds = seconds * 60 + int(float(part))
+    except ValueError:
+        return 0
+    return seconds
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def _fetch_feed_episodes(feed_url: str) -> List[Dict[str, Any]]:
+    """
+    Download and parse an RSS feed.
+
+    Returns:
+        One dict per ``<item>`` with ``add_media_item`` keyword arguments,
+        minus ``parent_id``
+    """
+    response = requests.get(feed_url, timeout=FEED_TIMEOUT)
+    response.raise_for_status()
+    root = ET.fromstring(response.content)
+
+    episodes = []
+    for item in root.iter("item"):
+        enclosure = item.find("enclosure")
+        published = item.findtext("pubDate")
+        try:
+            published_date = (
+                email.utils.parsedate_to_datetime(published).timestamp()
+                if published else None
+            )
+        except (TypeError, ValueError):
+            published_date = None
+
+        episodes.append({
+            "title": (item.findtext("title") or "").strip(),
+            "description": (item.findtext("description") or "").strip(),
+            "duration_seconds": _parse_duration(item.findtext(_ITUNES_NS + "duration")),
+            "media_url": enclosure.get("url") if enclosure is not None else None,
+            "published_date": published_date,
+            "episode_number": _parse_int(item.findtext(_ITUNES_NS + "episode")),
+            "season_number": _parse_int(item.findtext(_ITUNES_NS + "season")),
+        })
+    return episodes
+
+
+@dataclass(**DATACLASS_SLOTS)
 class MediaItem:
     """Represents a media item (episode, chapter, track)."""
     id: str
@@ -108,7 +271,7 @@ class MediaItem:
             return f"{secs}s"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MediaCollection:
     """Represents a media collection (podcast, audiobook series, playlist)."""
     id: str
@@ -155,6 +318,34 @@ class MediaLibraryManager:
         self.db_path = db_path
         self._ensure_db()
 
+        # One long-lived connection keeps SQLite's page cache warm across
+        # calls; the lock serializes access from multiple threads.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._configure_connection()
+
+    def _configure_connection(self):
+        """Apply performance PRAGMAs to the shared connection."""
+        cursor = self._conn.cursor()
+        # WAL does not apply to in-memory databases
+        if self.db_path != ":memory:":
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA mmap_size=268435456")
+
+    def close(self):
+        """Close the shared database connection."""
+        with self._lock:
+            self._conn.close()
+
     def _ensure_db(self):
         """Ensure database and tables exist."""
         os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
@@ -162,9 +353,18 @@ class MediaLibraryManager:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
+        cursor.execute("PRAGMA table_info(collections)")
+        columns = {row[1] for row in cursor.fetchall()}
+        legacy = bool(columns) and "uuid" not in columns
+        if legacy:
+            self._rename_legacy_tables(cursor)
+
+        # Integer primary keys keep B-tree entries and foreign keys at 8 bytes;
+        # the UUIDs exposed to callers live in a unique secondary column.
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS collections (
-                id TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                uuid TEXT NOT NULL UNIQUE,
                 title TEXT NOT NULL,
                 description TEXT,
                 media_type TEXT,
@@ -173,7 +373,6 @@ class MediaLibraryManager:
                 image_url TEXT,
                 subscribed INTEGER,
                 auto_download INTEGER,
-                tags TEXT,
                 created_at REAL,
                 updated_at REAL,
                 last_checked REAL
@@ -182,8 +381,9 @@ class MediaLibraryManager:
 
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS media_items (
-                id TEXT PRIMARY KEY,
-                parent_id TEXT,
+                id INTEGER PRIMARY KEY,
+                uuid TEXT NOT NULL UNIQUE,
+                parent_id INTEGER NOT NULL,
                 title TEXT NOT NULL,
                 description TEXT,
                 duration_seconds INTEGER,
@@ -202,16 +402,276 @@ class MediaLibraryManager:
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS playback_history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                media_item_id TEXT,
+                media_item_id INTEGER,
                 played_at REAL,
                 duration_seconds INTEGER,
                 FOREIGN KEY (media_item_id) REFERENCES media_items (id)
             )
         """)
 
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS collection_tags (
+                collection_id INTEGER,
+                tag TEXT,
+                PRIMARY KEY (collection_id, tag),
+                FOREIGN KEY (collection_id) REFERENCES collections (id)
+            )
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_collection_tags_tag ON collection_tags (tag)"
+        )
+
+        if legacy:
+            self._migrate_legacy_tables(cursor)
+
+        self._ensure_indexes(cursor)
+
+        try:
+            self._ensure_fts(cursor)
+            self._fts_enabled = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5; search_media falls back to LIKE
+            self._fts_enabled = False
+
         conn.commit()
         conn.close()
 
+    def _rename_legacy_tables(self, cursor: sqlite3.Cursor):
+        """Move tables keyed by TEXT UUIDs aside so the new schema can be created."""
+        cursor.execute("""
+            SELECT type, name FROM sqlite_master
+            WHERE (type = 'trigger' AND name LIKE '%fts_a_')
+               OR (type = 'index' AND name LIKE 'idx_%')
+        """)
+        for kind, name in cursor.fetchall():
+            cursor.execute(f"DROP {kind.upper()} IF EXISTS {name}")
+        for table in ("media_fts", "collections_fts", "media_items_fts"):
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+        for table in ("collections", "media_items", "playback_history", "collection_tags"):
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            )
+            if cursor.fetchone():
+                cursor.execute(f"ALTER TABLE {table} RENAME TO legacy_{table}")
+
+    def _migrate_legacy_tables(self, cursor: sqlite3.Cursor):
+        """Copy rows from the TEXT-keyed tables into the integer-keyed schema."""
+        cursor.execute("""
+            INSERT INTO collections (
+                uuid, title, description, media_type, author, feed_url, image_url,
+                subscribed, auto_download, created_at, updated_at, last_checked
+            )
+            SELECT id, title, description, media_type, author, feed_url, image_url,
+                   subscribed, auto_download, created_at, updated_at, last_checked
+            FROM legacy_collections
+        """)
+
+        # The legacy schema never checked parent_id, so items may point at a
+        # collection that does not exist. Give each such parent a placeholder
+        # collection under the same ID rather than dropping the items and
+        # their playback history.
+        cursor.execute("""
+            SELECT DISTINCT m.parent_id FROM legacy_media_items m
+            LEFT JOIN collections c ON c.uuid = m.parent_id
+            WHERE c.id IS NULL
+        """)
+        orphan_parents = [row[0] for row in cursor.fetchall()]
+        if orphan_parents:
+            if None in orphan_parents:
+                recovered_id = str(uuid.uuid4())
+                cursor.execute(
+                    "UPDATE legacy_media_items SET parent_id = ? WHERE parent_id IS NULL",
+                    (recovered_id,),
+                )
+                orphan_parents = [
+                    recovered_id if parent is None else parent for parent in orphan_parents
+                ]
+            now = time.time()
+            cursor.executemany(
+                """
+                INSERT INTO collections (
+                    uuid, title, description, media_type, subscribed, auto_download,
+                    created_at, updated_at
+                )
+                VALUES (?, 'Recovered items', ?, ?, 0, 0, ?, ?)
+                """,
+                [
+                    (
+                        parent,
+                        f"Items whose collection {parent} was missing when the library was upgraded",
+                        MediaType.OTHER.value, now, now,
+                    )
+                    for parent in orphan_parents
+                ],
+            )
+            logger.warning(
+                "Moved media items with %d missing parent collection(s) into placeholder collections",
+                len(orphan_parents),
+            )
+
+        cursor.execute("""
+            INSERT INTO media_items (
+                uuid, parent_id, title, description, duration_seconds, media_url,
+                published_date, episode_number, season_number, progress_seconds,
+                status, created_at, last_played
+            )
+            SELECT m.id, c.id, m.title, m.description, m.duration_seconds, m.media_url,
+                   m.published_date, m.episode_number, m.season_number,
+                   m.progress_seconds, m.status, m.created_at, m.last_played
+            FROM legacy_media_items m
+            JOIN collections c ON c.uuid = m.parent_id
+        """)
+
+        cursor.execute("""
+            INSERT INTO playback_history (media_item_id, played_at, duration_seconds)
+            SELECT i.id, h.played_at, h.duration_seconds
+            FROM legacy_playback_history h
+            JOIN media_items i ON i.uuid = h.media_item_id
+            ORDER BY h.id
+        """)
+
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'legacy_collection_tags'"
+        )
+        if cursor.fetchone():
+            cursor.execute("""
+                INSERT OR IGNORE INTO collection_tags (collection_id, tag)
+                SELECT c.id, t.tag
+                FROM legacy_collection_tags t
+                JOIN collections c ON c.uuid = t.collection_id
+                ORDER BY t.rowid
+            """)
+            cursor.execute("DROP TABLE legacy_collection_tags")
+        else:
+            # Tags were stored as JSON on the collection row
+            cursor.execute("""
+                SELECT c.id, l.tags FROM legacy_collections l
+                JOIN collections c ON c.uuid = l.id
+                WHERE l.tags IS NOT NULL
+            """)
+            cursor.executemany(
+                "INSERT OR IGNORE INTO collection_tags (collection_id, tag) VALUES (?, ?)",
+                [
+                    (collection_id, tag)
+                    for collection_id, tags in cursor.fetchall()
+                    for tag in json.loads(tags)
+                ],
+            )
+
+        cursor.execute("DROP TABLE legacy_playback_history")
+        cursor.execute("DROP TABLE legacy_media_items")
+        cursor.execute("DROP TABLE legacy_collections")
+
+    def _ensure_indexes(self, cursor: sqlite3.Cursor):
+        """Create indexes matching the filter/sort order of the hot queries."""
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_items_parent'"
+        )
+        exists = cursor.fetchone() is not None
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_items_parent
+            ON media_items (parent_id, episode_number DESC, published_date DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_items_status
+            ON media_items (status, last_played DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_items_last_played
+            ON media_items (last_played DESC) WHERE last_played IS NOT NULL
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_collections_sub_type
+            ON collections (subscribed, media_type, title)
+        """)
+
+        if not exists:
+            # Give the planner statistics for the new indexes
+            cursor.execute("ANALYZE")
+
+    def _ensure_fts(self, cursor: sqlite3.Cursor):
+        """Create the FTS5 search indexes and the triggers that keep them in sync."""
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'media_fts'"
+        )
+        if cursor.fetchone():
+            # Replace the shared media_fts table, whose triggers had to scan
+            # it by an UNINDEXED (kind, rowid_ref) pair
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%fts_a_'"
+            )
+            for (name,) in cursor.fetchall():
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute("DROP TABLE media_fts")
+
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'media_items_fts'"
+        )
+        exists = cursor.fetchone() is not None
+
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS collections_fts USING fts5(
+                title,
+                description,
+                author,
+                tokenize = 'unicode61 remove_diacritics 2'
+            )
+        """)
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS media_items_fts USING fts5(
+                title,
+                description,
+                tokenize = 'unicode61 remove_diacritics 2'
+            )
+        """)
+
+        cursor.executescript("""
+            CREATE TRIGGER IF NOT EXISTS collections_fts_ai AFTER INSERT ON collections BEGIN
+                INSERT INTO collections_fts (rowid, title, description, author)
+                VALUES (new.id, new.title, new.description, new.author);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS collections_fts_au
+            AFTER UPDATE OF title, description, author ON collections BEGIN
+                DELETE FROM collections_fts WHERE rowid = old.id;
+                INSERT INTO collections_fts (rowid, title, description, author)
+                VALUES (new.id, new.title, new.description, new.author);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS collections_fts_ad AFTER DELETE ON collections BEGIN
+                DELETE FROM collections_fts WHERE rowid = old.id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS media_items_fts_ai AFTER INSERT ON media_items BEGIN
+                INSERT INTO media_items_fts (rowid, title, description)
+                VALUES (new.id, new.title, new.description);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS media_items_fts_au
+            AFTER UPDATE OF title, description ON media_items BEGIN
+                DELETE FROM media_items_fts WHERE rowid = old.id;
+                INSERT INTO media_items_fts (rowid, title, description)
+                VALUES (new.id, new.title, new.description);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS media_items_fts_ad AFTER DELETE ON media_items BEGIN
+                DELETE FROM media_items_fts WHERE rowid = old.id;
+            END;
+        """)
+
+        if not exists:
+            # Index rows written before the FTS tables existed
+            cursor.execute("""
+                INSERT INTO collections_fts (rowid, title, description, author)
+                SELECT id, title, description, author FROM collections
+            """)
+            cursor.execute("""
+                INSERT INTO media_items_fts (rowid, title, description)
+                SELECT id, title, description FROM media_items
+            """)
+
     def create_collection(
         self,
         title: str,
@@ -234,21 +694,20 @@ class MediaLibraryManager:
             tags=tags or [],
         )
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO collections VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            collection.id, collection.title, collection.description,
-            collection.media_type.value, collection.author, collection.feed_url,
-            collection.image_url, 1 if collection.subscribed else 0,
-            1 if collection.auto_download else 0, json.dumps(collection.tags),
-            collection.created_at, collection.updated_at, collection.last_checked
-        ))
-
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            cursor = self._conn.execute(_SQL_INSERT_COLLECTION, (
+                collection.id, collection.title, collection.description,
+                collection.media_type.value, collection.author, collection.feed_url,
+                collection.image_url, 1 if collection.subscribed else 0,
+                1 if collection.auto_download else 0,
+                collection.created_at, collection.updated_at, collection.last_checked
+            ))
+            rowid = cursor.lastrowid
+            self._conn.executemany(
+                _SQL_INSERT_COLLECTION_TAG,
+                [(rowid, tag) for tag in collection.tags],
+            )
 
         return collection
 
@@ -262,50 +721,125 @@ class MediaLibraryManager:
         episode_number: Optional[int] = None,
         season_number: Optional[int] = None,
         published_date: Optional[float] = None,
-    ) -> MediaItem:
-        """Add a media item to a collection."""
-        item = MediaItem(
-            id=str(uuid.uuid4()),
-            parent_id=parent_id,
-            title=title,
-            description=description,
-            duration_seconds=duration_seconds,
-            media_url=media_url,
-            episode_number=episode_number,
-            season_number=season_number,
-            published_date=published_date,
-        )
-
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO media_items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            item.id, item.parent_id, item.title, item.description,
-            item.duration_seconds, item.media_url, item.published_date,
-            item.episode_number, item.season_number, item.progress_seconds,
-            item.status.value, item.created_at, item.last_played
-        ))
-
-        conn.commit()
-        conn.close()
+    ) -> Optional[MediaItem]:
+        """Add a media item to a collection. Returns None if the collection does not exist."""
+        items = self.add_media_items([{
+            "parent_id": parent_id,
+            "title": title,
+            "description": description,
+            "duration_seconds": duration_seconds,
+            "media_url": media_url,
+            "episode_number": episode_number,
+            "season_number": season_number,
+            "published_date": published_date,
+        }])
+        return items[0] if items else None
+
+    def add_media_items(self, items: List[Dict[str, Any]]) -> List[MediaItem]:
+        """
+        Add several media items in one transaction.
+
+        Args:
+            items: Dicts of ``add_media_item`` keyword arguments
+
+        Returns:
+            The created MediaItem objects, in input order. Items whose
+            ``parent_id`` names no existing collection are skipped.
+        """
+        media_items = [
+            MediaItem(id=str(uuid.uuid4()), **fields) for fields in items
+        ]
+
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            parents = list({item.parent_id for item in media_items})
+            placeholders = ", ".join("?" * len(parents))
+            known = {
+                row[0] for row in self._conn.execute(
+                    f"SELECT uuid FROM collections WHERE uuid IN ({placeholders})", parents
+                )
+            }
+            media_items = [item for item in media_items if item.parent_id in known]
+            self._conn.executemany(_SQL_INSERT_MEDIA_ITEM, self._media_item_rows(media_items))
+
+        return media_items
 
-        return item
+    @staticmethod
+    def _media_item_rows(media_items: List[MediaItem]) -> List[Tuple]:
+        return [
+            (
+                item.id, item.parent_id, item.title, item.description,
+                item.duration_seconds, item.media_url, item.published_date,
+                item.episode_number, item.season_number, item.progress_seconds,
+                item.status.value, item.created_at, item.last_played
+            )
+            for item in media_items
+        ]
+
+    def refresh_subscriptions(self, max_workers: int = FEED_WORKERS) -> Dict[str, Any]:
+        """
+        Fetch every subscribed feed and store episodes not seen before.
+
+        Feeds are downloaded concurrently; results are written from the
+        calling thread only, one transaction per feed, so the network wait
+        never holds the database lock.
+
+        Returns:
+            Counts of feeds checked and episodes added, plus per-feed errors
+        """
+        with self._lock:
+            feeds = self._conn.execute(_SQL_SUBSCRIBED_FEEDS).fetchall()
+
+        result: Dict[str, Any] = {"feeds_checked": 0, "new_items": 0, "errors": {}}
+        if not feeds:
+            return result
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(feeds))) as executor:
+            futures = {
+                executor.submit(_fetch_feed_episodes, feed["feed_url"]): feed
+                for feed in feeds
+            }
+            for future in as_completed(futures):
+                feed = futures[future]
+                try:
+                    episodes = future.result()
+                except Exception as e:
+                    result["errors"][feed["uuid"]] = str(e)
+                    continue
+                result["feeds_checked"] += 1
+                result["new_items"] += self._store_feed_episodes(feed, episodes)
+
+        return result
+
+    def _store_feed_episodes(self, feed: sqlite3.Row, episodes: List[Dict[str, Any]]) -> int:
+        """Insert unseen episodes and stamp ``last_checked`` in one transaction."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            known = {
+                row[0] for row in self._conn.execute(_SQL_KNOWN_MEDIA_URLS, (feed["id"],))
+            }
+            new_items = []
+            for episode in episodes:
+                url = episode["media_url"]
+                if not url or url in known:
+                    continue
+                known.add(url)
+                new_items.append(MediaItem(id=str(uuid.uuid4()), parent_id=feed["uuid"], **episode))
+            self._conn.executemany(_SQL_INSERT_MEDIA_ITEM, self._media_item_rows(new_items))
+            self._conn.execute(_SQL_MARK_CHECKED, (now, feed["id"]))
+        return len(new_items)
 
     def get_collection(self, collection_id: str) -> Optional[MediaCollection]:
         """Get a collection by ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM collections WHERE id = ?", (collection_id,))
-        row = cursor.fetchone()
-        conn.close()
-
-        if not row:
-            return None
+        with self._lock:
+            cursor = self._conn.execute(_SQL_GET_COLLECTION, (collection_id,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            tags = self._load_tags([row["id"]])
 
-        return self._row_to_collection(row)
+        return self._row_to_collection(row, tags.get(row["id"], []))
 
     def list_collections(
         self,
@@ -313,9 +847,6 @@ class MediaLibraryManager:
         subscribed_only: bool = False
     ) -> List[MediaCollection]:
         """List all collections."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         query = "SELECT * FROM collections WHERE 1=1"
         params = []
 
@@ -328,11 +859,11 @@ class MediaLibraryManager:
 
         query += " ORDER BY title"
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+            tags = self._load_tags([row["id"] for row in rows])
 
-        return [self._row_to_collection(row) for row in rows]
+        return [self._row_to_collection(row, tags.get(row["id"], [])) for row in rows]
 
     def get_media_items(
         self,
@@ -340,23 +871,17 @@ class MediaLibraryManager:
         status: Optional[MediaStatus] = None
     ) -> List[MediaItem]:
         """Get media items from a collection."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        query = "SELECT * FROM media_items WHERE parent_id = ?"
+        query = _SQL_SELECT_ITEMS + " WHERE c.uuid = ?"
         params = [parent_id]
 
         if status:
-            query += " AND status = ?"
+            query += " AND m.status = ?"
             params.append(status.value)
 
-        query += " ORDER BY episode_number DESC, published_date DESC"
+        query += " ORDER BY m.episode_number DESC, m.published_date DESC"
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [self._row_to_media_item(row) for row in rows]
+        with self._lock:
+            return list(map(self._row_to_media_item, self._conn.execute(query, params)))
 
     def update_progress(
         self,
@@ -365,131 +890,183 @@ class MediaLibraryManager:
         mark_complete: bool = False
     ) -> bool:
         """Update playback progress for a media item."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         status = MediaStatus.COMPLETED.value if mark_complete else MediaStatus.IN_PROGRESS.value
 
-        cursor.execute("""
-            UPDATE media_items SET
-                progress_seconds = ?,
-                status = ?,
-                last_played = ?
-            WHERE id = ?
-        """, (progress_seconds, status, time.time(), media_item_id))
+        now = time.time()
 
-        success = cursor.rowcount > 0
+        # Update and history insert share one transaction; the connection
+        # context manager commits, or rolls back on error.
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN")
 
-        # Log playback
-        if success:
-            cursor.execute("""
-                INSERT INTO playback_history (media_item_id, played_at, duration_seconds)
-                VALUES (?, ?, ?)
-            """, (media_item_id, time.time(), progress_seconds))
+            cursor.execute(
+                _SQL_UPDATE_PROGRESS, (progress_seconds, status, now, media_item_id)
+            )
 
-        conn.commit()
-        conn.close()
+            success = cursor.rowcount > 0
+
+            # Log playback
+            if success:
+                cursor.execute(
+                    _SQL_INSERT_PLAYBACK, (now, progress_seconds, media_item_id)
+                )
 
         return success
 
-    def search_media(self, query: str) -> Dict[str, List]:
-        """Search for media items and collections."""
-        query_lower = query.lower()
+    def search_media(self, query: str, limit: int = 50, offset: int = 0) -> Dict[str, List]:
+        """
+        Search for media items and collections.
+
+        ``limit`` and ``offset`` page the collections and the items
+        independently.
+        """
+        match = _fts_match_expression(query)
+        if not self._fts_enabled or not match:
+            return self._search_media_like(query, limit, offset)
+
+        with self._lock:
+            collection_ids = [
+                row[0] for row in self._conn.execute(
+                    _SQL_SEARCH_COLLECTIONS_FTS, (match, limit, offset)
+                )
+            ]
+            item_ids = [
+                row[0] for row in self._conn.execute(
+                    _SQL_SEARCH_ITEMS_FTS, (match, limit, offset)
+                )
+            ]
+
+            collection_rows = self._fetch_rows_by_id(
+                "SELECT * FROM collections WHERE id IN ({})", collection_ids
+            )
+            item_rows = self._fetch_rows_by_id(
+                _SQL_SELECT_ITEMS + " WHERE m.id IN ({})", item_ids
+            )
+            tags = self._load_tags(collection_ids)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return {
+            "collections": [
+                self._row_to_collection(row, tags.get(row["id"], []))
+                for row in collection_rows
+            ],
+            "items": [self._row_to_media_item(row) for row in item_rows],
+        }
 
-        # Search collections
-        cursor.execute("""
-            SELECT * FROM collections
-            WHERE LOWER(title) LIKE ? OR LOWER(description) LIKE ? OR LOWER(author) LIKE ?
-            ORDER BY title
-        """, (f"%{query_lower}%", f"%{query_lower}%", f"%{query_lower}%"))
+    def _load_tags(self, collection_ids: List[int]) -> Dict[int, List[str]]:
+        """Fetch tags for several collections in one query (caller holds the lock)."""
+        if not collection_ids:
+            return {}
 
-        collection_rows = cursor.fetchall()
+        placeholders = ", ".join("?" * len(collection_ids))
+        rows = self._conn.execute(
+            f"SELECT collection_id, tag FROM collection_tags "
+            f"WHERE collection_id IN ({placeholders}) ORDER BY rowid",
+            collection_ids,
+        ).fetchall()
 
-        # Search media items
-        cursor.execute("""
-            SELECT * FROM media_items
-            WHERE LOWER(title) LIKE ? OR LOWER(description) LIKE ?
-            ORDER BY published_date DESC
-        """, (f"%{query_lower}%", f"%{query_lower}%"))
+        tags: Dict[int, List[str]] = {}
+        for collection_id, tag in rows:
+            tags.setdefault(collection_id, []).append(tag)
+        return tags
 
-        item_rows = cursor.fetchall()
-        conn.close()
+    def _fetch_rows_by_id(self, query: str, ids: List[int]) -> List[sqlite3.Row]:
+        """Run an ``IN ({})`` query over row ids, preserving the order of ``ids``."""
+        if not ids:
+            return []
 
-        return {
-            "collections": [self._row_to_collection(row) for row in collection_rows],
-            "items": [self._row_to_media_item(row) for row in item_rows],
-        }
+        placeholders = ", ".join("?" * len(ids))
+        rows = self._conn.execute(query.format(placeholders), ids).fetchall()
 
-    def get_recently_played(self, limit: int = 10) -> List[MediaItem]:
-        """Get recently played media items."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        by_id = {row["id"]: row for row in rows}
+        return [by_id[row_id] for row_id in ids if row_id in by_id]
 
-        cursor.execute("""
-            SELECT * FROM media_items
-            WHERE last_played IS NOT NULL
-            ORDER BY last_played DESC
-            LIMIT ?
-        """, (limit,))
+    def _search_media_like(self, query: str, limit: int, offset: int) -> Dict[str, List]:
+        """Substring search used when FTS5 is unavailable."""
+        # LIKE already folds ASCII case, so the columns are compared as
+        # stored rather than through a per-row LOWER()
+        pattern = f"%{query}%"
 
-        rows = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        return [self._row_to_media_item(row) for row in rows]
+            # Search collections
+            cursor.execute("""
+                SELECT * FROM collections
+                WHERE title LIKE ?1 OR description LIKE ?1 OR author LIKE ?1
+                ORDER BY title
+                LIMIT ?2 OFFSET ?3
+            """, (pattern, limit, offset))
 
-    def get_in_progress(self) -> List[MediaItem]:
-        """Get media items currently in progress."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+            collection_rows = cursor.fetchall()
+            tags = self._load_tags([row["id"] for row in collection_rows])
 
-        cursor.execute("""
-            SELECT * FROM media_items
-            WHERE status = ?
-            ORDER BY last_played DESC
-        """, (MediaStatus.IN_PROGRESS.value,))
+            # Search media items
+            cursor.execute(_SQL_SELECT_ITEMS + """
+                WHERE m.title LIKE ?1 OR m.description LIKE ?1
+                ORDER BY m.published_date DESC
+                LIMIT ?2 OFFSET ?3
+            """, (pattern, limit, offset))
 
-        rows = cursor.fetchall()
-        conn.close()
+            items = list(map(self._row_to_media_item, cursor))
 
-        return [self._row_to_media_item(row) for row in rows]
+        return {
+            "collections": [
+                self._row_to_collection(row, tags.get(row["id"], []))
+                for row in collection_rows
+            ],
+            "items": items,
+        }
 
-    def _row_to_collection(self, row: tuple) -> MediaCollection:
+    def get_recently_played(self, limit: int = 10) -> List[MediaItem]:
+        """Get recently played media items."""
+        with self._lock:
+            return list(map(
+                self._row_to_media_item, self._conn.execute(_SQL_RECENTLY_PLAYED, (limit,))
+            ))
+
+    def get_in_progress(self) -> List[MediaItem]:
+        """Get media items currently in progress."""
+        with self._lock:
+            return list(map(
+                self._row_to_media_item,
+                self._conn.execute(_SQL_IN_PROGRESS, (MediaStatus.IN_PROGRESS.value,)),
+            ))
+
+    def _row_to_collection(self, row: sqlite3.Row, tags: List[str]) -> MediaCollection:
         """Convert database row to MediaCollection."""
         return MediaCollection(
-            id=row[0],
-            title=row[1],
-            description=row[2] or "",
-            media_type=MediaType(row[3]),
-            author=row[4],
-            feed_url=row[5],
-            image_url=row[6],
-            subscribed=bool(row[7]),
-            auto_download=bool(row[8]),
-            tags=json.loads(row[9]) if row[9] else [],
-            created_at=row[10],
-            updated_at=row[11],
-            last_checked=row[12],
+            id=row["uuid"],
+            title=row["title"],
+            description=row["description"] or "",
+            media_type=_MEDIA_TYPE_MAP[row["media_type"]],
+            author=row["author"],
+            feed_url=row["feed_url"],
+            image_url=row["image_url"],
+            subscribed=bool(row["subscribed"]),
+            auto_download=bool(row["auto_download"]),
+            tags=tags,
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            last_checked=row["last_checked"],
         )
 
-    def _row_to_media_item(self, row: tuple) -> MediaItem:
+    def _row_to_media_item(self, row: sqlite3.Row) -> MediaItem:
         """Convert database row to MediaItem."""
         return MediaItem(
-            id=row[0],
-            parent_id=row[1],
-            title=row[2],
-            description=row[3] or "",
-            duration_seconds=row[4],
-            media_url=row[5],
-            published_date=row[6],
-            episode_number=row[7],
-            season_number=row[8],
-            progress_seconds=row[9],
-            status=MediaStatus(row[10]),
-            created_at=row[11],
-            last_played=row[12],
+            id=row["uuid"],
+            parent_id=row["parent_uuid"],
+            title=row["title"],
+            description=row["description"] or "",
+            duration_seconds=row["duration_seconds"],
+            media_url=row["media_url"],
+            published_date=row["published_date"],
+            episode_number=row["episode_number"],
+            season_number=row["season_number"],
+            progress_seconds=row["progress_seconds"],
+            status=_MEDIA_STATUS_MAP[row["status"]],
+            created_at=row["created_at"],
+            last_played=row["last_played"],
         )
 
 
@@ -512,12 +1089,31 @@ def get_media_library_manager() -> MediaLibraryManager:
 # COMMAND FUNCTIONS
 # ================================================================================
 
+def json_cmd(error_prefix: str) -> Callable[[Callable[..., Dict[str, Any]]], Callable[..., str]]:
+    """
+    Turn a handler returning a result dict into a JSON command function.
+
+    Exceptions raised by the handler become ``{"success": False, "error": ...}``
+    with ``error_prefix`` prepended to the message.
+    """
+    def decorator(func: Callable[..., Dict[str, Any]]) -> Callable[..., str]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> str:
+            try:
+                return _dumps(func(*args, **kwargs))
+            except Exception as e:
+                return _dumps({"success": False, "error": f"{error_prefix}: {str(e)}"})
+        return wrapper
+    return decorator
+
+
+@json_cmd("Failed to subscribe")
 def subscribe_podcast_cmd(
     title: str,
     feed_url: str,
     description: str = "",
     author: Optional[str] = None,
-) -> str:
+) -> Dict[str, Any]:
     """
     Subscribe to a podcast.
 
@@ -530,31 +1126,25 @@ def subscribe_podcast_cmd(
     Returns:
         JSON result
     """
-    try:
-        manager = get_media_library_manager()
-
-        collection = manager.create_collection(
-            title=title,
-            description=description,
-            media_type=MediaType.PODCAST,
-            author=author,
-            feed_url=feed_url,
-        )
-
-        return json.dumps({
-            "success": True,
-            "collection_id": collection.id,
-            "title": collection.title,
-        })
-
-    except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": f"Failed to subscribe: {str(e)}"
-        })
+    manager = get_media_library_manager()
+
+    collection = manager.create_collection(
+        title=title,
+        description=description,
+        media_type=MediaType.PODCAST,
+        author=author,
+        feed_url=feed_url,
+    )
+
+    return {
+        "success": True,
+        "collection_id": collection.id,
+        "title": collection.title,
+    }
 
 
-def list_subscriptions_cmd(media_type: Optional[str] = None) -> str:
+@json_cmd("Failed to list subscriptions")
+def list_subscriptions_cmd(media_type: Optional[str] = None) -> Dict[str, Any]:
     """
     List all subscriptions.
 
@@ -564,36 +1154,25 @@ def list_subscriptions_cmd(media_type: Optional[str] = None) -> str:
     Returns:
         JSON result with subscriptions
     """
-    try:
-        manager = get_media_library_manager()
-
-        # Parse media type
-        type_filter = None
-        if media_type:
-            try:
-                type_filter = MediaType(media_type.lower())
-            except ValueError:
-                pass
+    manager = get_media_library_manager()
 
-        collections = manager.list_collections(
-            media_type=type_filter,
-            subscribed_only=True
-        )
+    # Parse media type
+    type_filter = _MEDIA_TYPE_MAP.get(media_type.lower()) if media_type else None
 
-        return json.dumps({
-            "success": True,
-            "count": len(collections),
-            "collections": [c.to_dict() for c in collections]
-        })
+    collections = manager.list_collections(
+        media_type=type_filter,
+        subscribed_only=True
+    )
 
-    except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": f"Failed to list subscriptions: {str(e)}"
-        })
+    return {
+        "success": True,
+        "count": len(collections),
+        "collections": collections
+    }
 
 
-def list_episodes_cmd(collection_id: str, unplayed_only: bool = False) -> str:
+@json_cmd("Failed to list episodes")
+def list_episodes_cmd(collection_id: str, unplayed_only: bool = False) -> Dict[str, Any]:
     """
     List episodes from a collection.
 
@@ -604,30 +1183,24 @@ def list_episodes_cmd(collection_id: str, unplayed_only: bool = False) -> str:
     Returns:
         JSON result with episodes
     """
-    try:
-        manager = get_media_library_manager()
+    manager = get_media_library_manager()
 
-        status_filter = MediaStatus.NEW if unplayed_only else None
-        items = manager.get_media_items(collection_id, status_filter)
+    status_filter = MediaStatus.NEW if unplayed_only else None
+    items = manager.get_media_items(collection_id, status_filter)
 
-        return json.dumps({
-            "success": True,
-            "count": len(items),
-            "items": [item.to_dict() for item in items]
-        })
-
-    except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": f"Failed to list episodes: {str(e)}"
-        })
+    return {
+        "success": True,
+        "count": len(items),
+        "items": items
+    }
 
 
+@json_cmd("Failed to update progress")
 def update_progress_cmd(
     media_item_id: str,
     progress_seconds: int,
     mark_complete: bool = False
-) -> str:
+) -> Dict[str, Any]:
     """
     Update playback progress.
 
@@ -639,52 +1212,42 @@ def update_progress_cmd(
     Returns:
         JSON result
     """
-    try:
-        manager = get_media_library_manager()
-        success = manager.update_progress(media_item_id, progress_seconds, mark_complete)
-
-        return json.dumps({
-            "success": success,
-            "message": "Progress updated" if success else "Item not found"
-        })
+    manager = get_media_library_manager()
+    success = manager.update_progress(media_item_id, progress_seconds, mark_complete)
 
-    except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": f"Failed to update progress: {str(e)}"
-        })
+    return {
+        "success": success,
+        "message": "Progress updated" if success else "Item not found"
+    }
 
 
-def search_media_cmd(query: str) -> str:
+@json_cmd("Failed to search")
+def search_media_cmd(query: str, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
     """
     Search media library.
 
     Args:
         query: Search query
+        limit: Maximum collections and items to return (each)
+        offset: Number of matches to skip (each)
 
     Returns:
         JSON result with search results
     """
-    try:
-        manager = get_media_library_manager()
-        results = manager.search_media(query)
-
-        return json.dumps({
-            "success": True,
-            "collections_found": len(results["collections"]),
-            "items_found": len(results["items"]),
-            "collections": [c.to_dict() for c in results["collections"]],
-            "items": [item.to_dict() for item in results["items"]],
-        })
-
-    except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": f"Failed to search: {str(e)}"
-        })
+    manager = get_media_library_manager()
+    results = manager.search_media(query, limit, offset)
+
+    return {
+        "success": True,
+        "collections_found": len(results["collections"]),
+        "items_found": len(results["items"]),
+        "collections": results["collections"],
+        "items": results["items"],
+    }
 
 
-def get_recently_played_cmd(limit: int = 10) -> str:
+@json_cmd("Failed to get recently played")
+def get_recently_played_cmd(limit: int = 10) -> Dict[str, Any]:
     """
     Get recently played items.
 
@@ -694,40 +1257,48 @@ def get_recently_played_cmd(limit: int = 10) -> str:
     Returns:
         JSON result
     """
-    try:
-        manager = get_media_library_manager()
-        items = manager.get_recently_played(limit)
-
-        return json.dumps({
-            "success": True,
-            "count": len(items),
-            "items": [item.to_dict() for item in items]
-        })
+    manager = get_media_library_manager()
+    items = manager.get_recently_played(limit)
 
-    except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": f"Failed to get recently played: {str(e)}"
-        })
+    return {
+        "success": True,
+        "count": len(items),
+        "items": items
+    }
 
 
-def get_in_progress_cmd() -> str:
+@json_cmd("Failed to get in progress items")
+def get_in_progress_cmd() -> Dict[str, Any]:
     """Get items currently in progress."""
-    try:
-        manager = get_media_library_manager()
-        items = manager.get_in_progress()
+    manager = get_media_library_manager()
+    items = manager.get_in_progress()
 
-        return json.dumps({
-            "success": True,
-            "count": len(items),
-            "items": [item.to_dict() for item in items]
-        })
+    return {
+        "success": True,
+        "count": len(items),
+        "items": items
+    }
+
+
+@json_cmd("Failed to refresh subscriptions")
+def refresh_subscriptions_cmd() -> Dict[str, Any]:
+    """Fetch new episodes for every subscribed feed."""
+    manager = get_media_library_manager()
+    result = manager.refresh_subscriptions()
+
+    return {"success": True, **result}
 
-    except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": f"Failed to get in progress items: {str(e)}"
-        })
+
+_COMMANDS: Dict[str, Callable[..., str]] = {
+    "subscribe": subscribe_podcast_cmd,
+    "refresh": refresh_subscriptions_cmd,
+    "list": list_subscriptions_cmd,
+    "episodes": list_episodes_cmd,
+    "progress": update_progress_cmd,
+    "search": search_media_cmd,
+    "recent": get_recently_played_cmd,
+    "in_progress": get_in_progress_cmd,
+}
 
 
 def execute_media_library_command(command: str, **params) -> str:
@@ -741,19 +1312,9 @@ def execute_media_library_command(command: str, **params) -> str:
     Returns:
         JSON result
     """
-    commands = {
-        "subscribe": subscribe_podcast_cmd,
-        "list": list_subscriptions_cmd,
-        "episodes": list_episodes_cmd,
-        "progress": update_progress_cmd,
-        "search": search_media_cmd,
-        "recent": get_recently_played_cmd,
-        "in_progress": get_in_progress_cmd,
-    }
-
-    handler = commands.get(command)
+    handler = _COMMANDS.get(command)
     if not handler:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Unknown media library command: {command}"
         })
@@ -6,45 +6,94 @@ Music playback and control using YouTube Music.
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 import webbrowser
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+try:
+    import pyautogui
+    PYAUTOGUI_AVAILABLE = True
+except Exception:  # ImportError, or no display to attach to on headless hosts
+    PYAUTOGUI_AVAILABLE = False
+
 # Global YouTube Music browser instance
 YOUTUBE_MUSIC_BROWSER = None
 
 # Music service configuration
 MUSIC_SERVICE = "youtube_music"
 
+# Query keywords -> light mood, in priority order
+_MOOD_MAPPINGS = [
+    (['relax', 'calm', 'chill', 'ambient', 'peaceful', 'meditation', 'sleep', 'quiet'], 'relax'),
+    (['party', 'dance', 'edm', 'club', 'rave', 'celebration', 'upbeat', 'fun'], 'party'),
+    (['romantic', 'love', 'ballad', 'slow dance', 'valentine', 'intimate'], 'romance'),
+    (['energize', 'workout', 'pump up', 'hype', 'rock', 'metal', 'hard', 'intense'], 'energize'),
+    (['jazz', 'lounge', 'smooth', 'sophisticated', 'cool', 'mellow'], 'moonlight'),
+    (['tropical', 'beach', 'island', 'reggae', 'caribbean', 'summer'], 'tropical'),
+    (['blues', 'soul', 'moody', 'melancholy', 'sad'], 'ocean'),
+    (['classical', 'orchestra', 'symphony', 'piano', 'study', 'concentrate'], 'focus'),
+    (['sunset', 'golden hour', 'evening', 'dusk'], 'sunset'),
+    (['fire', 'cozy', 'warm', 'acoustic', 'folk'], 'fireplace'),
+    (['space', 'cosmic', 'stars', 'galaxy', 'electronic'], 'galaxy'),
+    (['forest', 'nature', 'green', 'earth', 'natural'], 'forest'),
+    (['arctic', 'ice', 'winter', 'frozen', 'cold'], 'arctic'),
+    (['sunrise', 'morning', 'dawn', 'wake up'], 'sunrise'),
+]
+
+_MOOD_PRIORITY = {mood: i for i, (_, mood) in enumerate(_MOOD_MAPPINGS)}
+_MOOD_BY_KEYWORD: Dict[str, str] = {}
+for _keywords, _mood in _MOOD_MAPPINGS:
+    for _keyword in _keywords:
+        _MOOD_BY_KEYWORD.setdefault(_keyword, _mood)
+del _keywords, _mood, _keyword
+
+# Zero-width lookahead so overlapping keywords (e.g. "dance" in "slow dance")
+# are all reported
+_MOOD_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in _MOOD_BY_KEYWORD) + "))"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _browser():
+    """
+    Create the YouTube Music client once.
+
+    A missing ytmusicapi is cached as None so later calls skip the import;
+    other initialization errors propagate and are retried on the next call.
+    """
+    global YOUTUBE_MUSIC_BROWSER
+    try:
+        from ytmusicapi import YTMusic
+    except ImportError:
+        print("[WARN] ytmusicapi not installed. Install with: pip install ytmusicapi")
+        return None
+
+    YOUTUBE_MUSIC_BROWSER = YTMusic()
+    print("[OK] YouTube Music initialized")
+    return YOUTUBE_MUSIC_BROWSER
+
 
 def init_youtube_music() -> bool:
     """Initialize YouTube Music API."""
-    global YOUTUBE_MUSIC_BROWSER
-    if YOUTUBE_MUSIC_BROWSER is None:
-        try:
-            from ytmusicapi import YTMusic
-            YOUTUBE_MUSIC_BROWSER = YTMusic()
-            print("[OK] YouTube Music initialized")
-            return True
-        except ImportError:
-            print("[WARN] ytmusicapi not installed. Install with: pip install ytmusicapi")
-            return False
-        except Exception as e:
-            print(f"[WARN] Error initializing YouTube Music: {e}")
-            return False
-    return True
+    try:
+        return _browser() is not None
+    except Exception as e:
+        print(f"[WARN] Error initializing YouTube Music: {e}")
+        return False
 
 
 def search_youtube_music(query: str, limit: int = 5) -> List[Dict]:
     """Search for songs on YouTube Music."""
-    if not init_youtube_music():
-        return []
-
     try:
-        results = YOUTUBE_MUSIC_BROWSER.search(query, filter="songs", limit=limit)
-        return results
+        browser = _browser()
+        if browser is None:
+            return []
+        return browser.search(query, filter="songs", limit=limit)
     except Exception as e:
         print(f"   [ERROR] Error searching YouTube Music: {e}")
         return []
@@ -52,30 +101,12 @@ def search_youtube_music(query: str, limit: int = 5) -> List[Dict]:
 
 def get_music_mood(query: str, song_info: dict = None) -> str:
     """Determine appropriate light mood based on music query."""
-    query_lower = query.lower()
-
-    mood_mappings = [
-        (['relax', 'calm', 'chill', 'ambient', 'peaceful', 'meditation', 'sleep', 'quiet'], 'relax'),
-        (['party', 'dance', 'edm', 'club', 'rave', 'celebration', 'upbeat', 'fun'], 'party'),
-        (['romantic', 'love', 'ballad', 'slow dance', 'valentine', 'intimate'], 'romance'),
-        (['energize', 'workout', 'pump up', 'hype', 'rock', 'metal', 'hard', 'intense'], 'energize'),
-        (['jazz', 'lounge', 'smooth', 'sophisticated', 'cool', 'mellow'], 'moonlight'),
-        (['tropical', 'beach', 'island', 'reggae', 'caribbean', 'summer'], 'tropical'),
-        (['blues', 'soul', 'moody', 'melancholy', 'sad'], 'ocean'),
-        (['classical', 'orchestra', 'symphony', 'piano', 'study', 'concentrate'], 'focus'),
-        (['sunset', 'golden hour', 'evening', 'dusk'], 'sunset'),
-        (['fire', 'cozy', 'warm', 'acoustic', 'folk'], 'fireplace'),
-        (['space', 'cosmic', 'stars', 'galaxy', 'electronic'], 'galaxy'),
-        (['forest', 'nature', 'green', 'earth', 'natural'], 'forest'),
-        (['arctic', 'ice', 'winter', 'frozen', 'cold'], 'arctic'),
-        (['sunrise', 'morning', 'dawn', 'wake up'], 'sunrise'),
-    ]
-
-    for keywords, mood in mood_mappings:
-        if any(word in query_lower for word in keywords):
-            return mood
-
-    return 'party'  # Default
+    # Every keyword occurrence is found in one pass; the earliest-listed mood wins
+    moods = {_MOOD_BY_KEYWORD[m.group(1)] for m in _MOOD_KEYWORD_RE.finditer(query.lower())}
+    if not moods:
+        return 'party'  # Default
+
+    return min(moods, key=_MOOD_PRIORITY.__getitem__)
 
 
 def play_music(query: str, service: str = "youtube_music",
@@ -178,6 +209,21 @@ def search_music_info(query: str) -> str:
     return "[MUSIC] Found these songs:\n\n" + "\n".join(formatted_results)
 
 
+# Control action -> (media key, confirmation message)
+_ACTION_TABLE: Dict[str, Tuple[str, str]] = {
+    action: entry
+    for actions, entry in {
+        ('pause', 'resume', 'play_pause'): ('playpause', '🎵 Toggled play/pause'),
+        ('next',): ('nexttrack', '🎵 Skipped to next track'),
+        ('previous',): ('prevtrack', '🎵 Went to previous track'),
+        ('volume_up',): ('volumeup', '🎵 Volume increased'),
+        ('volume_down',): ('volumedown', '🎵 Volume decreased'),
+        ('mute',): ('volumemute', '🎵 Toggled mute'),
+    }.items()
+    for action in actions
+}
+
+
 def control_music(action: str) -> str:
     """
     Control music playback using SYSTEM-WIDE media keys.
@@ -188,31 +234,19 @@ def control_music(action: str) -> str:
     """
     print(f"   [MUSIC] Controlling music: {action}")
 
-    try:
-        import pyautogui
-    except ImportError:
+    if not PYAUTOGUI_AVAILABLE:
         return "Music control requires pyautogui. Install with: pip install pyautogui"
 
-    action_lower = action.lower()
+    entry = _ACTION_TABLE.get(action.lower())
+    if entry is None:
+        return f"Unknown music control action: {action}. Available: pause, resume, next, previous, volume_up, volume_down, mute"
 
-    action_map = {
-        ('pause', 'resume', 'play_pause'): ('playpause', '🎵 Toggled play/pause'),
-        ('next',): ('nexttrack', '🎵 Skipped to next track'),
-        ('previous',): ('prevtrack', '🎵 Went to previous track'),
-        ('volume_up',): ('volumeup', '🎵 Volume increased'),
-        ('volume_down',): ('volumedown', '🎵 Volume decreased'),
-        ('mute',): ('volumemute', '🎵 Toggled mute'),
-    }
-
-    for actions, (key, message) in action_map.items():
-        if action_lower in actions:
-            try:
-                pyautogui.press(key)
-                return message
-            except Exception:
-                return f"⚠️ {key} key not supported on this system"
-
-    return f"Unknown music control action: {action}. Available: pause, resume, next, previous, volume_up, volume_down, mute"
+    key, message = entry
+    try:
+        pyautogui.press(key)
+        return message
+    except Exception:
+        return f"⚠️ {key} key not supported on this system"
 
 
 __all__ = [
@@ -6,20 +6,69 @@ Manage notes, tasks, and lists with persistent storage.
 
 from __future__ import annotations
 
+import collections
+import contextlib
 import datetime
+import functools
+import itertools
 import json
 import os
+import re
+import secrets
 import sqlite3
-import uuid
+import threading
+import time
+import weakref
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.request import pathname2url
+
+from ..utils import DATACLASS_SLOTS, json_dumps as _dumps
 
 # ================================================================================
 # CONFIGURATION
 # ================================================================================
 
 NOTES_DB = os.environ.get("BLUE_NOTES_DB", "data/notes.db")
+RESPONSE_CACHE_SIZE = 64  # cached listing responses per manager
+
+# Bump when stored data needs migrating; kept in PRAGMA user_version
+SCHEMA_VERSION = 4
+
+# Statement text is shared across calls so the connections' prepared
+# statement caches hit instead of re-parsing
+_SQL_INSERT_NOTE = """
+    INSERT INTO notes (id, title, content, tags, created_at, updated_at, pinned)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_NOTE = "SELECT * FROM notes WHERE id = ?"
+_SQL_DELETE_NOTE = "DELETE FROM notes WHERE id = ?"
+_SQL_INSERT_NOTE_TAG = "INSERT OR IGNORE INTO note_tags (tag, note_id) VALUES (?, ?)"
+_SQL_DELETE_NOTE_TAGS = "DELETE FROM note_tags WHERE note_id = ?"
+_SQL_INSERT_TASK = """
+    INSERT INTO tasks (
+        id, title, description, priority, priority_rank, status, due_date, tags,
+        created_at, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_TASK = "SELECT * FROM tasks WHERE id = ?"
+_SQL_COMPLETE_TASK = """
+    UPDATE tasks SET status = 'completed', completed_at = ?, updated_at = ?
+    WHERE id = ? AND status != 'completed'
+"""
+_SQL_DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+_SQL_INSERT_LIST_ITEM = """
+    INSERT INTO lists (id, list_name, item, quantity, checked, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_CHECK_ITEM = "UPDATE lists SET checked = ? WHERE id = ?"
+_SQL_ALL_LIST_ITEMS = """
+    SELECT id, list_name, item, quantity, checked, created_at FROM lists
+    ORDER BY list_name, checked ASC, created_at DESC
+"""
+_SQL_CLEAR_CHECKED = "DELETE FROM lists WHERE list_name = ? AND checked = 1"
 
 
 class TaskPriority(Enum):
@@ -29,6 +78,15 @@ class TaskPriority(Enum):
     URGENT = "urgent"
 
 
+# Stored in tasks.priority_rank so listings sort urgent-first off an index
+_PRIORITY_RANK: Dict[TaskPriority, int] = {
+    TaskPriority.URGENT: 1,
+    TaskPriority.HIGH: 2,
+    TaskPriority.MEDIUM: 3,
+    TaskPriority.LOW: 4,
+}
+
+
 class TaskStatus(Enum):
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -36,7 +94,38 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+def _join_tags(tags: List[str]) -> str:
+    """Encode tags for the ``tags`` column (TAB-separated)."""
+    return "\t".join(tags)
+
+
+def _split_tags(value: Optional[str]) -> List[str]:
+    """Decode a ``tags`` column value."""
+    return value.split("\t") if value else []
+
+
+def _fts_match_expression(query: str) -> str:
+    """Build an FTS5 MATCH expression requiring every query word, as a prefix, in the title or content."""
+    words = re.findall(r"\w+", query)
+    return " AND ".join(f'{{title content}}:"{word}"*' for word in words)
+
+
+def _tag_keys(tags: List[str]) -> List[str]:
+    """Normalize tags for the note_tags table (case-insensitive, unique)."""
+    return list(dict.fromkeys(tag.lower() for tag in tags))
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_local(seconds: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+
+
+def _fmt_ts(ts: float) -> str:
+    """Format a Unix timestamp as a local ISO-8601 string (second precision)."""
+    return _fmt_local(int(ts))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Note:
     """Represents a note."""
     id: str
@@ -53,14 +142,14 @@ class Note:
             "title": self.title,
             "content": self.content,
             "tags": self.tags,
-            "created_at": datetime.datetime.fromtimestamp(self.created_at).isoformat(),
-            "updated_at": datetime.datetime.fromtimestamp(self.updated_at).isoformat(),
+            "created_at": _fmt_ts(self.created_at),
+            "updated_at": _fmt_ts(self.updated_at),
             "pinned": self.pinned,
             "preview": self.content[:100] + "..." if len(self.content) > 100 else self.content
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Task:
     """Represents a task."""
     id: str
@@ -82,18 +171,18 @@ class Task:
             "priority": self.priority.value,
             "status": self.status.value,
             "tags": self.tags,
-            "created_at": datetime.datetime.fromtimestamp(self.created_at).isoformat(),
-            "updated_at": datetime.datetime.fromtimestamp(self.updated_at).isoformat(),
+            "created_at": _fmt_ts(self.created_at),
+            "updated_at": _fmt_ts(self.updated_at),
         }
         if self.due_date:
-            result["due_date"] = datetime.datetime.fromtimestamp(self.due_date).isoformat()
-            result["due_date_human"] = datetime.datetime.fromtimestamp(self.due_date).strftime("%b %d, %Y")
+            result["due_date"] = _fmt_ts(self.due_date)
+            result["due_date_human"] = time.strftime("%b %d, %Y", time.localtime(self.due_date))
         if self.completed_at:
-            result["completed_at"] = datetime.datetime.fromtimestamp(self.completed_at).isoformat()
+            result["completed_at"] = _fmt_ts(self.completed_at)
         return result
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ListItem:
     """Represents an item in a list (shopping, grocery, etc.)."""
     id: str
@@ -110,14 +199,45 @@ class ListItem:
             "item": self.item,
             "quantity": self.quantity,
             "checked": self.checked,
-            "created_at": datetime.datetime.fromtimestamp(self.created_at).isoformat()
+            "created_at": _fmt_ts(self.created_at)
         }
 
 
+# Value -> member lookups used when decoding rows (skips Enum.__call__)
+_PRIORITY_MAP: Dict[str, TaskPriority] = {p.value: p for p in TaskPriority}
+_STATUS_MAP: Dict[str, TaskStatus] = {s.value: s for s in TaskStatus}
+
+
+# Cursor row factories: build records positionally straight from SQLite rows
+
+def _note_row(cursor: sqlite3.Cursor, row: tuple) -> Note:
+    return Note(row[0], row[1], row[2], _split_tags(row[3]), row[4], row[5], bool(row[6]))
+
+
+def _task_row(cursor: sqlite3.Cursor, row: tuple) -> Task:
+    return Task(
+        row[0], row[1], row[2], _PRIORITY_MAP[row[3]], _STATUS_MAP[row[4]],
+        row[5], _split_tags(row[6]), row[7], row[8], row[9]
+    )
+
+
+def _list_item_row(cursor: sqlite3.Cursor, row: tuple) -> ListItem:
+    return ListItem(row[0], row[1], row[2], row[3], bool(row[4]), row[5])
+
+
 # ================================================================================
 # NOTES MANAGER
 # ================================================================================
 
+class _ReaderHandle:
+    """One thread's read-only connection; closed once the handle is collected."""
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        weakref.finalize(self, conn.close)
+
+
 class NotesManager:
     """Manages notes, tasks, and lists."""
 
@@ -125,6 +245,121 @@ class NotesManager:
         self.db_path = db_path
         self._init_db()
 
+        # One long-lived connection avoids reopening the database (and
+        # re-warming its page cache) on every call; the lock serializes
+        # access from multiple threads.
+        self._wlock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self._configure_connection()
+
+        # WAL lets readers run alongside the writer, so each thread gets
+        # its own read-only connection and never waits on _wlock. The
+        # handles are only weakly tracked: a reader is closed as soon as
+        # its thread ends and the thread-local slot is released.
+        self._readers = threading.local()
+        self._reader_handles: "weakref.WeakSet[_ReaderHandle]" = weakref.WeakSet()
+        self._version = 0
+
+        # Listing responses, each stored with the data version it was built at
+        self._responses: "collections.OrderedDict[Tuple[Any, ...], Tuple[Tuple[int, int], str]]" = \
+            collections.OrderedDict()
+        self._responses_lock = threading.Lock()
+
+    def _configure_connection(self):
+        """Apply performance PRAGMAs to the shared connection."""
+        cursor = self._conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA mmap_size=268435456")
+
+    def _reader(self) -> sqlite3.Connection:
+        """Return this thread's read-only connection, opening it on first use."""
+        handle = getattr(self._readers, "handle", None)
+        if handle is None:
+            handle = self._open_reader()
+        return handle.conn
+
+    def _query(self, row_factory: Callable[[sqlite3.Cursor, tuple], Any],
+               sql: str, params: Any = ()) -> sqlite3.Cursor:
+        """Run a read on this thread's connection, decoding rows with ``row_factory``."""
+        cursor = self._reader().cursor()
+        cursor.row_factory = row_factory
+        return cursor.execute(sql, params)
+
+    def _open_reader(self) -> _ReaderHandle:
+        uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA query_only=1")
+        conn.execute("PRAGMA cache_size=-32000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        handle = _ReaderHandle(conn)
+        self._readers.handle = handle
+        with self._wlock:
+            self._reader_handles.add(handle)
+        return handle
+
+    @contextlib.contextmanager
+    def _transaction(self, begin: str = "BEGIN"):
+        """
+        Run a write transaction on the shared connection.
+
+        Commits on success and bumps ``version`` so cached responses built
+        from older data are no longer used; rolls back on error.
+        """
+        with self._wlock:
+            with self._conn:
+                self._conn.execute(begin)
+                yield self._conn
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter incremented by every committed write."""
+        return self._version
+
+    def _data_version(self) -> Tuple[int, int]:
+        """
+        Identify the current database contents.
+
+        Combines this manager's write counter with PRAGMA data_version,
+        which changes when another process commits to the file.
+        """
+        with self._wlock:
+            external = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            return self._version, external
+
+    def cached_response(self, key: Tuple[Any, ...], build: Callable[[], str]) -> str:
+        """Return the response cached under ``key``, rebuilding it after any write."""
+        version = self._data_version()
+        with self._responses_lock:
+            entry = self._responses.get(key)
+            if entry is not None and entry[0] == version:
+                self._responses.move_to_end(key)
+                return entry[1]
+
+        response = build()
+        with self._responses_lock:
+            self._responses[key] = (version, response)
+            self._responses.move_to_end(key)
+            while len(self._responses) > RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return response
+
+    def close(self):
+        """Close the writer and every reader connection."""
+        with self._wlock:
+            self._conn.close()
+            for handle in list(self._reader_handles):
+                handle.conn.close()
+            self._reader_handles.clear()
+
     def _init_db(self):
         """Initialize the database."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
@@ -144,6 +379,21 @@ class NotesManager:
             )
         """)
 
+        # Tag -> note lookup for tag filters; mirrors notes.tags
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS note_tags (
+                tag TEXT NOT NULL,
+                note_id TEXT NOT NULL,
+                PRIMARY KEY (tag, note_id)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_note_tags_note ON note_tags (note_id)")
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS note_tags_ad AFTER DELETE ON notes BEGIN
+                DELETE FROM note_tags WHERE note_id = old.id;
+            END
+        """)
+
         # Tasks table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS tasks (
@@ -156,7 +406,8 @@ class NotesManager:
                 tags TEXT,
                 created_at REAL NOT NULL,
                 updated_at REAL NOT NULL,
-                completed_at REAL
+                completed_at REAL,
+                priority_rank INTEGER DEFAULT 3
             )
         """)
 
@@ -172,133 +423,256 @@ class NotesManager:
             )
         """)
 
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            self._migrate_json_tags(cursor)
+        if version < 2:
+            self._migrate_priority_rank(cursor)
+        if version < 3:
+            self._backfill_note_tags(cursor)
+        if version < 4:
+            # Replaced by the sort-key indexes in _ensure_indexes
+            cursor.execute("DROP INDEX IF EXISTS idx_tasks_rank_due")
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        self._ensure_indexes(cursor)
+        self._fts_enabled = self._ensure_fts(cursor)
+
         conn.commit()
         conn.close()
 
-    def _get_conn(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+    def _migrate_json_tags(self, cursor: sqlite3.Cursor):
+        """Rewrite tags stored as JSON arrays (schema version 0) as TAB-separated."""
+        for table in ("notes", "tasks"):
+            rows = cursor.execute(
+                f"SELECT rowid, tags FROM {table} WHERE tags LIKE '[%'"
+            ).fetchall()
+            cursor.executemany(
+                f"UPDATE {table} SET tags = ? WHERE rowid = ?",
+                [(_join_tags(json.loads(tags)), rowid) for rowid, tags in rows],
+            )
+
+    def _migrate_priority_rank(self, cursor: sqlite3.Cursor):
+        """Add and backfill tasks.priority_rank (schema version 1)."""
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(tasks)")}
+        if "priority_rank" not in columns:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN priority_rank INTEGER DEFAULT 3")
+        cursor.executemany(
+            "UPDATE tasks SET priority_rank = ? WHERE priority = ?",
+            [(rank, priority.value) for priority, rank in _PRIORITY_RANK.items()],
+        )
+        cursor.execute("DROP INDEX IF EXISTS idx_tasks_status_priority_due")
+
+    def _backfill_note_tags(self, cursor: sqlite3.Cursor):
+        """Populate note_tags from existing notes (schema version 2)."""
+        rows = cursor.execute("SELECT id, tags FROM notes WHERE tags != ''").fetchall()
+        cursor.executemany(_SQL_INSERT_NOTE_TAG, [
+            (tag, note_id) for note_id, tags in rows for tag in _tag_keys(_split_tags(tags))
+        ])
+
+    def _ensure_indexes(self, cursor: sqlite3.Cursor):
+        """Create indexes matching the filter/sort order of the listing queries."""
+        # Checks the newest index so databases predating it are re-analyzed
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_tasks_open_sort'"
+        ).fetchone()
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_notes_pinned_updated
+            ON notes (pinned DESC, updated_at DESC)
+        """)
+        # Both follow _list_tasks_query's ORDER BY; "due_date IS NULL" puts
+        # undated tasks last in a form the index can serve. The partial one
+        # holds only open tasks, the default listing
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_open_sort
+            ON tasks (priority_rank, due_date IS NULL, due_date, created_at DESC)
+            WHERE status != 'completed'
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_sort
+            ON tasks (priority_rank, due_date IS NULL, due_date, created_at DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_lists_name_checked_created
+            ON lists (list_name, checked, created_at DESC)
+        """)
+
+        if not exists:
+            # Give the planner statistics for the new indexes
+            cursor.execute("ANALYZE")
+
+    def _ensure_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the notes full-text index and its sync triggers.
+
+        Returns:
+            False if this SQLite build lacks FTS5
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'notes_fts'"
+        ).fetchone()
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+                    title, content, tags,
+                    content='notes', content_rowid='rowid',
+                    tokenize='unicode61'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False
+
+        cursor.executescript("""
+            CREATE TRIGGER IF NOT EXISTS notes_fts_ai AFTER INSERT ON notes BEGIN
+                INSERT INTO notes_fts (rowid, title, content, tags)
+                VALUES (new.rowid, new.title, new.content, new.tags);
+            END;
+            CREATE TRIGGER IF NOT EXISTS notes_fts_ad AFTER DELETE ON notes BEGIN
+                INSERT INTO notes_fts (notes_fts, rowid, title, content, tags)
+                VALUES ('delete', old.rowid, old.title, old.content, old.tags);
+            END;
+            CREATE TRIGGER IF NOT EXISTS notes_fts_au AFTER UPDATE ON notes BEGIN
+                INSERT INTO notes_fts (notes_fts, rowid, title, content, tags)
+                VALUES ('delete', old.rowid, old.title, old.content, old.tags);
+                INSERT INTO notes_fts (rowid, title, content, tags)
+                VALUES (new.rowid, new.title, new.content, new.tags);
+            END;
+        """)
+
+        # Index notes written before the FTS table existed
+        if not exists:
+            cursor.execute("INSERT INTO notes_fts (notes_fts) VALUES ('rebuild')")
+        return True
 
     # ==================== NOTES ====================
 
     def create_note(self, title: str, content: str, tags: List[str] = None,
                    pinned: bool = False) -> Note:
         """Create a new note."""
-        note_id = str(uuid.uuid4())[:8]
-        now = datetime.datetime.now().timestamp()
-
-        note = Note(
-            id=note_id,
-            title=title,
-            content=content,
-            tags=tags or [],
-            created_at=now,
-            updated_at=now,
-            pinned=pinned
-        )
+        return self.create_notes_bulk([{
+            "title": title,
+            "content": content,
+            "tags": tags,
+            "pinned": pinned,
+        }])[0]
+
+    def create_notes_bulk(self, notes: List[Dict[str, Any]]) -> List[Note]:
+        """
+        Create several notes in one transaction.
+
+        Args:
+            notes: Dicts of ``create_note`` keyword arguments
+
+        Returns:
+            The created notes, in input order
+        """
+        now = time.time()
+        created = [
+            Note(
+                id=secrets.token_hex(4),
+                title=fields["title"],
+                content=fields["content"],
+                tags=fields.get("tags") or [],
+                created_at=now,
+                updated_at=now,
+                pinned=fields.get("pinned", False)
+            )
+            for fields in notes
+        ]
 
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO notes (id, title, content, tags, created_at, updated_at, pinned)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (note.id, note.title, note.content, json.dumps(note.tags),
-              note.created_at, note.updated_at, 1 if note.pinned else 0))
-        conn.commit()
-        conn.close()
+        with self._transaction("BEGIN IMMEDIATE") as conn:
+            conn.executemany(_SQL_INSERT_NOTE, [
+                (note.id, note.title, note.content, _join_tags(note.tags),
+                 note.created_at, note.updated_at, 1 if note.pinned else 0)
+                for note in created
+            ])
+            conn.executemany(_SQL_INSERT_NOTE_TAG, [
+                (tag, note.id) for note in created for tag in _tag_keys(note.tags)
+            ])
 
-        return note
+        return created
 
     def get_note(self, note_id: str) -> Optional[Note]:
         """Get a note by ID."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM notes WHERE id = ?", (note_id,))
-        row = cursor.fetchone()
-        conn.close()
-
-        if row:
-            return Note(
-                id=row[0], title=row[1], content=row[2],
-                tags=json.loads(row[3] or "[]"),
-                created_at=row[4], updated_at=row[5],
-                pinned=bool(row[6])
-            )
-        return None
+        return self._query(_note_row, _SQL_GET_NOTE, (note_id,)).fetchone()
 
     def update_note(self, note_id: str, title: str = None, content: str = None,
                    tags: List[str] = None, pinned: bool = None) -> Optional[Note]:
-        """Update a note."""
-        note = self.get_note(note_id)
-        if not note:
-            return None
-
+        """Update a note, writing only the fields given."""
+        sets = []
+        params: List[Any] = []
         if title is not None:
-            note.title = title
+            sets.append("title = ?")
+            params.append(title)
         if content is not None:
-            note.content = content
+            sets.append("content = ?")
+            params.append(content)
         if tags is not None:
-            note.tags = tags
+            sets.append("tags = ?")
+            params.append(_join_tags(tags))
         if pinned is not None:
-            note.pinned = pinned
-
-        note.updated_at = datetime.datetime.now().timestamp()
-
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE notes SET title=?, content=?, tags=?, updated_at=?, pinned=?
-            WHERE id=?
-        """, (note.title, note.content, json.dumps(note.tags),
-              note.updated_at, 1 if note.pinned else 0, note.id))
-        conn.commit()
-        conn.close()
+            sets.append("pinned = ?")
+            params.append(1 if pinned else 0)
+        sets.append("updated_at = ?")
+        params.extend([time.time(), note_id])
+
+        with self._transaction() as conn:
+            cursor = conn.execute(f"UPDATE notes SET {', '.join(sets)} WHERE id = ?", params)
+            if cursor.rowcount and tags is not None:
+                conn.execute(_SQL_DELETE_NOTE_TAGS, (note_id,))
+                conn.executemany(_SQL_INSERT_NOTE_TAG, [(tag, note_id) for tag in _tag_keys(tags)])
+        if cursor.rowcount == 0:
+            return None
 
-        return note
+        return self.get_note(note_id)
 
     def delete_note(self, note_id: str) -> bool:
         """Delete a note."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM notes WHERE id = ?", (note_id,))
-        deleted = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
-        return deleted
+        with self._transaction() as conn:
+            cursor = conn.execute(_SQL_DELETE_NOTE, (note_id,))
+        return cursor.rowcount > 0
 
     def search_notes(self, query: str = None, tags: List[str] = None,
                     limit: int = 20) -> List[Note]:
-        """Search notes by text or tags."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
-        sql = "SELECT * FROM notes WHERE 1=1"
-        params = []
-
-        if query:
-            sql += " AND (title LIKE ? OR content LIKE ?)"
-            params.extend([f"%{query}%", f"%{query}%"])
+        """
+        Search notes by text or tags.
+
+        Text goes through the FTS index when available. Tags must all be
+        present (case-insensitive) and are matched through note_tags.
+        """
+        words = _fts_match_expression(query) if query else ""
+        if words and self._fts_enabled:
+            sql = """
+                SELECT n.* FROM notes_fts
+                JOIN notes n ON n.rowid = notes_fts.rowid
+                WHERE notes_fts MATCH ?
+            """
+            params: List[Any] = [words]
+            order = " ORDER BY n.pinned DESC, bm25(notes_fts)"
+        else:
+            sql = "SELECT n.* FROM notes n WHERE 1=1"
+            params = []
+            if query:
+                sql += " AND (n.title LIKE ? OR n.content LIKE ?)"
+                params.extend([f"%{query}%", f"%{query}%"])
+            order = " ORDER BY n.pinned DESC, n.updated_at DESC"
 
         if tags:
-            for tag in tags:
-                sql += " AND tags LIKE ?"
-                params.append(f"%{tag}%")
-
-        sql += " ORDER BY pinned DESC, updated_at DESC LIMIT ?"
+            keys = _tag_keys(tags)
+            sql += f"""
+                AND n.id IN (
+                    SELECT note_id FROM note_tags WHERE tag IN ({", ".join("?" * len(keys))})
+                    GROUP BY note_id HAVING COUNT(*) = ?
+                )
+            """
+            params.extend(keys)
+            params.append(len(keys))
+
+        sql += order + " LIMIT ?"
         params.append(limit)
 
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [
-            Note(
-                id=row[0], title=row[1], content=row[2],
-                tags=json.loads(row[3] or "[]"),
-                created_at=row[4], updated_at=row[5],
-                pinned=bool(row[6])
-            )
-            for row in rows
-        ]
+        return self._query(_note_row, sql, params).fetchall()
 
     def list_notes(self, limit: int = 20) -> List[Note]:
         """List all notes."""
@@ -310,126 +684,130 @@ class NotesManager:
                    priority: str = "medium", due_date: float = None,
                    tags: List[str] = None) -> Task:
         """Create a new task."""
-        task_id = str(uuid.uuid4())[:8]
-        now = datetime.datetime.now().timestamp()
-
-        try:
-            priority_enum = TaskPriority(priority.lower())
-        except ValueError:
-            priority_enum = TaskPriority.MEDIUM
-
-        task = Task(
-            id=task_id,
-            title=title,
-            description=description,
-            priority=priority_enum,
-            status=TaskStatus.PENDING,
-            due_date=due_date,
-            tags=tags or [],
-            created_at=now,
-            updated_at=now
-        )
-
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO tasks (id, title, description, priority, status, due_date, tags, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (task.id, task.title, task.description, task.priority.value,
-              task.status.value, task.due_date, json.dumps(task.tags),
-              task.created_at, task.updated_at))
-        conn.commit()
-        conn.close()
-
-        return task
+        return self.create_tasks_bulk([{
+            "title": title,
+            "description": description,
+            "priority": priority,
+            "due_date": due_date,
+            "tags": tags,
+        }])[0]
+
+    def create_tasks_bulk(self, tasks: List[Dict[str, Any]]) -> List[Task]:
+        """
+        Create several tasks in one transaction.
+
+        Args:
+            tasks: Dicts of ``create_task`` keyword arguments
+
+        Returns:
+            The created tasks, in input order
+        """
+        now = time.time()
+        created = []
+        for fields in tasks:
+            try:
+                priority_enum = TaskPriority(fields.get("priority", "medium").lower())
+            except ValueError:
+                priority_enum = TaskPriority.MEDIUM
+
+            created.append(Task(
+                id=secrets.token_hex(4),
+                title=fields["title"],
+                description=fields.get("description", ""),
+                priority=priority_enum,
+                status=TaskStatus.PENDING,
+                due_date=fields.get("due_date"),
+                tags=fields.get("tags") or [],
+                created_at=now,
+                updated_at=now
+            ))
+
+        with self._transaction("BEGIN IMMEDIATE") as conn:
+            conn.executemany(_SQL_INSERT_TASK, [
+                (task.id, task.title, task.description, task.priority.value,
+                 _PRIORITY_RANK[task.priority], task.status.value, task.due_date,
+                 _join_tags(task.tags),
+                 task.created_at, task.updated_at)
+                for task in created
+            ])
+
+        return created
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
-        row = cursor.fetchone()
-        conn.close()
-
-        if row:
-            return Task(
-                id=row[0], title=row[1], description=row[2],
-                priority=TaskPriority(row[3]),
-                status=TaskStatus(row[4]),
-                due_date=row[5],
-                tags=json.loads(row[6] or "[]"),
-                created_at=row[7], updated_at=row[8],
-                completed_at=row[9]
-            )
-        return None
+        return self._query(_task_row, _SQL_GET_TASK, (task_id,)).fetchone()
 
     def update_task(self, task_id: str, title: str = None, description: str = None,
                    priority: str = None, status: str = None,
                    due_date: float = None, tags: List[str] = None) -> Optional[Task]:
-        """Update a task."""
-        task = self.get_task(task_id)
-        if not task:
-            return None
-
+        """Update a task, writing only the fields given."""
+        now = time.time()
+        sets = []
+        params: List[Any] = []
         if title is not None:
-            task.title = title
+            sets.append("title = ?")
+            params.append(title)
         if description is not None:
-            task.description = description
+            sets.append("description = ?")
+            params.append(description)
         if priority is not None:
             try:
-                task.priority = TaskPriority(priority.lower())
+                priority_enum = TaskPriority(priority.lower())
+                sets.append("priority = ?, priority_rank = ?")
+                params.extend([priority_enum.value, _PRIORITY_RANK[priority_enum]])
             except ValueError:
                 pass
         if status is not None:
             try:
-                task.status = TaskStatus(status.lower())
-                if task.status == TaskStatus.COMPLETED:
-                    task.completed_at = datetime.datetime.now().timestamp()
+                status_enum = TaskStatus(status.lower())
+                sets.append("status = ?")
+                params.append(status_enum.value)
+                if status_enum == TaskStatus.COMPLETED:
+                    sets.append("completed_at = ?")
+                    params.append(now)
             except ValueError:
                 pass
         if due_date is not None:
-            task.due_date = due_date
+            sets.append("due_date = ?")
+            params.append(due_date)
         if tags is not None:
-            task.tags = tags
-
-        task.updated_at = datetime.datetime.now().timestamp()
-
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE tasks SET title=?, description=?, priority=?, status=?,
-            due_date=?, tags=?, updated_at=?, completed_at=?
-            WHERE id=?
-        """, (task.title, task.description, task.priority.value,
-              task.status.value, task.due_date, json.dumps(task.tags),
-              task.updated_at, task.completed_at, task.id))
-        conn.commit()
-        conn.close()
+            sets.append("tags = ?")
+            params.append(_join_tags(tags))
+        sets.append("updated_at = ?")
+        params.extend([now, task_id])
+
+        with self._transaction() as conn:
+            cursor = conn.execute(f"UPDATE tasks SET {', '.join(sets)} WHERE id = ?", params)
+        if cursor.rowcount == 0:
+            return None
 
-        return task
+        return self.get_task(task_id)
 
     def complete_task(self, task_id: str) -> Optional[Task]:
-        """Mark a task as completed."""
-        return self.update_task(task_id, status="completed")
+        """Mark a task as completed (a no-op write if it already is)."""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(_SQL_COMPLETE_TASK, (now, now, task_id))
+        return self.get_task(task_id)
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        deleted = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
-        return deleted
+        with self._transaction() as conn:
+            cursor = conn.execute(_SQL_DELETE_TASK, (task_id,))
+        return cursor.rowcount > 0
 
     def list_tasks(self, status: str = None, priority: str = None,
                   include_completed: bool = False, limit: int = 20) -> List[Task]:
         """List tasks with optional filtering."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
+        sql, params = self._list_tasks_query(status, priority, include_completed, limit)
+        return self._query(_task_row, sql, params).fetchall()
 
+    @staticmethod
+    def _list_tasks_query(status: Optional[str], priority: Optional[str],
+                          include_completed: bool, limit: int) -> Tuple[str, List[Any]]:
+        """Build the filtered, ordered task listing query."""
         sql = "SELECT * FROM tasks WHERE 1=1"
-        params = []
+        params: List[Any] = []
 
         if not include_completed:
             sql += " AND status != 'completed'"
@@ -443,94 +821,85 @@ class NotesManager:
             params.append(priority.lower())
 
         # Order by: urgent first, then due date, then created
-        sql += " ORDER BY CASE priority WHEN 'urgent' THEN 1 WHEN 'high' THEN 2 WHEN 'medium' THEN 3 ELSE 4 END, due_date ASC NULLS LAST, created_at DESC LIMIT ?"
+        sql += " ORDER BY priority_rank, due_date IS NULL, due_date, created_at DESC LIMIT ?"
         params.append(limit)
 
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [
-            Task(
-                id=row[0], title=row[1], description=row[2],
-                priority=TaskPriority(row[3]),
-                status=TaskStatus(row[4]),
-                due_date=row[5],
-                tags=json.loads(row[6] or "[]"),
-                created_at=row[7], updated_at=row[8],
-                completed_at=row[9]
-            )
-            for row in rows
-        ]
+        return sql, params
 
     # ==================== LISTS ====================
 
     def add_to_list(self, list_name: str, item: str,
                    quantity: str = None) -> ListItem:
         """Add an item to a list."""
-        item_id = str(uuid.uuid4())[:8]
-        now = datetime.datetime.now().timestamp()
-
-        list_item = ListItem(
-            id=item_id,
-            list_name=list_name.lower(),
-            item=item,
-            quantity=quantity,
-            checked=False,
-            created_at=now
-        )
+        return self.add_to_list_bulk(list_name, [(item, quantity)])[0]
+
+    def add_to_list_bulk(self, list_name: str,
+                         items: List[Tuple[str, Optional[str]]]) -> List[ListItem]:
+        """
+        Add several items to a list in one transaction.
+
+        Args:
+            list_name: Target list
+            items: ``(item, quantity)`` pairs
+
+        Returns:
+            The created list items, in input order
+        """
+        now = time.time()
+        created = [
+            ListItem(
+                id=secrets.token_hex(4),
+                list_name=list_name.lower(),
+                item=item,
+                quantity=quantity,
+                checked=False,
+                created_at=now
+            )
+            for item, quantity in items
+        ]
 
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO lists (id, list_name, item, quantity, checked, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (list_item.id, list_item.list_name, list_item.item,
-              list_item.quantity, 0, list_item.created_at))
-        conn.commit()
-        conn.close()
+        with self._transaction("BEGIN IMMEDIATE") as conn:
+            conn.executemany(_SQL_INSERT_LIST_ITEM, [
+                (list_item.id, list_item.list_name, list_item.item,
+                 list_item.quantity, 0, list_item.created_at)
+                for list_item in created
+            ])
 
-        return list_item
+        return created
 
     def check_item(self, item_id: str, checked: bool = True) -> bool:
         """Check/uncheck a list item."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("UPDATE lists SET checked = ? WHERE id = ?",
-                      (1 if checked else 0, item_id))
-        updated = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
-        return updated
+        with self._transaction() as conn:
+            cursor = conn.execute(_SQL_CHECK_ITEM, (1 if checked else 0, item_id))
+        return cursor.rowcount > 0
 
     def remove_from_list(self, item_id: str = None, list_name: str = None,
-                        item: str = None) -> int:
-        """Remove item(s) from a list."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
+                        item: str = None, prefix: bool = False) -> int:
+        """
+        Remove item(s) from a list.
+
+        ``item`` matches anywhere in the item text, or only at its start when
+        ``prefix`` is set. Either way the list_name index limits the scan to
+        the one list.
+        """
         if item_id:
-            cursor.execute("DELETE FROM lists WHERE id = ?", (item_id,))
+            sql, params = "DELETE FROM lists WHERE id = ?", (item_id,)
         elif list_name and item:
-            cursor.execute("DELETE FROM lists WHERE list_name = ? AND item LIKE ?",
-                          (list_name.lower(), f"%{item}%"))
+            pattern = f"{item}%" if prefix else f"%{item}%"
+            sql, params = ("DELETE FROM lists WHERE list_name = ? AND item LIKE ?",
+                           (list_name.lower(), pattern))
         elif list_name:
             # Clear entire list
-            cursor.execute("DELETE FROM lists WHERE list_name = ?", (list_name.lower(),))
+            sql, params = "DELETE FROM lists WHERE list_name = ?", (list_name.lower(),)
         else:
-            conn.close()
             return 0
 
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
-        return deleted
+        with self._transaction() as conn:
+            cursor = conn.execute(sql, params)
+        return cursor.rowcount
 
     def get_list(self, list_name: str, include_checked: bool = True) -> List[ListItem]:
         """Get all items in a list."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
         sql = "SELECT * FROM lists WHERE list_name = ?"
         params = [list_name.lower()]
 
@@ -539,43 +908,21 @@ class NotesManager:
 
         sql += " ORDER BY checked ASC, created_at DESC"
 
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [
-            ListItem(
-                id=row[0], list_name=row[1], item=row[2],
-                quantity=row[3], checked=bool(row[4]),
-                created_at=row[5]
-            )
-            for row in rows
-        ]
+        return self._query(_list_item_row, sql, params).fetchall()
 
     def get_all_lists(self) -> Dict[str, List[ListItem]]:
         """Get all lists."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("SELECT DISTINCT list_name FROM lists")
-        list_names = [row[0] for row in cursor.fetchall()]
-        conn.close()
-
-        result = {}
-        for name in list_names:
-            result[name] = self.get_list(name)
+        result: Dict[str, List[ListItem]] = {}
+        for list_item in self._query(_list_item_row, _SQL_ALL_LIST_ITEMS):
+            result.setdefault(list_item.list_name, []).append(list_item)
 
         return result
 
     def clear_checked(self, list_name: str) -> int:
         """Clear checked items from a list."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM lists WHERE list_name = ? AND checked = 1",
-                      (list_name.lower(),))
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
-        return deleted
+        with self._transaction() as conn:
+            cursor = conn.execute(_SQL_CLEAR_CHECKED, (list_name.lower(),))
+        return cursor.rowcount
 
 
 # ================================================================================
@@ -614,36 +961,43 @@ def format_notes_list(notes: List[Note]) -> str:
     return "\n".join(lines)
 
 
+_DEFAULT_ICON = "⬜"
+_PRIORITY_ICONS: Dict[TaskPriority, str] = {
+    TaskPriority.LOW: "🟢",
+    TaskPriority.MEDIUM: "🟡",
+    TaskPriority.HIGH: "🟠",
+    TaskPriority.URGENT: "🔴",
+}
+_STATUS_ICONS: Dict[TaskStatus, str] = {
+    TaskStatus.PENDING: "⬜",
+    TaskStatus.IN_PROGRESS: "🔄",
+    TaskStatus.COMPLETED: "✅",
+    TaskStatus.CANCELLED: "❌",
+}
+_CHECKED_ICON = "☑️"
+
+
+def _format_task_line(task: Task) -> str:
+    p_icon = _PRIORITY_ICONS.get(task.priority, _DEFAULT_ICON)
+    s_icon = _STATUS_ICONS.get(task.status, _DEFAULT_ICON)
+    due = ""
+    if task.due_date:
+        due = f" (due: {time.strftime('%b %d', time.localtime(task.due_date))})"
+    return f"{s_icon} {p_icon} [{task.id}] {task.title}{due}"
+
+
 def format_tasks_list(tasks: List[Task]) -> str:
     """Format tasks for display."""
     if not tasks:
         return "No tasks found."
 
-    priority_icons = {
-        "low": "🟢",
-        "medium": "🟡",
-        "high": "🟠",
-        "urgent": "🔴"
-    }
+    return "\n".join(_format_task_line(task) for task in tasks)
 
-    status_icons = {
-        "pending": "⬜",
-        "in_progress": "🔄",
-        "completed": "✅",
-        "cancelled": "❌"
-    }
 
-    lines = []
-    for task in tasks:
-        p_icon = priority_icons.get(task.priority.value, "⬜")
-        s_icon = status_icons.get(task.status.value, "⬜")
-        due = ""
-        if task.due_date:
-            due_dt = datetime.datetime.fromtimestamp(task.due_date)
-            due = f" (due: {due_dt.strftime('%b %d')})"
-        lines.append(f"{s_icon} {p_icon} [{task.id}] {task.title}{due}")
-
-    return "\n".join(lines)
+def _format_list_item_line(item: ListItem) -> str:
+    check = _CHECKED_ICON if item.checked else _DEFAULT_ICON
+    qty = f" ({item.quantity})" if item.quantity else ""
+    return f"  {check} [{item.id}] {item.item}{qty}"
 
 
 def format_list_items(items: List[ListItem], list_name: str) -> str:
@@ -651,18 +1005,21 @@ def format_list_items(items: List[ListItem], list_name: str) -> str:
     if not items:
         return f"The {list_name} list is empty."
 
-    lines = [f"📝 {list_name.title()} List:"]
-    for item in items:
-        check = "☑️" if item.checked else "⬜"
-        qty = f" ({item.quantity})" if item.quantity else ""
-        lines.append(f"  {check} [{item.id}] {item.item}{qty}")
+    header = f"📝 {list_name.title()} List:"
+    return "\n".join(itertools.chain((header,), map(_format_list_item_line, items)))
 
-    return "\n".join(lines)
+
+_IN_N_UNITS_RE = re.compile(r'in\s+(\d+)\s+(day|days|week|weeks)')
+_DAY_INDEX = {
+    day: i for i, day in enumerate(
+        ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+    )
+}
+_DAY_NAME_RE = re.compile("|".join(_DAY_INDEX))
 
 
 def parse_due_date(text: str) -> Optional[float]:
     """Parse due date from text."""
-    import re
     text = text.lower().strip()
     now = datetime.datetime.now()
 
@@ -675,7 +1032,7 @@ def parse_due_date(text: str) -> Optional[float]:
         return (now + datetime.timedelta(weeks=1)).timestamp()
 
     # "in X days/weeks"
-    match = re.match(r'in\s+(\d+)\s+(day|days|week|weeks)', text)
+    match = _IN_N_UNITS_RE.match(text)
     if match:
         num = int(match.group(1))
         unit = match.group(2)
@@ -685,14 +1042,12 @@ def parse_due_date(text: str) -> Optional[float]:
             return (now + datetime.timedelta(days=num)).timestamp()
 
     # Day names
-    days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-    for i, day in enumerate(days):
-        if day in text:
-            current_weekday = now.weekday()
-            days_ahead = i - current_weekday
-            if days_ahead <= 0:
-                days_ahead += 7
-            return (now + datetime.timedelta(days=days_ahead)).timestamp()
+    match = _DAY_NAME_RE.search(text)
+    if match:
+        days_ahead = _DAY_INDEX[match.group(0)] - now.weekday()
+        if days_ahead <= 0:
+            days_ahead += 7
+        return (now + datetime.timedelta(days=days_ahead)).timestamp()
 
     return None
 
@@ -711,7 +1066,7 @@ def create_note_cmd(title: str, content: str, tags: str = None) -> str:
 
     note = manager.create_note(title, content, tag_list)
 
-    return json.dumps({
+    return _dumps({
         "success": True,
         "message": f"Note '{title}' created",
         "note": note.to_dict()
@@ -724,33 +1079,41 @@ def get_note_cmd(note_id: str) -> str:
     note = manager.get_note(note_id)
 
     if note:
-        return json.dumps({
+        return _dumps({
             "success": True,
             "note": note.to_dict()
         })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Note not found: {note_id}"
         })
 
 
+def _search_notes_response(manager: NotesManager, query: Optional[str],
+                           tags: Optional[Tuple[str, ...]]) -> str:
+    notes = manager.search_notes(query, list(tags) if tags else None)
+
+    return _dumps({
+        "success": True,
+        "count": len(notes),
+        "notes": [n.to_dict() for n in notes],
+        "formatted": format_notes_list(notes)
+    })
+
+
 def search_notes_cmd(query: str = None, tags: str = None) -> str:
     """Search notes."""
     manager = get_notes_manager()
 
     tag_list = None
     if tags:
-        tag_list = [t.strip() for t in tags.split(',')]
-
-    notes = manager.search_notes(query, tag_list)
+        tag_list = tuple(t.strip() for t in tags.split(','))
 
-    return json.dumps({
-        "success": True,
-        "count": len(notes),
-        "notes": [n.to_dict() for n in notes],
-        "formatted": format_notes_list(notes)
-    })
+    return manager.cached_response(
+        ("search_notes", query, tag_list),
+        lambda: _search_notes_response(manager, query, tag_list)
+    )
 
 
 def delete_note_cmd(note_id: str) -> str:
@@ -758,12 +1121,12 @@ def delete_note_cmd(note_id: str) -> str:
     manager = get_notes_manager()
 
     if manager.delete_note(note_id):
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Note {note_id} deleted"
         })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Note not found: {note_id}"
         })
@@ -780,7 +1143,7 @@ def create_task_cmd(title: str, description: str = "", priority: str = "medium",
 
     task = manager.create_task(title, description, priority, due_date)
 
-    return json.dumps({
+    return _dumps({
         "success": True,
         "message": f"Task '{title}' created",
         "task": task.to_dict()
@@ -793,25 +1156,23 @@ def complete_task_cmd(task_id: str) -> str:
     task = manager.complete_task(task_id)
 
     if task:
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Task '{task.title}' completed!",
             "task": task.to_dict()
         })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Task not found: {task_id}"
         })
 
 
-def list_tasks_cmd(status: str = None, priority: str = None,
-                  show_completed: bool = False) -> str:
-    """List tasks."""
-    manager = get_notes_manager()
+def _list_tasks_response(manager: NotesManager, status: Optional[str],
+                         priority: Optional[str], show_completed: bool) -> str:
     tasks = manager.list_tasks(status, priority, show_completed)
 
-    return json.dumps({
+    return _dumps({
         "success": True,
         "count": len(tasks),
         "tasks": [t.to_dict() for t in tasks],
@@ -819,12 +1180,22 @@ def list_tasks_cmd(status: str = None, priority: str = None,
     })
 
 
+def list_tasks_cmd(status: str = None, priority: str = None,
+                  show_completed: bool = False) -> str:
+    """List tasks."""
+    manager = get_notes_manager()
+    return manager.cached_response(
+        ("list_tasks", status, priority, show_completed),
+        lambda: _list_tasks_response(manager, status, priority, show_completed)
+    )
+
+
 def add_to_list_cmd(list_name: str, item: str, quantity: str = None) -> str:
     """Add item to a list."""
     manager = get_notes_manager()
     list_item = manager.add_to_list(list_name, item, quantity)
 
-    return json.dumps({
+    return _dumps({
         "success": True,
         "message": f"Added '{item}' to {list_name} list",
         "item": list_item.to_dict()
@@ -836,7 +1207,7 @@ def get_list_cmd(list_name: str) -> str:
     manager = get_notes_manager()
     items = manager.get_list(list_name)
 
-    return json.dumps({
+    return _dumps({
         "success": True,
         "list_name": list_name,
         "count": len(items),
@@ -850,94 +1221,99 @@ def check_item_cmd(item_id: str) -> str:
     manager = get_notes_manager()
 
     if manager.check_item(item_id):
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Item {item_id} checked"
         })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Item not found: {item_id}"
         })
 
 
-def remove_from_list_cmd(list_name: str, item: str = None) -> str:
+def remove_from_list_cmd(list_name: str, item: str = None, prefix: bool = False) -> str:
     """Remove item(s) from a list."""
     manager = get_notes_manager()
-    count = manager.remove_from_list(list_name=list_name, item=item)
+    count = manager.remove_from_list(list_name=list_name, item=item, prefix=prefix)
 
-    return json.dumps({
+    return _dumps({
         "success": True,
         "message": f"Removed {count} item(s) from {list_name}",
         "removed_count": count
     })
 
 
+# Canonical action names reported back for unknown actions
+_AVAILABLE_ACTIONS = [
+    "create_note", "search_notes", "delete_note",
+    "create_task", "complete_task", "list_tasks",
+    "add_to_list", "get_list", "check_item", "remove_from_list"
+]
+
+# Action aliases -> handler taking the raw params dict
+_ACTIONS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    alias: handler
+    for aliases, handler in (
+        # Notes
+        (('create_note', 'new_note', 'add_note', 'note'), lambda p: create_note_cmd(
+            title=p.get('title', 'Untitled'),
+            content=p.get('content', ''),
+            tags=p.get('tags')
+        )),
+        (('get_note', 'read_note', 'show_note'), lambda p: get_note_cmd(p.get('id', ''))),
+        (('search_notes', 'find_notes', 'notes'),
+         lambda p: search_notes_cmd(p.get('query'), p.get('tags'))),
+        (('delete_note', 'remove_note'), lambda p: delete_note_cmd(p.get('id', ''))),
+
+        # Tasks
+        (('create_task', 'new_task', 'add_task', 'task', 'todo'), lambda p: create_task_cmd(
+            title=p.get('title', ''),
+            description=p.get('description', ''),
+            priority=p.get('priority', 'medium'),
+            due=p.get('due')
+        )),
+        (('complete_task', 'done', 'finish_task', 'check_task'),
+         lambda p: complete_task_cmd(p.get('id', ''))),
+        (('list_tasks', 'tasks', 'show_tasks', 'todos'), lambda p: list_tasks_cmd(
+            status=p.get('status'),
+            priority=p.get('priority'),
+            show_completed=p.get('show_completed', False)
+        )),
+
+        # Lists
+        (('add_to_list', 'add_item'), lambda p: add_to_list_cmd(
+            list_name=p.get('list', 'shopping'),
+            item=p.get('item', ''),
+            quantity=p.get('quantity')
+        )),
+        (('get_list', 'show_list', 'list'), lambda p: get_list_cmd(p.get('list', 'shopping'))),
+        (('check_item', 'mark_item'), lambda p: check_item_cmd(p.get('id', ''))),
+        (('remove_from_list', 'remove_item', 'clear_list'), lambda p: remove_from_list_cmd(
+            list_name=p.get('list', 'shopping'),
+            item=p.get('item'),
+            prefix=p.get('prefix', False)
+        )),
+    )
+    for alias in aliases
+}
+
+
 def execute_notes_command(action: str, params: Dict[str, Any] = None) -> str:
     """Execute a notes/tasks/lists command."""
     if params is None:
         params = {}
 
-    action_lower = action.lower().strip()
-
-    # Notes
-    if action_lower in ['create_note', 'new_note', 'add_note', 'note']:
-        return create_note_cmd(
-            title=params.get('title', 'Untitled'),
-            content=params.get('content', ''),
-            tags=params.get('tags')
-        )
-    elif action_lower in ['get_note', 'read_note', 'show_note']:
-        return get_note_cmd(params.get('id', ''))
-    elif action_lower in ['search_notes', 'find_notes', 'notes']:
-        return search_notes_cmd(params.get('query'), params.get('tags'))
-    elif action_lower in ['delete_note', 'remove_note']:
-        return delete_note_cmd(params.get('id', ''))
-
-    # Tasks
-    elif action_lower in ['create_task', 'new_task', 'add_task', 'task', 'todo']:
-        return create_task_cmd(
-            title=params.get('title', ''),
-            description=params.get('description', ''),
-            priority=params.get('priority', 'medium'),
-            due=params.get('due')
-        )
-    elif action_lower in ['complete_task', 'done', 'finish_task', 'check_task']:
-        return complete_task_cmd(params.get('id', ''))
-    elif action_lower in ['list_tasks', 'tasks', 'show_tasks', 'todos']:
-        return list_tasks_cmd(
-            status=params.get('status'),
-            priority=params.get('priority'),
-            show_completed=params.get('show_completed', False)
-        )
+    handler = _ACTIONS.get(action.lower().strip())
+    return handler(params) if handler else _unknown_action(action)
 
-    # Lists
-    elif action_lower in ['add_to_list', 'add_item']:
-        return add_to_list_cmd(
-            list_name=params.get('list', 'shopping'),
-            item=params.get('item', ''),
-            quantity=params.get('quantity')
-        )
-    elif action_lower in ['get_list', 'show_list', 'list']:
-        return get_list_cmd(params.get('list', 'shopping'))
-    elif action_lower in ['check_item', 'mark_item']:
-        return check_item_cmd(params.get('id', ''))
-    elif action_lower in ['remove_from_list', 'remove_item', 'clear_list']:
-        return remove_from_list_cmd(
-            list_name=params.get('list', 'shopping'),
-            item=params.get('item')
-        )
 
-    else:
-        return json.dumps({
-            "success": False,
-            "error": f"Unknown notes action: {action}",
-            "available_actions": [
-                "create_note", "search_notes", "delete_note",
-                "create_task", "complete_task", "list_tasks",
-                "add_to_list", "get_list", "check_item", "remove_from_list"
-            ]
-        })
+def _unknown_action(action: str) -> str:
+    return _dumps({
+        "success": False,
+        "error": f"Unknown notes action: {action}",
+        "available_actions": _AVAILABLE_ACTIONS,
+    })
 
 
 __all__ = [
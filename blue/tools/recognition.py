@@ -12,17 +12,45 @@ Uses:
 from __future__ import annotations
 
 import base64
+import collections
+import contextlib
+import copy
 import datetime
+import functools
 import hashlib
+import itertools
 import json
 import os
 import pickle
 import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import numpy as np
 
+from ..utils import DATACLASS_SLOTS, json_dumps as _dumps
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 # ================================================================================
 # CONFIGURATION
 # ================================================================================
@@ -35,12 +63,79 @@ PLACE_FEATURES_DIR = os.environ.get("BLUE_PLACE_FEATURES_DIR", "data/place_featu
 FACE_MATCH_THRESHOLD = 0.6  # Lower = stricter matching
 PLACE_MATCH_THRESHOLD = 0.7  # Higher = more matches needed
 
+# Decoded results for this many recently seen image files are kept, keyed
+# by path, mtime and size, so repeated lookups of one frame skip the decode
+IMAGE_CACHE_SIZE = 128
+
+# Full analyze_image results for this many recent frames, on the same key;
+# cleared whenever the manager enrolls or forgets someone or somewhere
+RESULT_CACHE_SIZE = 128
+
+# A frame whose 64-bit difference hash is within PERCEPTUAL_CACHE_MAX_BITS
+# of one analyzed in the last PERCEPTUAL_CACHE_TTL seconds reuses its place
+# match, so bursts of near-identical camera captures skip place matching.
+# Faces are always recognized: a whole-frame hash barely moves when a
+# different person stands in the same spot
+PERCEPTUAL_CACHE_MAX_BITS = 5
+PERCEPTUAL_CACHE_TTL = 30.0
+
+# analyze_images reads, hashes and decodes up to this many frames ahead of
+# the one being recognized, on ANALYZE_IO_WORKERS threads
+ANALYZE_PREFETCH = 8
+ANALYZE_IO_WORKERS = 4
+
+# ORB matches closer than this Hamming distance count as good; a stored
+# sample needs more good matches than PLACE_SAMPLE_MIN_MATCHES to count
+ORB_GOOD_MATCH_DISTANCE = 50
+PLACE_SAMPLE_MIN_MATCHES = 10
+
+# Frames are shrunk to at most this many pixels on their longer side before
+# ORB runs; its pyramid makes the features largely scale-invariant
+ORB_MAX_IMAGE_DIM = 1024
+
+# Faces are detected and encoded on frames shrunk to at most this many
+# pixels on their longer side; locations are mapped back to full size
+FACE_MAX_IMAGE_DIM = 800
+
+# Each place keeps at most this many ORB descriptors, a uniform reservoir
+# sample of all it was enrolled with, so matching cost stays bounded
+PLACE_MAX_DESCRIPTORS = 5000
+
+# Face encodings are 128-d. With FAISS, galleries of FACE_INDEX_SQ8_MIN
+# encodings are searched as 8-bit codes (a quarter of the float32 bytes per
+# scan), and from FACE_INDEX_HNSW_MIN through an HNSW graph, which is
+# saved to FACE_INDEX_FILE so startup need not rebuild it.
+FACE_ENCODING_DIM = 128
+FACE_INDEX_SQ8_MIN = 256
+FACE_INDEX_HNSW_MIN = 10000
+FACE_INDEX_FILE = "encodings.faiss"
+
+# All encodings live in one append-only file of raw 128 x float32 records,
+# memory-mapped on load, with a parallel file holding one JSON-encoded name
+# per line. Enrolling appends a record; only removal rewrites the files.
+FACE_ENCODINGS_FILE = "encodings.f32"
+FACE_NAMES_FILE = "encodings.names"
+_ENCODING_BYTES = FACE_ENCODING_DIM * np.dtype(np.float32).itemsize
+
+_SQL_FACE_SEEN = """
+    UPDATE known_faces SET last_seen = ?, times_seen = times_seen + ?
+    WHERE name = ?
+"""
+_SQL_INSERT_FACE_SIGHTING = """
+    INSERT INTO face_sightings (name, confidence, image_hash) VALUES (?, ?, ?)
+"""
+_SQL_PLACE_SEEN = """
+    UPDATE known_places SET last_seen = ?, times_seen = times_seen + 1
+    WHERE name = ?
+"""
+
 
 # ================================================================================
 # DATA CLASSES
 # ================================================================================
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class FaceMatch:
     """Result of a face recognition match."""
     name: str
@@ -63,7 +158,7 @@ class FaceMatch:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PlaceMatch:
     """Result of a place recognition match."""
     name: str
@@ -86,7 +181,7 @@ class PlaceMatch:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RecognitionResult:
     """Complete recognition result for an image."""
     faces: List[FaceMatch] = field(default_factory=list)
@@ -133,11 +228,162 @@ class RecognitionResult:
         return ". ".join(parts)
 
 
+# ================================================================================
+# SHARED STORAGE
+# ================================================================================
+
+class _RecognitionStore:
+    """Long-lived SQLite connection shared by the recognition engines."""
+
+    # Bumped whenever the known entries or their stats change, so the
+    # serialized listing can tell it is stale: (version, count, JSON array)
+    _known_version = 0
+    _known_json: Optional[Tuple[int, int, str]] = None
+
+    def _open_connection(self):
+        # Keeping one connection open avoids a connect, commit fsync and
+        # close for every sighting; the lock serializes access from threads.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        cursor = self._conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Run a write transaction on the shared connection; rolls back on error."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                yield self._conn
+
+    def close(self):
+        """Close the shared database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _known_changed(self):
+        """Mark the cached listing stale."""
+        self._known_version += 1
+
+    def _known_listing(self, build: Callable[[], List[Dict[str, Any]]]) -> Tuple[int, str]:
+        """Return (count, JSON array) of ``build()``, reused until the next change."""
+        cached = self._known_json
+        if cached is not None and cached[0] == self._known_version:
+            return cached[1], cached[2]
+        # Read the version first: a change made while building leaves the
+        # stored copy already stale
+        version = self._known_version
+        items = build()
+        self._known_json = (version, len(items), _dumps(items))
+        return len(items), self._known_json[2]
+
+
 # ================================================================================
 # FACE RECOGNITION ENGINE
 # ================================================================================
 
-class FaceRecognitionEngine:
+def _file_key(path: str) -> Tuple[str, int, int]:
+    """Identify a file's current contents by path, mtime and size."""
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _new_digest():
+    """A 64-bit content hasher: XXH3 when xxhash is installed, else BLAKE2b."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64()
+    return hashlib.blake2b(digest_size=8)
+
+
+@functools.lru_cache(maxsize=32)
+def _hash_file(path: str, mtime_ns: int, size: int) -> str:
+    """Content digest of a file (cached by _hash_image)."""
+    # Unbuffered: chunks are read straight into one reused buffer
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(hashlib, 'file_digest'):
+            digest = hashlib.file_digest(f, _new_digest)
+        else:
+            digest = _new_digest()
+            buffer = bytearray(1 << 18)
+            view = memoryview(buffer)
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                digest.update(view[:n])
+    return digest.hexdigest()
+
+
+def _hash_image(image_path: str) -> Optional[str]:
+    """
+    Return a 16-hex-digit hash of an image file's contents.
+
+    Cached per path, mtime and size so the manager and both engines share
+    one hash per frame. Returns None if the file cannot be read.
+    """
+    try:
+        return _hash_file(*_file_key(image_path))
+    except OSError:
+        return None
+
+
+def _replace_file(path: str, write: Callable[[Any], Any]):
+    """Write a file through a temporary sibling, then swap it into place."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _nearest_rows(queries, known):
+        """Nearest row of ``known`` to each query row by L2: (rows, distances)."""
+        n_queries = queries.shape[0]
+        rows = np.full(n_queries, -1, dtype=np.int64)
+        distances = np.empty(n_queries, dtype=np.float32)
+        for i in prange(n_queries):
+            best = np.float32(3.4e38)
+            for j in range(known.shape[0]):
+                total = np.float32(0.0)
+                for k in range(known.shape[1]):
+                    diff = queries[i, k] - known[j, k]
+                    total += diff * diff
+                if total < best:
+                    best = total
+                    rows[i] = j
+            distances[i] = np.sqrt(best)
+        return rows, distances
+
+
+def _build_face_index(matrix: np.ndarray):
+    """Build a FAISS L2 index over an (N, 128) float32 encoding matrix."""
+    if len(matrix) >= FACE_INDEX_HNSW_MIN:
+        # Approximate search in O(log N) hops instead of a full scan
+        index = faiss.IndexHNSWFlat(FACE_ENCODING_DIM, 32)
+        index.hnsw.efConstruction = 80
+        index.hnsw.efSearch = 32
+    elif len(matrix) >= FACE_INDEX_SQ8_MIN:
+        # Per-dimension ranges are learned from the gallery; distances come
+        # back in the original float space, so thresholds are unchanged
+        index = faiss.IndexScalarQuantizer(
+            FACE_ENCODING_DIM, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2
+        )
+        index.train(matrix)
+    else:
+        index = faiss.IndexFlatL2(FACE_ENCODING_DIM)
+    index.add(matrix)
+    return index
+
+
+class FaceRecognitionEngine(_RecognitionStore):
     """
     Handles face detection, encoding, and recognition.
 
@@ -155,10 +401,24 @@ class FaceRecognitionEngine:
         self._face_recognition = None
         self._cv2 = None
 
-        self._known_encodings: Dict[str, List[np.ndarray]] = {}
         self._known_metadata: Dict[str, Dict] = {}
 
+        # Gallery kept as parallel arrays: row i of _K is an encoding of
+        # _names[_row_name_id[i]]. Searched through _face_index when FAISS
+        # is present.
+        self._names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self._K = np.empty((0, FACE_ENCODING_DIM), dtype=np.float32)
+        self._K_sqnorm = np.empty(0, dtype=np.float32)
+        self._row_name_id = np.empty(0, dtype=np.int32)
+        self._face_index = None
+
+        self._analyze_cached = functools.lru_cache(maxsize=IMAGE_CACHE_SIZE)(
+            self._read_faces
+        )
+
         self._init_directories()
+        self._open_connection()
         self._init_db()
         self._load_encodings()
 
@@ -169,8 +429,7 @@ class FaceRecognitionEngine:
 
     def _init_db(self):
         """Initialize the recognition database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS known_faces (
@@ -196,21 +455,16 @@ class FaceRecognitionEngine:
             )
         """)
 
-        conn.commit()
-        conn.close()
-
     def _load_encodings(self):
-        """Load face encodings from disk."""
-        self._known_encodings = {}
+        """Load face metadata from the database and encodings from disk."""
         self._known_metadata = {}
+        self._names = []
+        self._name_ids = {}
 
         # Load from database
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
+        cursor = self._conn.cursor()
+        cursor.row_factory = sqlite3.Row
         rows = cursor.execute("SELECT * FROM known_faces").fetchall()
-        conn.close()
 
         for row in rows:
             name = row['name']
@@ -220,28 +474,225 @@ class FaceRecognitionEngine:
                 'last_seen': row['last_seen'],
                 'times_seen': row['times_seen']
             }
+            self._register_name(name)
+
+        try:
+            matrix, row_to_name, intact = self._read_encodings_file()
+        except FileNotFoundError:
+            self._load_legacy_encodings()
+            return
+        except Exception as e:
+            print(f"[FACE] Error loading encodings: {e}")
+            matrix, row_to_name, intact = np.empty((0, FACE_ENCODING_DIM), dtype=np.float32), [], True
+
+        # Drop rows for anyone no longer in the database
+        row_name_id = np.fromiter((self._name_ids.get(name, -1) for name in row_to_name),
+                                  dtype=np.int32, count=len(row_to_name))
+        keep = row_name_id >= 0
+        if not keep.all():
+            matrix = matrix[keep]
+            row_name_id = row_name_id[keep]
+            intact = False
+
+        if not intact:
+            # Copied off the map: the files are rewritten below
+            matrix = np.array(matrix, dtype=np.float32)
+
+        index = self._read_face_index(len(matrix)) if intact else None
+        self._set_gallery(matrix, row_name_id, index)
+
+        # A torn append or stale rows leave the two files out of step;
+        # rewrite them so later appends line up again
+        if not intact:
+            self._save_encodings()
+        if index is None:
+            self._save_face_index()
+
+    def _read_encodings_file(self) -> Tuple[np.ndarray, List[str], bool]:
+        """
+        Memory-map the stored encodings and read the name of each row.
 
-            # Load encodings from file
+        Returns (matrix, row_to_name, intact); ``intact`` is False when the
+        two files disagree, in which case only the rows both cover are kept.
+        """
+        names_path = os.path.join(self.encodings_dir, FACE_NAMES_FILE)
+        matrix_path = os.path.join(self.encodings_dir, FACE_ENCODINGS_FILE)
+        with open(names_path, encoding='utf-8') as f:
+            row_to_name = [json.loads(line) for line in f if line.strip()]
+        size = os.path.getsize(matrix_path)
+
+        rows = min(len(row_to_name), size // _ENCODING_BYTES)
+        intact = rows == len(row_to_name) and rows * _ENCODING_BYTES == size
+        if rows:
+            matrix = np.memmap(matrix_path, dtype=np.float32, mode='r',
+                               shape=(rows, FACE_ENCODING_DIM))
+        else:
+            matrix = np.empty((0, FACE_ENCODING_DIM), dtype=np.float32)
+        return matrix, row_to_name[:rows], intact
+
+    def _load_legacy_encodings(self):
+        """Read per-person pickles from older versions and rewrite them as one file."""
+        encodings = []
+        row_name_id = []
+        for name, name_id in self._name_ids.items():
             encoding_file = os.path.join(self.encodings_dir, f"{name}.pkl")
             if os.path.exists(encoding_file):
                 try:
                     with open(encoding_file, 'rb') as f:
-                        self._known_encodings[name] = pickle.load(f)
+                        known = list(pickle.load(f))
                 except Exception as e:
                     print(f"[FACE] Error loading encodings for {name}: {e}")
-                    self._known_encodings[name] = []
-            else:
-                self._known_encodings[name] = []
+                    continue
+                encodings.extend(known)
+                row_name_id.extend([name_id] * len(known))
+
+        if encodings:
+            self._set_gallery(np.vstack(encodings).astype(np.float32),
+                              np.asarray(row_name_id, dtype=np.int32))
+            self._save_encodings()
+            self._save_face_index()
+
+    def _register_name(self, name: str) -> int:
+        """Return the id of ``name`` in _names, adding it if new."""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self._names)
+            self._names.append(name)
+        return name_id
+
+    def _set_gallery(self, matrix: np.ndarray, row_name_id: np.ndarray, index=None):
+        """Replace the gallery with ``matrix`` and rebuild (or adopt) its search index."""
+        self._K = matrix
+        self._row_name_id = row_name_id
+        self._K_sqnorm = np.einsum('ij,ij->i', matrix, matrix)
+        if not FAISS_AVAILABLE or not len(matrix):
+            self._face_index = None
+        elif index is not None:
+            self._face_index = index
+        else:
+            self._face_index = _build_face_index(np.ascontiguousarray(matrix))
+
+    def _read_face_index(self, rows: int):
+        """
+        Load the saved HNSW index if it still matches the stored encodings.
+
+        It must hold ``rows`` vectors and be newer than the encodings file;
+        otherwise None is returned and the caller rebuilds it.
+        """
+        if not FAISS_AVAILABLE or rows < FACE_INDEX_HNSW_MIN:
+            return None
+        index_path = os.path.join(self.encodings_dir, FACE_INDEX_FILE)
+        matrix_path = os.path.join(self.encodings_dir, FACE_ENCODINGS_FILE)
+        try:
+            if os.stat(index_path).st_mtime_ns < os.stat(matrix_path).st_mtime_ns:
+                return None
+            index = faiss.read_index(index_path)
+        except Exception:
+            return None
+        if index.ntotal != rows:
+            return None
+        faiss.downcast_index(index).hnsw.efSearch = 32
+        return index
 
-    def _save_encodings(self, name: str):
-        """Save face encodings to disk."""
-        if name not in self._known_encodings:
+    def _save_face_index(self):
+        """Persist an HNSW index next to the encodings; other indexes rebuild quickly."""
+        index_path = os.path.join(self.encodings_dir, FACE_INDEX_FILE)
+        try:
+            if FAISS_AVAILABLE and isinstance(self._face_index, faiss.IndexHNSWFlat):
+                tmp_path = f"{index_path}.tmp"
+                faiss.write_index(self._face_index, tmp_path)
+                os.replace(tmp_path, index_path)
+            elif os.path.exists(index_path):
+                os.remove(index_path)
+        except Exception as e:
+            print(f"[FACE] Error saving search index: {e}")
+
+    def _add_encodings(self, name_id: int, encodings: np.ndarray):
+        """Append (M, 128) encodings for one person to the gallery and its index."""
+        encodings = np.ascontiguousarray(encodings, dtype=np.float32).reshape(-1, FACE_ENCODING_DIM)
+        if self._face_index is None:
+            self._set_gallery(
+                np.concatenate([self._K, encodings]),
+                np.concatenate([self._row_name_id,
+                                np.full(len(encodings), name_id, dtype=np.int32)])
+            )
             return
 
-        encoding_file = os.path.join(self.encodings_dir, f"{name}.pkl")
+        self._K = np.concatenate([self._K, encodings])
+        self._row_name_id = np.concatenate(
+            [self._row_name_id, np.full(len(encodings), name_id, dtype=np.int32)]
+        )
+        self._K_sqnorm = np.concatenate(
+            [self._K_sqnorm, np.einsum('ij,ij->i', encodings, encodings)]
+        )
+        self._face_index.add(encodings)
+
+    def _remove_name(self, name: str):
+        """Drop a person's rows from the gallery and renumber the later ids."""
+        name_id = self._name_ids.pop(name)
+        del self._names[name_id]
+        for later in self._names[name_id:]:
+            self._name_ids[later] -= 1
+
+        keep = self._row_name_id != name_id
+        row_name_id = self._row_name_id[keep]
+        row_name_id[row_name_id > name_id] -= 1
+        self._set_gallery(np.ascontiguousarray(self._K[keep]), row_name_id)
+
+    def _count_encodings(self, name: str) -> int:
+        """Number of stored encodings for a known person."""
+        return int(np.count_nonzero(self._row_name_id == self._name_ids[name]))
+
+    def _nearest(self, queries: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the closest known encoding for each query row.
+
+        Returns (rows, distances); a row of -1 means nothing was found.
+        """
+        if self._face_index is not None:
+            distances, rows = self._face_index.search(queries, 1)
+            # FAISS reports squared L2; face_recognition thresholds plain L2
+            return rows[:, 0], np.sqrt(distances[:, 0])
+
+        if NUMBA_AVAILABLE:
+            # Subtract, square, sum and min fused per query, no temporaries
+            return _nearest_rows(np.ascontiguousarray(queries, dtype=np.float32),
+                                 np.asarray(self._K))
+
+        # ||q - k||^2 = ||q||^2 + ||k||^2 - 2 q.k, so every query/known pair
+        # comes out of one GEMM. ||q||^2 is constant along a query's row, so
+        # ranking only needs ||k||^2 - 2 q.k; the -2 is folded into the small
+        # query matrix and ||q||^2 is added back for the winners alone. The
+        # nearest row overall is also the nearest row of the winning person,
+        # so no per-name reduction is needed.
+        ranking = (queries * -2.0) @ self._K.T
+        ranking += self._K_sqnorm
+        rows = ranking.argmin(axis=1)
+        nearest = ranking[np.arange(len(queries)), rows]
+        nearest += np.einsum('ij,ij->i', queries, queries)
+        return rows, np.sqrt(np.maximum(nearest, 0.0))
+
+    def _save_encodings(self):
+        """Rewrite the encoding and name files from the in-memory matrix."""
+        try:
+            _replace_file(os.path.join(self.encodings_dir, FACE_ENCODINGS_FILE),
+                          lambda f: f.write(self._K.astype(np.float32).tobytes()))
+            _replace_file(os.path.join(self.encodings_dir, FACE_NAMES_FILE),
+                          lambda f: f.write(''.join(
+                              json.dumps(self._names[name_id]) + '\n'
+                              for name_id in self._row_name_id
+                          ).encode('utf-8')))
+        except Exception as e:
+            print(f"[FACE] Error saving encodings: {e}")
+
+    def _append_encoding(self, name: str, encoding: np.ndarray):
+        """Append one encoding record and its name to the files on disk."""
         try:
-            with open(encoding_file, 'wb') as f:
-                pickle.dump(self._known_encodings[name], f)
+            with open(os.path.join(self.encodings_dir, FACE_ENCODINGS_FILE), 'ab') as f:
+                f.write(np.asarray(encoding, dtype=np.float32).tobytes())
+            with open(os.path.join(self.encodings_dir, FACE_NAMES_FILE), 'a',
+                      encoding='utf-8') as f:
+                f.write(json.dumps(name) + '\n')
         except Exception as e:
             print(f"[FACE] Error saving encodings for {name}: {e}")
 
@@ -272,6 +723,55 @@ class FaceRecognitionEngine:
                 )
         return self._cv2
 
+    def _read_faces(self, image_path: str, mtime_ns: int,
+                    size: int) -> Tuple[Tuple[Tuple[int, int, int, int], ...], np.ndarray]:
+        """Detect and encode every face in an image file (cached by _analyze_file)."""
+        return self._analyze_image(self._get_face_recognition().load_image_file(image_path))
+
+    def _analyze_image(self, image: np.ndarray) -> Tuple[Tuple[Tuple[int, int, int, int], ...], np.ndarray]:
+        """Detect and encode every face in an RGB image array."""
+        fr = self._get_face_recognition()
+        height, width = image.shape[:2]
+        small, scale = self._downscale(image)
+        face_locations = fr.face_locations(small)
+        if not face_locations:
+            return (), np.empty((0, FACE_ENCODING_DIM), dtype=np.float32)
+
+        encodings = np.asarray(fr.face_encodings(small, face_locations), dtype=np.float32)
+        encodings = encodings.reshape(-1, FACE_ENCODING_DIM)
+        encodings.flags.writeable = False
+        if scale == 1.0:
+            return tuple(tuple(loc) for loc in face_locations), encodings
+
+        # (top, right, bottom, left) in the full-size frame
+        return tuple(
+            (int(top / scale), min(round(right / scale), width),
+             min(round(bottom / scale), height), int(left / scale))
+            for top, right, bottom, left in face_locations
+        ), encodings
+
+    def _downscale(self, image: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Shrink an image to FACE_MAX_IMAGE_DIM on its longer side.
+
+        Returns (image, scale); without OpenCV the image is left as is.
+        """
+        height, width = image.shape[:2]
+        scale = FACE_MAX_IMAGE_DIM / max(height, width)
+        if scale >= 1.0:
+            return image, 1.0
+        try:
+            cv2 = self._get_cv2()
+        except ImportError:
+            return image, 1.0
+        small = cv2.resize(image, (round(width * scale), round(height * scale)),
+                           interpolation=cv2.INTER_AREA)
+        return small, scale
+
+    def _analyze_file(self, image_path: str):
+        """Return (face locations, (M, 128) encodings) for an image file."""
+        return self._analyze_cached(*_file_key(image_path))
+
     def enroll_face(self, name: str, image_path: str,
                     relationship: str = None,
                     description: str = None) -> Dict[str, Any]:
@@ -287,12 +787,11 @@ class FaceRecognitionEngine:
         Returns:
             Result dict with success status and encoding count
         """
-        fr = self._get_face_recognition()
+        self._get_face_recognition()
 
         try:
             # Load and process image
-            image = fr.load_image_file(image_path)
-            face_locations = fr.face_locations(image)
+            face_locations, face_encodings = self._analyze_file(image_path)
 
             if not face_locations:
                 return {
@@ -309,8 +808,7 @@ class FaceRecognitionEngine:
                 }
 
             # Get face encoding
-            face_encodings = fr.face_encodings(image, face_locations)
-            if not face_encodings:
+            if not len(face_encodings):
                 return {
                     "success": False,
                     "error": "Could not encode face. Try a different image.",
@@ -320,8 +818,7 @@ class FaceRecognitionEngine:
             encoding = face_encodings[0]
 
             # Store encoding
-            if name not in self._known_encodings:
-                self._known_encodings[name] = []
+            if name not in self._name_ids:
                 self._known_metadata[name] = {
                     'relationship': relationship,
                     'description': description,
@@ -329,35 +826,32 @@ class FaceRecognitionEngine:
                     'times_seen': 0
                 }
 
-            self._known_encodings[name].append(encoding)
-            self._save_encodings(name)
+            self._append_encoding(name, encoding)
+            self._add_encodings(self._register_name(name), encoding)
+            self._save_face_index()
+            num_encodings = self._count_encodings(name)
 
             # Update database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT OR REPLACE INTO known_faces
-                (name, relationship, description, num_encodings, times_seen)
-                VALUES (?, ?, ?, ?,
-                    COALESCE((SELECT times_seen FROM known_faces WHERE name = ?), 0))
-            """, (name, relationship, description,
-                  len(self._known_encodings[name]), name))
-
-            conn.commit()
-            conn.close()
+            with self._transaction() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO known_faces
+                    (name, relationship, description, num_encodings, times_seen)
+                    VALUES (?, ?, ?, ?,
+                        COALESCE((SELECT times_seen FROM known_faces WHERE name = ?), 0))
+                """, (name, relationship, description, num_encodings, name))
 
             # Update metadata
             if relationship:
                 self._known_metadata[name]['relationship'] = relationship
             if description:
                 self._known_metadata[name]['description'] = description
+            self._known_changed()
 
             return {
                 "success": True,
                 "name": name,
-                "num_encodings": len(self._known_encodings[name]),
-                "message": f"Enrolled {name} with {len(self._known_encodings[name])} face sample(s)"
+                "num_encodings": num_encodings,
+                "message": f"Enrolled {name} with {num_encodings} face sample(s)"
             }
 
         except Exception as e:
@@ -368,138 +862,183 @@ class FaceRecognitionEngine:
             }
 
     def recognize_faces(self, image_path: str,
-                        update_seen: bool = True) -> List[FaceMatch]:
+                        update_seen: bool = True,
+                        image_hash: Optional[str] = None) -> List[FaceMatch]:
         """
         Recognize faces in an image.
 
         Args:
             image_path: Path to image to analyze
             update_seen: Whether to update last_seen timestamps
+            image_hash: Content hash to log sightings under, if the caller
+                already has one
 
         Returns:
             List of FaceMatch objects for recognized faces
         """
-        fr = self._get_face_recognition()
-        matches = []
+        self._get_face_recognition()
 
         try:
-            # Load and process image
-            image = fr.load_image_file(image_path)
-            face_locations = fr.face_locations(image)
-
-            if not face_locations:
-                return []
+            return self._recognize_file(image_path, update_seen, image_hash)[0]
 
-            face_encodings = fr.face_encodings(image, face_locations)
+        except Exception as e:
+            print(f"[FACE] Recognition error: {e}")
+            return []
 
-            for i, encoding in enumerate(face_encodings):
-                location = face_locations[i]
-                best_match = None
-                best_distance = float('inf')
+    def recognize_faces_from_array(self, image: np.ndarray,
+                                   update_seen: bool = True,
+                                   image_hash: Optional[str] = None) -> List[FaceMatch]:
+        """
+        Recognize faces in an already decoded RGB image.
 
-                # Compare against known faces
-                for name, known_encodings in self._known_encodings.items():
-                    if not known_encodings:
-                        continue
+        Same as recognize_faces, for callers that hold the frame in memory.
+        ``image`` must be a C-contiguous uint8 (H, W, 3) array in RGB order,
+        as dlib reads it without a converting copy.
+        """
+        self._get_face_recognition()
 
-                    # Calculate distances to all encodings for this person
-                    distances = fr.face_distance(known_encodings, encoding)
-                    min_distance = np.min(distances)
+        try:
+            return self._recognize_array(image, update_seen, image_hash)[0]
 
-                    if min_distance < best_distance and min_distance < FACE_MATCH_THRESHOLD:
-                        best_distance = min_distance
-                        best_match = name
+        except Exception as e:
+            print(f"[FACE] Recognition error: {e}")
+            return []
 
-                if best_match:
-                    metadata = self._known_metadata.get(best_match, {})
-                    confidence = 1.0 - best_distance  # Convert distance to confidence
+    def recognize_faces_with_counts(self, image_path: str,
+                                    update_seen: bool = True,
+                                    image_hash: Optional[str] = None) -> Tuple[List[FaceMatch], int]:
+        """
+        Recognize faces in an image and count every face detected.
 
-                    match = FaceMatch(
-                        name=best_match,
-                        confidence=confidence,
-                        distance=best_distance,
-                        location=location,
-                        relationship=metadata.get('relationship'),
-                        last_seen=metadata.get('last_seen'),
-                        times_seen=metadata.get('times_seen', 0) + 1
-                    )
-                    matches.append(match)
+        Same as recognize_faces, but also returns how many faces were found,
+        so callers can tell unknown faces apart without detecting again.
 
-                    if update_seen:
-                        self._update_seen(best_match, image_path)
+        Returns:
+            (FaceMatch list, number of faces detected)
+        """
+        self._get_face_recognition()
 
-            return matches
+        try:
+            return self._recognize_file(image_path, update_seen, image_hash)
 
         except Exception as e:
             print(f"[FACE] Recognition error: {e}")
+            return [], 0
+
+    def _recognize_file(self, image_path: str, update_seen: bool,
+                        image_hash: Optional[str]) -> Tuple[List[FaceMatch], int]:
+        """recognize_faces without the error guard: (matches, faces detected)."""
+        face_locations, queries = self._analyze_file(image_path)
+        if update_seen and image_hash is None:
+            image_hash = _hash_image(image_path)
+        matches = self._match_faces(face_locations, queries, update_seen, image_hash)
+        return matches, len(face_locations)
+
+    def _recognize_array(self, image: np.ndarray, update_seen: bool,
+                         image_hash: Optional[str]) -> Tuple[List[FaceMatch], int]:
+        """recognize_faces_from_array without the error guard: (matches, faces detected)."""
+        face_locations, queries = self._analyze_image(image)
+        matches = self._match_faces(face_locations, queries, update_seen, image_hash)
+        return matches, len(face_locations)
+
+    def _match_faces(self, face_locations, queries: np.ndarray, update_seen: bool,
+                     image_hash: Optional[str]) -> List[FaceMatch]:
+        """Match encoded faces against the gallery and optionally log the sightings."""
+        if not len(queries) or not len(self._K):
             return []
 
-    def _update_seen(self, name: str, image_path: str):
-        """Update last seen timestamp for a person."""
-        now = datetime.datetime.now().isoformat()
+        matches = []
+        rows, distances = self._nearest(queries)
+
+        for location, row, distance in zip(face_locations, rows, distances):
+            best_distance = float(distance)
+            if row < 0 or best_distance >= FACE_MATCH_THRESHOLD:
+                continue
+
+            best_match = self._names[self._row_name_id[row]]
+            metadata = self._known_metadata.get(best_match, {})
+            confidence = 1.0 - best_distance  # Convert distance to confidence
+
+            match = FaceMatch(
+                name=best_match,
+                confidence=confidence,
+                distance=best_distance,
+                location=location,
+                relationship=metadata.get('relationship'),
+                last_seen=metadata.get('last_seen'),
+                times_seen=metadata.get('times_seen', 0) + 1
+            )
+            matches.append(match)
 
-        # Update metadata
-        if name in self._known_metadata:
-            self._known_metadata[name]['last_seen'] = now
-            self._known_metadata[name]['times_seen'] = \
-                self._known_metadata[name].get('times_seen', 0) + 1
+        if update_seen and matches:
+            self._record_sightings([(m.name, m.confidence) for m in matches], image_hash)
 
-        # Update database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return matches
 
-        cursor.execute("""
-            UPDATE known_faces
-            SET last_seen = ?, times_seen = times_seen + 1
-            WHERE name = ?
-        """, (now, name))
+    def _record_sightings(self, sightings: List[Tuple[str, float]],
+                          image_hash: Optional[str]):
+        """Update last seen timestamps and log one frame's (name, confidence) sightings."""
+        now = datetime.datetime.now().isoformat()
+        counts = collections.Counter(name for name, _ in sightings)
 
-        # Log sighting
-        image_hash = hashlib.md5(image_path.encode()).hexdigest()[:16]
-        cursor.execute("""
-            INSERT INTO face_sightings (name, confidence, image_hash)
-            VALUES (?, ?, ?)
-        """, (name, 1.0, image_hash))
+        # Update metadata
+        for name, count in counts.items():
+            if name in self._known_metadata:
+                self._known_metadata[name]['last_seen'] = now
+                self._known_metadata[name]['times_seen'] = \
+                    self._known_metadata[name].get('times_seen', 0) + count
+        self._known_changed()
 
-        conn.commit()
-        conn.close()
+        # Update database
+        with self._transaction() as conn:
+            conn.executemany(_SQL_FACE_SEEN,
+                             [(now, count, name) for name, count in counts.items()])
+            conn.executemany(_SQL_INSERT_FACE_SIGHTING,
+                             [(name, confidence, image_hash)
+                              for name, confidence in sightings])
 
     def get_known_faces(self) -> List[Dict[str, Any]]:
         """Get list of all known faces."""
         faces = []
+        counts = np.bincount(self._row_name_id, minlength=len(self._names))
         for name, metadata in self._known_metadata.items():
+            name_id = self._name_ids.get(name)
             faces.append({
                 "name": name,
                 "relationship": metadata.get('relationship'),
                 "description": metadata.get('description'),
-                "num_encodings": len(self._known_encodings.get(name, [])),
+                "num_encodings": int(counts[name_id]) if name_id is not None else 0,
                 "last_seen": metadata.get('last_seen'),
                 "times_seen": metadata.get('times_seen', 0)
             })
         return sorted(faces, key=lambda x: x['name'])
 
+    def get_known_faces_json(self) -> Tuple[int, str]:
+        """get_known_faces as (count, JSON array), serialized once per change."""
+        return self._known_listing(self.get_known_faces)
+
     def remove_face(self, name: str) -> bool:
         """Remove a known face."""
-        if name not in self._known_encodings:
+        if name not in self._name_ids:
             return False
 
         # Remove from memory
-        del self._known_encodings[name]
+        self._remove_name(name)
         if name in self._known_metadata:
             del self._known_metadata[name]
+        self._known_changed()
+        self._save_encodings()
+        self._save_face_index()
 
-        # Remove encoding file
+        # Remove any encoding file left from before the shared matrix
         encoding_file = os.path.join(self.encodings_dir, f"{name}.pkl")
         if os.path.exists(encoding_file):
             os.remove(encoding_file)
 
         # Remove from database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM known_faces WHERE name = ?", (name,))
-        cursor.execute("DELETE FROM face_sightings WHERE name = ?", (name,))
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM known_faces WHERE name = ?", (name,))
+            conn.execute("DELETE FROM face_sightings WHERE name = ?", (name,))
 
         return True
 
@@ -508,7 +1047,31 @@ class FaceRecognitionEngine:
 # PLACE RECOGNITION ENGINE
 # ================================================================================
 
-class PlaceRecognitionEngine:
+def _match_arrays(matches) -> Tuple[np.ndarray, np.ndarray]:
+    """Unpack cv2.DMatch results into (trainIdx, distance) arrays."""
+    count = len(matches)
+    train_idx = np.fromiter((m.trainIdx for m in matches), dtype=np.int64, count=count)
+    distances = np.fromiter((m.distance for m in matches), dtype=np.float32, count=count)
+    return train_idx, distances
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _count_good_matches(train_idx, distances, row_sample, n_samples, max_distance):
+        """Count matches under ``max_distance`` per stored sample."""
+        counts = np.zeros(n_samples, dtype=np.int64)
+        for i in range(train_idx.shape[0]):
+            if distances[i] < max_distance:
+                counts[row_sample[train_idx[i]]] += 1
+        return counts
+else:
+    def _count_good_matches(train_idx, distances, row_sample, n_samples, max_distance):
+        """Count matches under ``max_distance`` per stored sample."""
+        good = train_idx[distances < max_distance]
+        return np.bincount(row_sample[good], minlength=n_samples)
+
+
+class PlaceRecognitionEngine(_RecognitionStore):
     """
     Handles place/location recognition using feature matching.
 
@@ -525,10 +1088,23 @@ class PlaceRecognitionEngine:
         self._cv2 = None
         self._orb = None
         self._bf = None
+        self._use_opencl = False
+        self._features_cached = functools.lru_cache(maxsize=IMAGE_CACHE_SIZE)(
+            self._read_features
+        )
 
         self._known_places: Dict[str, Dict] = {}
+        self._rng = np.random.default_rng()
+
+        # Descriptors of every stored sample, matched against in one call
+        self._all_desc: Optional[np.ndarray] = None
+        self._row_sample: Optional[np.ndarray] = None
+        self._sample_place = np.empty(0, dtype=np.int64)
+        self._place_names: List[str] = []
+        self._bin_index = None
 
         self._init_directories()
+        self._open_connection()
         self._init_db()
         self._load_places()
 
@@ -539,8 +1115,7 @@ class PlaceRecognitionEngine:
 
     def _init_db(self):
         """Initialize the places database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS known_places (
@@ -556,17 +1131,11 @@ class PlaceRecognitionEngine:
             )
         """)
 
-        conn.commit()
-        conn.close()
-
     def _load_places(self):
         """Load known places from database."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
+        cursor = self._conn.cursor()
+        cursor.row_factory = sqlite3.Row
         rows = cursor.execute("SELECT * FROM known_places").fetchall()
-        conn.close()
 
         for row in rows:
             name = row['name']
@@ -577,29 +1146,146 @@ class PlaceRecognitionEngine:
                 'num_samples': row['num_samples'],
                 'last_seen': row['last_seen'],
                 'times_seen': row['times_seen'],
-                'features': self._load_features(name)
+                **self._load_features(name)
             }
 
-    def _load_features(self, name: str) -> List[Any]:
-        """Load stored features for a place."""
-        features_file = os.path.join(self.features_dir, f"{name}.pkl")
-        if os.path.exists(features_file):
-            try:
-                with open(features_file, 'rb') as f:
-                    return pickle.load(f)
-            except Exception as e:
-                print(f"[PLACE] Error loading features for {name}: {e}")
-        return []
+        self._rebuild_gallery()
+
+    def _rebuild_gallery(self):
+        """
+        Stack every stored sample of every place into one descriptor matrix.
 
-    def _save_features(self, name: str, features: List[Any]):
-        """Save features to disk."""
-        features_file = os.path.join(self.features_dir, f"{name}.pkl")
+        Row r belongs to sample _row_sample[r]; sample s belongs to place
+        _sample_place[s], an index into _place_names.
+        """
+        place_names = []
+        sample_place = []
+        blocks = []
+        row_sample = []
+        for name, place_data in self._known_places.items():
+            descriptors = place_data['descriptors']
+            if not len(descriptors):
+                continue
+            row_sample.append(place_data['sample_ids'] + len(sample_place))
+            sample_place.extend([len(place_names)] * (int(place_data['sample_ids'].max()) + 1))
+            place_names.append(name)
+            blocks.append(descriptors)
+
+        self._place_names = place_names
+        self._sample_place = np.asarray(sample_place, dtype=np.int64)
+        if blocks:
+            self._all_desc = np.ascontiguousarray(np.vstack(blocks), dtype=np.uint8)
+            self._row_sample = np.concatenate(row_sample).astype(np.int64)
+        else:
+            self._all_desc = None
+            self._row_sample = None
+
+        # ORB descriptors are 256-bit strings; FAISS scans them with
+        # vectorized popcount instead of BFMatcher's per-pair loop
+        self._bin_index = None
+        if FAISS_AVAILABLE and self._all_desc is not None:
+            self._bin_index = faiss.IndexBinaryFlat(self._all_desc.shape[1] * 8)
+            self._bin_index.add(self._all_desc)
+
+    def _match_gallery(self, descriptors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mutual nearest matches between query descriptors and stored rows.
+
+        Returns (rows, Hamming distances) for each query descriptor whose
+        nearest stored row also has it as its nearest query descriptor --
+        the pairs BFMatcher(crossCheck=True) keeps, on either backend.
+        """
+        if self._bin_index is not None:
+            query = np.ascontiguousarray(descriptors, dtype=np.uint8)
+            distances, rows = self._bin_index.search(query, 1)
+            rows, distances = rows[:, 0], distances[:, 0]
+
+            # Reverse search only the stored rows that were hit
+            hit_rows, inverse = np.unique(rows, return_inverse=True)
+            query_index = faiss.IndexBinaryFlat(query.shape[1] * 8)
+            query_index.add(query)
+            _, back = query_index.search(
+                np.ascontiguousarray(self._all_desc[hit_rows]), 1
+            )
+            mutual = back[inverse.reshape(-1), 0] == np.arange(len(query))
+            return rows[mutual], distances[mutual]
+        return _match_arrays(self._bf.match(descriptors, self._all_desc))
+
+    def _load_features(self, name: str) -> Dict[str, Any]:
+        """
+        Load stored features for a place.
+
+        Returns the 'descriptors', 'sample_ids' and 'seen_count' entries of
+        its place record. A legacy {name}.pkl list of per-sample arrays is
+        folded into the reservoir and rewritten as {name}.npz.
+        """
+        features = {
+            'descriptors': np.empty((0, 32), dtype=np.uint8),
+            'sample_ids': np.empty(0, dtype=np.int32),
+            'seen_count': 0
+        }
+        features_file = os.path.join(self.features_dir, f"{name}.npz")
+        legacy_file = os.path.join(self.features_dir, f"{name}.pkl")
         try:
-            with open(features_file, 'wb') as f:
-                pickle.dump(features, f)
+            if os.path.exists(features_file):
+                with np.load(features_file) as data:
+                    features['descriptors'] = data['descriptors']
+                    features['sample_ids'] = data['sample_ids']
+                    features['seen_count'] = int(data['seen_count'])
+            elif os.path.exists(legacy_file):
+                with open(legacy_file, 'rb') as f:
+                    samples = pickle.load(f)
+                for sample_id, descriptors in enumerate(samples):
+                    self._add_descriptors(features, descriptors, sample_id)
+                self._save_features(name, features)
+                os.remove(legacy_file)
+        except Exception as e:
+            print(f"[PLACE] Error loading features for {name}: {e}")
+        return features
+
+    def _save_features(self, name: str, place_data: Dict[str, Any]):
+        """Save a place's descriptor reservoir to disk."""
+        features_file = os.path.join(self.features_dir, f"{name}.npz")
+        try:
+            _replace_file(features_file, lambda f: np.savez(
+                f,
+                descriptors=place_data['descriptors'],
+                sample_ids=place_data['sample_ids'],
+                seen_count=np.int64(place_data['seen_count'])
+            ))
         except Exception as e:
             print(f"[PLACE] Error saving features for {name}: {e}")
 
+    def _add_descriptors(self, place_data: Dict[str, Any],
+                         descriptors: np.ndarray, sample_id: int):
+        """
+        Reservoir-sample one sample's descriptors into a place record.
+
+        Rows are appended until PLACE_MAX_DESCRIPTORS are stored; after
+        that the t-th descriptor ever seen replaces a random stored row
+        with probability PLACE_MAX_DESCRIPTORS / (t + 1).
+        """
+        stored = place_data['descriptors']
+        sample_ids = place_data['sample_ids']
+        seen = place_data['seen_count']
+
+        room = max(0, PLACE_MAX_DESCRIPTORS - len(stored))
+        head, tail = descriptors[:room], descriptors[room:]
+        # Concatenating copies, so the stored arrays are always writable
+        stored = np.concatenate([stored, head])
+        sample_ids = np.concatenate([sample_ids, np.full(len(head), sample_id, dtype=np.int32)])
+
+        if len(tail):
+            positions = seen + len(head) + np.arange(len(tail))
+            slots = self._rng.integers(0, positions + 1)
+            keep = slots < len(stored)
+            stored[slots[keep]] = tail[keep]
+            sample_ids[slots[keep]] = sample_id
+
+        place_data['descriptors'] = stored
+        place_data['sample_ids'] = sample_ids
+        place_data['seen_count'] = seen + len(descriptors)
+
     def _get_cv2(self):
         """Lazy load OpenCV."""
         if self._cv2 is None:
@@ -608,6 +1294,10 @@ class PlaceRecognitionEngine:
                 self._cv2 = cv2
                 self._orb = cv2.ORB_create(nfeatures=1000)
                 self._bf = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=True)
+                # OpenCV runs ORB through OpenCL when handed a UMat
+                if cv2.ocl.haveOpenCL():
+                    cv2.ocl.setUseOpenCL(True)
+                    self._use_opencl = cv2.ocl.useOpenCL()
             except ImportError:
                 raise ImportError(
                     "Place recognition requires OpenCV. "
@@ -615,6 +1305,56 @@ class PlaceRecognitionEngine:
                 )
         return self._cv2
 
+    def _detect(self, gray: np.ndarray) -> Tuple[Any, Optional[np.ndarray]]:
+        """Run ORB on a grayscale image, on the OpenCL device when one is in use."""
+        if not self._use_opencl:
+            return self._orb.detectAndCompute(gray, None)
+
+        keypoints, descriptors = self._orb.detectAndCompute(self._cv2.UMat(gray), None)
+        if descriptors is not None:
+            descriptors = descriptors.get()
+            if descriptors is None or not descriptors.size:
+                descriptors = None
+        return keypoints, descriptors
+
+    def _read_features(self, image_path: str, mtime_ns: int,
+                       size: int) -> Optional[Tuple[int, Optional[np.ndarray]]]:
+        """Extract ORB features from an image file (cached by _extract_features)."""
+        # Have the codec decode straight to grayscale
+        cv2 = self._get_cv2()
+        image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            return None
+        return self._features_from_image(image)
+
+    def _features_from_image(self, image: np.ndarray) -> Tuple[int, Optional[np.ndarray]]:
+        """Extract (keypoint count, ORB descriptors) from a BGR or grayscale image array."""
+        cv2 = self._get_cv2()
+
+        # Convert to grayscale and extract features
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        height, width = gray.shape[:2]
+        scale = ORB_MAX_IMAGE_DIM / max(height, width)
+        if scale < 1.0:
+            gray = cv2.resize(gray, (round(width * scale), round(height * scale)),
+                              interpolation=cv2.INTER_AREA)
+        keypoints, descriptors = self._detect(gray)
+        if descriptors is not None:
+            descriptors.flags.writeable = False
+        return len(keypoints), descriptors
+
+    def _extract_features(self, image_path: str) -> Optional[Tuple[int, Optional[np.ndarray]]]:
+        """
+        Return (keypoint count, ORB descriptors) for an image file.
+
+        Returns None if the image cannot be read.
+        """
+        try:
+            key = _file_key(image_path)
+        except OSError:
+            return None
+        return self._features_cached(*key)
+
     def enroll_place(self, name: str, image_path: str,
                      description: str = None,
                      typical_contents: str = None,
@@ -632,23 +1372,20 @@ class PlaceRecognitionEngine:
         Returns:
             Result dict
         """
-        cv2 = self._get_cv2()
+        self._get_cv2()
 
         try:
             # Load and process image
-            image = cv2.imread(image_path)
-            if image is None:
+            extracted = self._extract_features(image_path)
+            if extracted is None:
                 return {
                     "success": False,
                     "error": "Could not load image",
                     "name": name
                 }
 
-            # Convert to grayscale and extract features
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            keypoints, descriptors = self._orb.detectAndCompute(gray, None)
-
-            if descriptors is None or len(keypoints) < 10:
+            num_keypoints, descriptors = extracted
+            if descriptors is None or num_keypoints < 10:
                 return {
                     "success": False,
                     "error": "Not enough features detected. Try a more detailed image.",
@@ -664,12 +1401,15 @@ class PlaceRecognitionEngine:
                     'num_samples': 0,
                     'last_seen': None,
                     'times_seen': 0,
-                    'features': []
+                    'descriptors': np.empty((0, descriptors.shape[1]), dtype=np.uint8),
+                    'sample_ids': np.empty(0, dtype=np.int32),
+                    'seen_count': 0
                 }
 
-            # Add features (store descriptors as list)
-            self._known_places[name]['features'].append(descriptors)
-            self._known_places[name]['num_samples'] += 1
+            place_data = self._known_places[name]
+            self._add_descriptors(place_data, descriptors, place_data['num_samples'])
+            place_data['num_samples'] += 1
+            self._rebuild_gallery()
 
             if description:
                 self._known_places[name]['description'] = description
@@ -677,30 +1417,26 @@ class PlaceRecognitionEngine:
                 self._known_places[name]['typical_contents'] = typical_contents
             if typical_lighting:
                 self._known_places[name]['typical_lighting'] = typical_lighting
+            self._known_changed()
 
             # Save features
-            self._save_features(name, self._known_places[name]['features'])
+            self._save_features(name, self._known_places[name])
 
             # Update database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT OR REPLACE INTO known_places
-                (name, description, typical_contents, typical_lighting, num_samples, times_seen)
-                VALUES (?, ?, ?, ?, ?,
-                    COALESCE((SELECT times_seen FROM known_places WHERE name = ?), 0))
-            """, (name, description, typical_contents, typical_lighting,
-                  self._known_places[name]['num_samples'], name))
-
-            conn.commit()
-            conn.close()
+            with self._transaction() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO known_places
+                    (name, description, typical_contents, typical_lighting, num_samples, times_seen)
+                    VALUES (?, ?, ?, ?, ?,
+                        COALESCE((SELECT times_seen FROM known_places WHERE name = ?), 0))
+                """, (name, description, typical_contents, typical_lighting,
+                      self._known_places[name]['num_samples'], name))
 
             return {
                 "success": True,
                 "name": name,
                 "num_samples": self._known_places[name]['num_samples'],
-                "features_detected": len(keypoints),
+                "features_detected": num_keypoints,
                 "message": f"Enrolled {name} with {self._known_places[name]['num_samples']} sample(s)"
             }
 
@@ -723,78 +1459,93 @@ class PlaceRecognitionEngine:
         Returns:
             PlaceMatch if recognized, None otherwise
         """
-        cv2 = self._get_cv2()
+        self._get_cv2()
 
         try:
             # Load and process image
-            image = cv2.imread(image_path)
-            if image is None:
-                return None
-
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            keypoints, descriptors = self._orb.detectAndCompute(gray, None)
-
-            if descriptors is None:
+            extracted = self._extract_features(image_path)
+            if extracted is None:
                 return None
 
-            best_match = None
-            best_score = 0.0
-            best_count = 0
+            _, descriptors = extracted
+            return self._match_place(descriptors, update_seen)
 
-            # Compare against known places
-            for name, place_data in self._known_places.items():
-                features_list = place_data.get('features', [])
-                if not features_list:
-                    continue
-
-                total_matches = 0
-                samples_matched = 0
-
-                for stored_descriptors in features_list:
-                    try:
-                        matches = self._bf.match(descriptors, stored_descriptors)
-                        # Good matches (distance < 50)
-                        good_matches = [m for m in matches if m.distance < 50]
-                        total_matches += len(good_matches)
-                        if len(good_matches) > 10:
-                            samples_matched += 1
-                    except Exception:
-                        continue
-
-                if samples_matched > 0:
-                    # Calculate confidence based on matches
-                    avg_matches = total_matches / len(features_list)
-                    confidence = min(1.0, avg_matches / 100)
-
-                    if confidence > best_score and confidence > PLACE_MATCH_THRESHOLD:
-                        best_score = confidence
-                        best_count = total_matches
-                        best_match = name
-
-            if best_match:
-                place_data = self._known_places[best_match]
-
-                match = PlaceMatch(
-                    name=best_match,
-                    confidence=best_score,
-                    match_count=best_count,
-                    description=place_data.get('description'),
-                    typical_contents=place_data.get('typical_contents'),
-                    last_seen=place_data.get('last_seen'),
-                    times_seen=place_data.get('times_seen', 0) + 1
-                )
+        except Exception as e:
+            print(f"[PLACE] Recognition error: {e}")
+            return None
 
-                if update_seen:
-                    self._update_seen(best_match)
+    def recognize_place_from_array(self, image: np.ndarray,
+                                   update_seen: bool = True) -> Optional[PlaceMatch]:
+        """
+        Recognize a place in an already decoded BGR image.
 
-                return match
+        Same as recognize_place, for callers that hold the frame in memory.
+        """
+        self._get_cv2()
 
-            return None
+        try:
+            _, descriptors = self._features_from_image(image)
+            return self._match_place(descriptors, update_seen)
 
         except Exception as e:
             print(f"[PLACE] Recognition error: {e}")
             return None
 
+    def _match_place(self, descriptors: Optional[np.ndarray],
+                     update_seen: bool) -> Optional[PlaceMatch]:
+        """Score a frame's ORB descriptors against every known place."""
+        if descriptors is None or self._all_desc is None:
+            return None
+
+        best_match = None
+        best_score = 0.0
+        best_count = 0
+
+        # Match once against every stored sample of every place, then
+        # tally good matches per sample and per place from the arrays
+        train_idx, distances = self._match_gallery(descriptors)
+        per_sample = _count_good_matches(
+            train_idx, distances, self._row_sample,
+            len(self._sample_place), ORB_GOOD_MATCH_DISTANCE
+        )
+
+        n_places = len(self._place_names)
+        totals = np.bincount(self._sample_place, weights=per_sample, minlength=n_places)
+        samples_matched = np.bincount(
+            self._sample_place, weights=per_sample > PLACE_SAMPLE_MIN_MATCHES,
+            minlength=n_places
+        )
+
+        # Each query feature matches at most once across all stored
+        # samples, so the total is already per-frame
+        confidences = np.minimum(1.0, totals / 100)
+        confidences[samples_matched == 0] = 0.0
+        best = int(confidences.argmax())
+        if confidences[best] > PLACE_MATCH_THRESHOLD:
+            best_match = self._place_names[best]
+            best_score = float(confidences[best])
+            best_count = int(totals[best])
+
+        if best_match:
+            place_data = self._known_places[best_match]
+
+            match = PlaceMatch(
+                name=best_match,
+                confidence=best_score,
+                match_count=best_count,
+                description=place_data.get('description'),
+                typical_contents=place_data.get('typical_contents'),
+                last_seen=place_data.get('last_seen'),
+                times_seen=place_data.get('times_seen', 0) + 1
+            )
+
+            if update_seen:
+                self._update_seen(best_match)
+
+            return match
+
+        return None
+
     def _update_seen(self, name: str):
         """Update last seen timestamp for a place."""
         now = datetime.datetime.now().isoformat()
@@ -803,18 +1554,10 @@ class PlaceRecognitionEngine:
             self._known_places[name]['last_seen'] = now
             self._known_places[name]['times_seen'] = \
                 self._known_places[name].get('times_seen', 0) + 1
+            self._known_changed()
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            UPDATE known_places
-            SET last_seen = ?, times_seen = times_seen + 1
-            WHERE name = ?
-        """, (now, name))
-
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            conn.execute(_SQL_PLACE_SEEN, (now, name))
 
     def get_known_places(self) -> List[Dict[str, Any]]:
         """Get list of all known places."""
@@ -830,11 +1573,117 @@ class PlaceRecognitionEngine:
             })
         return sorted(places, key=lambda x: x['name'])
 
+    def get_known_places_json(self) -> Tuple[int, str]:
+        """get_known_places as (count, JSON array), serialized once per change."""
+        return self._known_listing(self.get_known_places)
+
 
 # ================================================================================
 # UNIFIED RECOGNITION MANAGER
 # ================================================================================
 
+def _dhash(cv2, gray: np.ndarray) -> int:
+    """64-bit difference hash of a grayscale frame, as a signed SQLite integer."""
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = np.packbits(small[:, 1:] > small[:, :-1])
+    return int(bits.view('>i8')[0])
+
+
+def _popcount64(values: np.ndarray) -> np.ndarray:
+    """Set bits in each int64."""
+    if hasattr(np, 'bitwise_count'):
+        # Unsigned view: bitwise_count counts |x| for signed integers
+        return np.bitwise_count(values.view(np.uint64))
+    return np.unpackbits(values.view(np.uint8)).reshape(-1, 64).sum(axis=1)
+
+
+def _result_from_dict(data: Dict[str, Any]) -> RecognitionResult:
+    """Rebuild a RecognitionResult from its to_dict() form."""
+    faces = [FaceMatch(**{**face, 'location': tuple(face['location'])})
+             for face in data['faces']]
+    place = PlaceMatch(**data['place']) if data['place'] else None
+    return RecognitionResult(faces=faces, place=place,
+                             unknown_faces=data['unknown_faces'],
+                             image_hash=data['image_hash'])
+
+
+class _PerceptualCache(_RecognitionStore):
+    """
+    Recent analyze_image results keyed by a perceptual hash of the frame.
+
+    Only the place match of a hit is reused; see PERCEPTUAL_CACHE_MAX_BITS.
+
+    Entries live in memory for lookup and in SQLite so a restarted process
+    can still reuse results from the last PERCEPTUAL_CACHE_TTL seconds.
+    """
+
+    def __init__(self, db_path: str = RECOGNITION_DB):
+        self.db_path = db_path
+        self._entries_lock = threading.Lock()
+        self._hashes = np.empty(0, dtype=np.int64)
+        self._created = np.empty(0, dtype=np.float64)
+        self._results: List[RecognitionResult] = []
+
+        self._open_connection()
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS result_cache (
+                    phash INTEGER NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.execute("DELETE FROM result_cache WHERE created_at < ?",
+                         (time.time() - PERCEPTUAL_CACHE_TTL,))
+            rows = conn.execute(
+                "SELECT phash, result, created_at FROM result_cache "
+                "ORDER BY created_at DESC LIMIT ?", (RESULT_CACHE_SIZE,)
+            ).fetchall()
+
+        for phash, result, created_at in reversed(rows):
+            try:
+                self._append(phash, _result_from_dict(json.loads(result)), created_at)
+            except Exception as e:
+                print(f"[RECOGNITION] Skipping cached result: {e}")
+
+    def _append(self, phash: int, result: RecognitionResult, created_at: float):
+        self._hashes = np.append(self._hashes, np.int64(phash))[-RESULT_CACHE_SIZE:]
+        self._created = np.append(self._created, created_at)[-RESULT_CACHE_SIZE:]
+        self._results = (self._results + [result])[-RESULT_CACHE_SIZE:]
+
+    def lookup(self, phash: int) -> Optional[RecognitionResult]:
+        """Return a copy of the newest live result for a similar frame, or None."""
+        with self._entries_lock:
+            if not len(self._hashes):
+                return None
+            distances = _popcount64(self._hashes ^ np.int64(phash))
+            live = self._created >= time.time() - PERCEPTUAL_CACHE_TTL
+            hits = np.flatnonzero(live & (distances <= PERCEPTUAL_CACHE_MAX_BITS))
+            if not len(hits):
+                return None
+            return copy.deepcopy(self._results[hits[-1]])
+
+    def add(self, phash: int, result: RecognitionResult):
+        """Remember a frame's result under its perceptual hash."""
+        now = time.time()
+        with self._entries_lock:
+            self._append(phash, copy.deepcopy(result), now)
+        with self._transaction() as conn:
+            conn.execute("INSERT INTO result_cache (phash, result, created_at) VALUES (?, ?, ?)",
+                         (phash, _dumps(result.to_dict()), now))
+            conn.execute("DELETE FROM result_cache WHERE created_at < ?",
+                         (now - PERCEPTUAL_CACHE_TTL,))
+
+    def clear(self):
+        """Forget every cached result."""
+        with self._entries_lock:
+            self._hashes = self._hashes[:0]
+            self._created = self._created[:0]
+            self._results = []
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM result_cache")
+
+
 class RecognitionManager:
     """
     Unified manager for face and place recognition.
@@ -845,53 +1694,178 @@ class RecognitionManager:
     def __init__(self):
         self.face_engine = FaceRecognitionEngine()
         self.place_engine = PlaceRecognitionEngine()
+        # dlib, OpenCV and hashlib release the GIL in their native code, so
+        # hashing, face and place recognition of one frame overlap
+        self._pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="recognition")
+        self._io_pool = ThreadPoolExecutor(max_workers=ANALYZE_IO_WORKERS,
+                                           thread_name_prefix="recognition-io")
+        self._result_cache: "collections.OrderedDict[Tuple[str, int, int], RecognitionResult]" = \
+            collections.OrderedDict()
+        self._result_lock = threading.Lock()
+        self._similar_results = _PerceptualCache()
+
+    def _cached_result(self, key: Tuple[str, int, int]) -> Optional[RecognitionResult]:
+        """Return a copy of the cached result for a frame, or None."""
+        with self._result_lock:
+            cached = self._result_cache.get(key)
+            if cached is None:
+                return None
+            self._result_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
+    def _cache_result(self, key: Tuple[str, int, int], result: RecognitionResult):
+        """Remember a frame's result, evicting the least recently used."""
+        with self._result_lock:
+            self._result_cache[key] = copy.deepcopy(result)
+            self._result_cache.move_to_end(key)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def _clear_results(self):
+        """Drop cached results after the known people or places change."""
+        with self._result_lock:
+            self._result_cache.clear()
+        self._similar_results.clear()
+
+    def _decode(self, image_path: str) -> Optional[np.ndarray]:
+        """Decode a frame once for both engines; None without OpenCV or on a bad file."""
+        try:
+            cv2 = self.place_engine._get_cv2()
+        except ImportError:
+            return None
+        return cv2.imread(image_path)
+
+    def _prefetch(self, image_path: str) -> Optional[np.ndarray]:
+        """Hash a frame into the shared hash cache and decode it."""
+        _hash_image(image_path)
+        return self._decode(image_path)
 
     def analyze_image(self, image_path: str) -> RecognitionResult:
         """
         Perform complete recognition analysis on an image.
 
         Returns faces recognized, place recognized, and unknown face count.
+        A frame analyzed recently (same path, mtime and size) is answered
+        from cache without logging its sightings again. One that looks
+        nearly the same as a frame analyzed in the last PERCEPTUAL_CACHE_TTL
+        seconds reuses that frame's place match; its faces are still
+        recognized.
         """
-        import time
-        start_time = time.time()
+        return self._analyze(image_path)
 
-        result = RecognitionResult()
+    def analyze_images(self, image_paths: Iterable[str]) -> Iterator[RecognitionResult]:
+        """
+        Analyze a sequence of images, yielding results in input order.
+
+        Reading, hashing and decoding of the next ANALYZE_PREFETCH frames
+        overlap recognition of the current one; the bounded lookahead keeps
+        at most that many decoded frames in memory.
+        """
+        paths = iter(image_paths)
+        pending = collections.deque(
+            (path, self._io_pool.submit(self._prefetch, path))
+            for path in itertools.islice(paths, ANALYZE_PREFETCH)
+        )
+        while pending:
+            path, decoded = pending.popleft()
+            for next_path in itertools.islice(paths, 1):
+                pending.append((next_path, self._io_pool.submit(self._prefetch, next_path)))
+            yield self._analyze(path, decoded)
+
+    def _analyze(self, image_path: str,
+                 decoded: Optional[Future] = None) -> RecognitionResult:
+        """analyze_image, optionally with the frame already being decoded."""
+        start_time = time.perf_counter()
 
-        # Calculate image hash
         try:
-            with open(image_path, 'rb') as f:
-                result.image_hash = hashlib.md5(f.read()).hexdigest()[:16]
-        except Exception:
-            pass
+            cache_key = _file_key(image_path)
+        except OSError:
+            cache_key = None
+        if cache_key is not None:
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                cached.processing_time = time.perf_counter() - start_time
+                return cached
 
-        # Recognize faces
+        result = RecognitionResult()
+        cacheable = cache_key is not None
+        phash = None
+        similar = None
+        place_future = None
+
+        # Hash alongside recognition; sightings are logged under it once
+        # both are done
+        hash_future = self._pool.submit(_hash_image, image_path)
+
+        # Decode once and run both engines on the same pixels; fall back to
+        # letting each engine load the file itself
+        image = decoded.result() if decoded is not None else self._decode(image_path)
+        if image is not None:
+            # The place engine takes the grayscale frame; the BGR buffer is
+            # then flipped to RGB in place for dlib rather than copied
+            cv2 = self.place_engine._cv2
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            phash = _dhash(cv2, gray)
+            similar = self._similar_results.lookup(phash)
+            if similar is not None:
+                result.place = similar.place
+                place_data = (
+                    self.place_engine._known_places.get(result.place.name)
+                    if result.place is not None else None
+                )
+                if place_data is not None:
+                    # Still a sighting: report and advance the stored counters
+                    # as recognize_place_from_array does
+                    result.place.last_seen = place_data.get('last_seen')
+                    result.place.times_seen = place_data.get('times_seen', 0) + 1
+                    self.place_engine._update_seen(result.place.name)
+            else:
+                place_future = self._pool.submit(
+                    self.place_engine.recognize_place_from_array, gray
+                )
+            cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+            face_future = self._pool.submit(
+                self.face_engine._recognize_array, image, False, None
+            )
+        else:
+            face_future = self._pool.submit(
+                self.face_engine._recognize_file, image_path, False, None
+            )
+            place_future = self._pool.submit(self.place_engine.recognize_place, image_path)
+
+        result.image_hash = hash_future.result()
+
+        # Recognize faces; every detected face that did not match is unknown
         try:
-            faces = self.face_engine.recognize_faces(image_path)
+            faces, num_detected = face_future.result()
             result.faces = faces
+            result.unknown_faces = num_detected - len(faces)
+            if faces:
+                self.face_engine._record_sightings(
+                    [(f.name, f.confidence) for f in faces], result.image_hash
+                )
         except ImportError as e:
             print(f"[RECOGNITION] Face recognition not available: {e}")
         except Exception as e:
             print(f"[RECOGNITION] Face recognition error: {e}")
+            cacheable = False
 
-        # Count unknown faces
-        try:
-            import face_recognition
-            image = face_recognition.load_image_file(image_path)
-            face_locations = face_recognition.face_locations(image)
-            result.unknown_faces = len(face_locations) - len(result.faces)
-        except Exception:
-            pass
-
-        # Recognize place
-        try:
-            place = self.place_engine.recognize_place(image_path)
-            result.place = place
-        except ImportError as e:
-            print(f"[RECOGNITION] Place recognition not available: {e}")
-        except Exception as e:
-            print(f"[RECOGNITION] Place recognition error: {e}")
+        # Recognize place, unless a near-identical frame already did
+        if place_future is not None:
+            try:
+                place = place_future.result()
+                result.place = place
+            except ImportError as e:
+                print(f"[RECOGNITION] Place recognition not available: {e}")
+            except Exception as e:
+                print(f"[RECOGNITION] Place recognition error: {e}")
+                cacheable = False
 
-        result.processing_time = time.time() - start_time
+        result.processing_time = time.perf_counter() - start_time
+        if cacheable:
+            self._cache_result(cache_key, result)
+        if phash is not None and similar is None and cacheable:
+            self._similar_results.add(phash, result)
 
         return result
 
@@ -899,17 +1873,21 @@ class RecognitionManager:
                       relationship: str = None,
                       description: str = None) -> Dict[str, Any]:
         """Enroll a new person for face recognition."""
-        return self.face_engine.enroll_face(
+        result = self.face_engine.enroll_face(
             name, image_path, relationship, description
         )
+        self._clear_results()
+        return result
 
     def enroll_place(self, name: str, image_path: str,
                      description: str = None,
                      typical_contents: str = None) -> Dict[str, Any]:
         """Enroll a new place for recognition."""
-        return self.place_engine.enroll_place(
+        result = self.place_engine.enroll_place(
             name, image_path, description, typical_contents
         )
+        self._clear_results()
+        return result
 
     def get_known_people(self) -> List[Dict[str, Any]]:
         """Get list of all known people."""
@@ -919,9 +1897,19 @@ class RecognitionManager:
         """Get list of all known places."""
         return self.place_engine.get_known_places()
 
+    def get_known_people_json(self) -> Tuple[int, str]:
+        """Known people as (count, JSON array), cached until they change."""
+        return self.face_engine.get_known_faces_json()
+
+    def get_known_places_json(self) -> Tuple[int, str]:
+        """Known places as (count, JSON array), cached until they change."""
+        return self.place_engine.get_known_places_json()
+
     def forget_person(self, name: str) -> bool:
         """Remove a person from recognition."""
-        return self.face_engine.remove_face(name)
+        result = self.face_engine.remove_face(name)
+        self._clear_results()
+        return result
 
 
 # ================================================================================
@@ -929,14 +1917,21 @@ class RecognitionManager:
 # ================================================================================
 
 _recognition_manager: Optional[RecognitionManager] = None
+_recognition_manager_lock = threading.Lock()
 
 
 def get_recognition_manager() -> RecognitionManager:
-    """Get or create the global recognition manager."""
+    """Get or create the global recognition manager (safe to call from any thread)."""
     global _recognition_manager
-    if _recognition_manager is None:
-        _recognition_manager = RecognitionManager()
-    return _recognition_manager
+    manager = _recognition_manager
+    if manager is None:
+        # Checked again under the lock so racing callers build only one
+        # manager (and one set of engines and database connections)
+        with _recognition_manager_lock:
+            if _recognition_manager is None:
+                _recognition_manager = RecognitionManager()
+            manager = _recognition_manager
+    return manager
 
 
 # ================================================================================
@@ -952,7 +1947,7 @@ def recognize_image(image_path: str) -> str:
     manager = get_recognition_manager()
     result = manager.analyze_image(image_path)
 
-    return json.dumps({
+    return _dumps({
         "success": True,
         **result.to_dict()
     })
@@ -964,7 +1959,7 @@ def enroll_person(name: str, image_path: str,
     """Enroll a person for face recognition."""
     manager = get_recognition_manager()
     result = manager.enroll_person(name, image_path, relationship, description)
-    return json.dumps(result)
+    return _dumps(result)
 
 
 def enroll_place(name: str, image_path: str,
@@ -973,46 +1968,74 @@ def enroll_place(name: str, image_path: str,
     """Enroll a place for recognition."""
     manager = get_recognition_manager()
     result = manager.enroll_place(name, image_path, description, typical_contents)
-    return json.dumps(result)
+    return _dumps(result)
 
 
 def list_known_people() -> str:
     """List all known people."""
     manager = get_recognition_manager()
-    people = manager.get_known_people()
-    return json.dumps({
-        "success": True,
-        "count": len(people),
-        "people": people
-    })
+    # The listing comes pre-serialized; only the envelope is added here
+    count, people = manager.get_known_people_json()
+    return f'{{"success": true, "count": {count}, "people": {people}}}'
 
 
 def list_known_places() -> str:
     """List all known places."""
     manager = get_recognition_manager()
-    places = manager.get_known_places()
-    return json.dumps({
-        "success": True,
-        "count": len(places),
-        "places": places
-    })
+    count, places = manager.get_known_places_json()
+    return f'{{"success": true, "count": {count}, "places": {places}}}'
 
 
 def forget_person(name: str) -> str:
     """Remove a person from recognition."""
     manager = get_recognition_manager()
     if manager.forget_person(name):
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Removed {name} from face recognition"
         })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Person not found: {name}"
         })
 
 
+# Canonical action names reported back for unknown actions
+_AVAILABLE_ACTIONS = [
+    "recognize", "enroll_person", "enroll_place",
+    "list_people", "list_places", "forget_person"
+]
+
+# Action aliases -> handler taking the raw params dict
+_ACTIONS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    alias: handler
+    for aliases, handler in (
+        (('recognize', 'analyze', 'identify'),
+         lambda p: recognize_image(p.get('image_path', ''))),
+        (('enroll_person', 'learn_person', 'add_person', 'remember_person'),
+         lambda p: enroll_person(
+             name=p.get('name', ''),
+             image_path=p.get('image_path', ''),
+             relationship=p.get('relationship'),
+             description=p.get('description')
+         )),
+        (('enroll_place', 'learn_place', 'add_place', 'remember_place'),
+         lambda p: enroll_place(
+             name=p.get('name', ''),
+             image_path=p.get('image_path', ''),
+             description=p.get('description'),
+             typical_contents=p.get('typical_contents')
+         )),
+        (('list_people', 'known_people', 'who_do_i_know'), lambda p: list_known_people()),
+        (('list_places', 'known_places', 'where_do_i_know'), lambda p: list_known_places()),
+        (('forget_person', 'remove_person', 'delete_person'),
+         lambda p: forget_person(p.get('name', ''))),
+    )
+    for alias in aliases
+}
+
+
 def execute_recognition_command(action: str, params: Dict[str, Any] = None) -> str:
     """
     Execute a recognition command.
@@ -1028,45 +2051,14 @@ def execute_recognition_command(action: str, params: Dict[str, Any] = None) -> s
     if params is None:
         params = {}
 
-    action_lower = action.lower().strip()
-
-    if action_lower in ['recognize', 'analyze', 'identify']:
-        return recognize_image(params.get('image_path', ''))
-
-    elif action_lower in ['enroll_person', 'learn_person', 'add_person', 'remember_person']:
-        return enroll_person(
-            name=params.get('name', ''),
-            image_path=params.get('image_path', ''),
-            relationship=params.get('relationship'),
-            description=params.get('description')
-        )
-
-    elif action_lower in ['enroll_place', 'learn_place', 'add_place', 'remember_place']:
-        return enroll_place(
-            name=params.get('name', ''),
-            image_path=params.get('image_path', ''),
-            description=params.get('description'),
-            typical_contents=params.get('typical_contents')
-        )
-
-    elif action_lower in ['list_people', 'known_people', 'who_do_i_know']:
-        return list_known_people()
-
-    elif action_lower in ['list_places', 'known_places', 'where_do_i_know']:
-        return list_known_places()
-
-    elif action_lower in ['forget_person', 'remove_person', 'delete_person']:
-        return forget_person(params.get('name', ''))
-
-    else:
-        return json.dumps({
+    handler = _ACTIONS.get(action.lower().strip())
+    if handler is None:
+        return _dumps({
             "success": False,
             "error": f"Unknown recognition action: {action}",
-            "available_actions": [
-                "recognize", "enroll_person", "enroll_place",
-                "list_people", "list_places", "forget_person"
-            ]
+            "available_actions": _AVAILABLE_ACTIONS
         })
+    return handler(params)
 
 
 __all__ = [
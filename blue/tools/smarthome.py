@@ -13,18 +13,27 @@ Supports:
 
 from __future__ import annotations
 
+import contextlib
 import datetime
-import json
+import logging
 import os
 import re
+import selectors
 import socket
 import sqlite3
 import threading
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+
+from ..utils import DATACLASS_SLOTS, json_dumps as _dumps, json_loads as _loads
+
+logger = logging.getLogger("blue.smarthome")
 
 # ================================================================================
 # CONFIGURATION
@@ -32,6 +41,13 @@ import requests
 
 SMARTHOME_DB = os.environ.get("BLUE_SMARTHOME_DB", "data/smarthome.db")
 DEVICE_SCAN_TIMEOUT = 3  # seconds
+SSDP_PROBES = 3  # M-SEARCH retransmissions (UDP is lossy)
+SSDP_PROBE_INTERVAL = 0.1  # seconds between probes
+SSDP_MX = 2  # max seconds a device may wait before replying (M-SEARCH MX)
+SSDP_REPLY_MARGIN = 0.3  # extra listening time after MX for network delay
+SSDP_IDLE_TIMEOUT = 0.5  # after MX, stop listening this long after the last reply
+HUE_REFRESH_WORKERS = 8  # concurrent status requests to the Hue bridge
+DISCOVERY_JOB_HISTORY = 16  # finished background discovery jobs to keep
 
 
 class DeviceType(Enum):
@@ -52,11 +68,22 @@ class DeviceStatus(Enum):
     UNKNOWN = "unknown"
 
 
+# SSDP replies are matched as raw bytes so packets are only decoded when kept
+_SSDP_SERVER_RE = re.compile(rb'SERVER:\s*(.+)', re.I)
+_SSDP_HUE_RE = re.compile(rb'philips-hue', re.I)
+_SSDP_VENDORS = [
+    (re.compile(rb'samsung', re.I), DeviceType.TV, "Samsung"),
+    (re.compile(rb'roku', re.I), DeviceType.TV, "Roku"),
+    (re.compile(rb'sonos', re.I), DeviceType.SPEAKER, "Sonos"),
+]
+
+
 # ================================================================================
 # DATA CLASSES
 # ================================================================================
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class SmartDevice:
     """Represents a smart home device."""
     id: str
@@ -72,24 +99,37 @@ class SmartDevice:
     state: Dict[str, Any] = field(default_factory=dict)
     last_seen: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # to_dict() result, dropped whenever a field is reassigned
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name != '_dict_cache':
+            object.__setattr__(self, '_dict_cache', None)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "type": self.device_type.value,
-            "manufacturer": self.manufacturer,
-            "model": self.model,
-            "ip_address": self.ip_address,
-            "status": self.status.value,
-            "room": self.room,
-            "capabilities": self.capabilities,
-            "state": self.state,
-            "last_seen": self.last_seen
-        }
+        # state and capabilities are shared, so in-place updates show up
+        # without invalidating; callers get a copy of the top level
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "id": self.id,
+                "name": self.name,
+                "type": self.device_type.value,
+                "manufacturer": self.manufacturer,
+                "model": self.model,
+                "ip_address": self.ip_address,
+                "status": self.status.value,
+                "room": self.room,
+                "capabilities": self.capabilities,
+                "state": self.state,
+                "last_seen": self.last_seen
+            }
+        return dict(self._dict_cache)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Scene:
     """A scene that controls multiple devices."""
     id: str
@@ -110,7 +150,7 @@ class Scene:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Routine:
     """An automated routine with triggers and actions."""
     id: str
@@ -154,76 +194,145 @@ class SmartHomeManager:
         self._routine_thread: Optional[threading.Thread] = None
         self._running = False
 
+        # Guards the device tables, their indexes and the status cache,
+        # which background discovery updates while requests read them
+        self._devices_lock = threading.RLock()
+
+        # Lowercase name -> device id, plus a substring-match cache that is
+        # only valid for the _devices_version it was filled at
+        self._name_index: Dict[str, str] = {}
+        self._devices_version = 0
+        self._name_matches: Dict[str, Optional[str]] = {}
+        self._name_matches_version = 0
+
+        # Secondary indexes: device type / lowercase room -> device ids
+        self._by_type: Dict[DeviceType, List[str]] = defaultdict(list)
+        self._by_room: Dict[str, List[str]] = defaultdict(list)
+
+        # get_home_status() result, rebuilt only after a state change
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_dirty = True
+
+        # Background discovery runs on a single worker so jobs never race
+        # each other while updating the device tables
+        self._discovery_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="smarthome-discovery")
+        self._discovery_jobs: Dict[str, Dict[str, Any]] = {}
+        self._discovery_lock = threading.Lock()
+
+        # Shared HTTP session keeps connections to the Hue bridge alive; the
+        # pool is sized so concurrent refreshes never open throwaway sockets
+        self._http = requests.Session()
+        self._http.mount('http://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=max(16, HUE_REFRESH_WORKERS)))
+
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # One long-lived connection avoids reopening the database for every
+        # small write; the lock serializes access from multiple threads.
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self._configure_connection()
+
         self._init_db()
         self._load_data()
         self._load_hue_config()
 
+    def _configure_connection(self):
+        """Apply performance PRAGMAs to the shared connection."""
+        cursor = self._conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-20000")
+
+    @contextlib.contextmanager
+    def _transaction(self, begin: str = "BEGIN"):
+        """Run a write transaction on the shared connection; rolls back on error."""
+        with self._db_lock:
+            with self._conn:
+                self._conn.execute(begin)
+                yield self._conn
+
+    def close(self):
+        """Close the shared database connection and HTTP session."""
+        self._discovery_executor.shutdown(wait=False)
+        self._http.close()
+        with self._db_lock:
+            self._conn.close()
+
     def _init_db(self):
         """Initialize the database."""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS devices (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                device_type TEXT NOT NULL,
-                manufacturer TEXT,
-                model TEXT,
-                ip_address TEXT,
-                mac_address TEXT,
-                room TEXT,
-                capabilities TEXT,
-                metadata TEXT,
-                last_seen TIMESTAMP
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS scenes (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                description TEXT,
-                actions TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_used TIMESTAMP
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS routines (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                description TEXT,
-                trigger_type TEXT NOT NULL,
-                trigger_config TEXT NOT NULL,
-                actions TEXT NOT NULL,
-                enabled INTEGER DEFAULT 1,
-                last_triggered TIMESTAMP
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS device_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                device_id TEXT NOT NULL,
-                state TEXT NOT NULL,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS devices (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    device_type TEXT NOT NULL,
+                    manufacturer TEXT,
+                    model TEXT,
+                    ip_address TEXT,
+                    mac_address TEXT,
+                    room TEXT,
+                    capabilities TEXT,
+                    metadata TEXT,
+                    last_seen TIMESTAMP
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS scenes (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    description TEXT,
+                    actions TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_used TIMESTAMP
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS routines (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    description TEXT,
+                    trigger_type TEXT NOT NULL,
+                    trigger_config TEXT NOT NULL,
+                    actions TEXT NOT NULL,
+                    enabled INTEGER DEFAULT 1,
+                    last_triggered TIMESTAMP
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS device_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    device_id TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
 
-        conn.commit()
-        conn.close()
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_devices_type ON devices(device_type)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_devices_room ON devices(room)")
 
     def _load_data(self):
         """Load devices, scenes, and routines from database."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            devices = cursor.execute("SELECT * FROM devices").fetchall()
+            scenes = cursor.execute("SELECT * FROM scenes").fetchall()
+            routines = cursor.execute("SELECT * FROM routines").fetchall()
 
         # Load devices
-        for row in cursor.execute("SELECT * FROM devices").fetchall():
+        for row in devices:
             device = SmartDevice(
                 id=row['id'],
                 name=row['name'],
@@ -233,40 +342,38 @@ class SmartHomeManager:
                 ip_address=row['ip_address'],
                 mac_address=row['mac_address'],
                 room=row['room'],
-                capabilities=json.loads(row['capabilities'] or "[]"),
-                metadata=json.loads(row['metadata'] or "{}"),
+                capabilities=_loads(row['capabilities'] or "[]"),
+                metadata=_loads(row['metadata'] or "{}"),
                 last_seen=row['last_seen']
             )
-            self.devices[device.id] = device
+            self._add_device(device)
 
         # Load scenes
-        for row in cursor.execute("SELECT * FROM scenes").fetchall():
+        for row in scenes:
             scene = Scene(
                 id=row['id'],
                 name=row['name'],
                 description=row['description'],
-                actions=json.loads(row['actions']),
+                actions=_loads(row['actions']),
                 created_at=row['created_at'],
                 last_used=row['last_used']
             )
             self.scenes[scene.id] = scene
 
         # Load routines
-        for row in cursor.execute("SELECT * FROM routines").fetchall():
+        for row in routines:
             routine = Routine(
                 id=row['id'],
                 name=row['name'],
                 description=row['description'],
                 trigger_type=row['trigger_type'],
-                trigger_config=json.loads(row['trigger_config']),
-                actions=json.loads(row['actions']),
+                trigger_config=_loads(row['trigger_config']),
+                actions=_loads(row['actions']),
                 enabled=bool(row['enabled']),
                 last_triggered=row['last_triggered']
             )
             self.routines[routine.id] = routine
 
-        conn.close()
-
     def _load_hue_config(self):
         """Load Philips Hue configuration."""
         try:
@@ -278,25 +385,32 @@ class SmartHomeManager:
 
     def _save_device(self, device: SmartDevice):
         """Save a device to database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO devices
-            (id, name, device_type, manufacturer, model, ip_address, mac_address,
-             room, capabilities, metadata, last_seen)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            device.id, device.name, device.device_type.value,
-            device.manufacturer, device.model, device.ip_address,
-            device.mac_address, device.room,
-            json.dumps(device.capabilities),
-            json.dumps(device.metadata),
-            device.last_seen
-        ))
-
-        conn.commit()
-        conn.close()
+        self._save_devices([device])
+
+    def _save_devices(self, devices: List[SmartDevice]):
+        """Save several devices in a single transaction."""
+        if not devices:
+            return
+        rows = [
+            (
+                device.id, device.name, device.device_type.value,
+                device.manufacturer, device.model, device.ip_address,
+                device.mac_address, device.room,
+                _dumps(device.capabilities),
+                _dumps(device.metadata),
+                device.last_seen
+            )
+            for device in devices
+        ]
+        with self._devices_lock:
+            self._status_dirty = True
+        with self._transaction("BEGIN IMMEDIATE") as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO devices
+                (id, name, device_type, manufacturer, model, ip_address, mac_address,
+                 room, capabilities, metadata, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
 
     # ==================== DEVICE DISCOVERY ====================
 
@@ -309,7 +423,7 @@ class SmartHomeManager:
 
         try:
             url = f"http://{self._hue_bridge_ip}/api/{self._hue_username}/lights"
-            response = requests.get(url, timeout=5)
+            response = self._http.get(url, timeout=5)
             lights = response.json()
 
             for light_id, light_data in lights.items():
@@ -327,12 +441,13 @@ class SmartHomeManager:
                     metadata={'hue_id': light_id, 'type': light_data.get('type')}
                 )
 
-                self.devices[device_id] = device
-                self._save_device(device)
+                self._add_device(device)
                 discovered.append(device)
 
+            self._save_devices(discovered)
+
         except Exception as e:
-            print(f"[SMARTHOME] Hue discovery error: {e}")
+            logger.warning("Hue discovery error: %s", e)
 
         return discovered
 
@@ -348,25 +463,13 @@ class SmartHomeManager:
             'M-SEARCH * HTTP/1.1\r\n'
             'HOST: 239.255.255.250:1900\r\n'
             'MAN: "ssdp:discover"\r\n'
-            'MX: 2\r\n'
+            f'MX: {SSDP_MX}\r\n'
             'ST: ssdp:all\r\n'
             '\r\n'
         )
 
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(DEVICE_SCAN_TIMEOUT)
-            sock.sendto(ssdp_request.encode(), ('239.255.255.250', 1900))
-
-            responses = []
-            try:
-                while True:
-                    data, addr = sock.recvfrom(1024)
-                    responses.append((data.decode(), addr))
-            except socket.timeout:
-                pass
-            finally:
-                sock.close()
+            responses = self._ssdp_search(ssdp_request.encode())
 
             # Parse responses
             seen_ips = set()
@@ -381,23 +484,20 @@ class SmartHomeManager:
                 name = f"Device at {ip}"
                 manufacturer = "Unknown"
 
-                if 'samsung' in response.lower():
-                    device_type = DeviceType.TV
-                    manufacturer = "Samsung"
-                elif 'roku' in response.lower():
-                    device_type = DeviceType.TV
-                    manufacturer = "Roku"
-                elif 'sonos' in response.lower():
-                    device_type = DeviceType.SPEAKER
-                    manufacturer = "Sonos"
-                elif 'philips-hue' in response.lower():
-                    # Skip - we discover these separately
-                    continue
+                for pattern, vendor_type, vendor in _SSDP_VENDORS:
+                    if pattern.search(response):
+                        device_type = vendor_type
+                        manufacturer = vendor
+                        break
+                else:
+                    if _SSDP_HUE_RE.search(response):
+                        # Skip - we discover these separately
+                        continue
 
                 # Extract server/model info
-                server_match = re.search(r'SERVER:\s*(.+)', response, re.I)
+                server_match = _SSDP_SERVER_RE.search(response)
                 if server_match:
-                    name = server_match.group(1).strip()[:50]
+                    name = server_match.group(1).strip().decode(errors='replace')[:50]
 
                 device_id = f"ssdp_{ip.replace('.', '_')}"
                 device = SmartDevice(
@@ -408,18 +508,75 @@ class SmartHomeManager:
                     ip_address=ip,
                     status=DeviceStatus.ONLINE,
                     last_seen=datetime.datetime.now().isoformat(),
-                    metadata={'discovery': 'ssdp', 'raw_response': response[:500]}
+                    metadata={'discovery': 'ssdp', 'raw_response': response[:500].decode(errors='replace')}
                 )
 
-                self.devices[device_id] = device
-                self._save_device(device)
+                self._add_device(device)
                 discovered.append(device)
 
+            self._save_devices(discovered)
+
         except Exception as e:
-            print(f"[SMARTHOME] SSDP discovery error: {e}")
+            logger.warning("SSDP discovery error: %s", e)
 
         return discovered
 
+    def _ssdp_search(self, request: bytes) -> List[Tuple[bytes, Tuple[str, int]]]:
+        """
+        Send SSDP probes and collect replies until the network goes quiet.
+
+        Devices delay their reply by up to MX seconds, so listening always
+        continues until SSDP_MX + SSDP_REPLY_MARGIN after the last probe.
+        After that, it stops once no packet has arrived for
+        SSDP_IDLE_TIMEOUT. DEVICE_SCAN_TIMEOUT is the hard limit.
+        """
+        responses = []
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        sel = selectors.DefaultSelector()
+        sel.register(sock, selectors.EVENT_READ)
+        try:
+            now = time.monotonic()
+            deadline = now + DEVICE_SCAN_TIMEOUT
+            probes_sent = 0
+            next_probe = now
+            stop_at = deadline
+
+            while True:
+                now = time.monotonic()
+                if probes_sent < SSDP_PROBES and now >= next_probe:
+                    sock.sendto(request, ('239.255.255.250', 1900))
+                    probes_sent += 1
+                    next_probe = now + SSDP_PROBE_INTERVAL
+                    if probes_sent == SSDP_PROBES:
+                        reply_window = now + SSDP_MX + SSDP_REPLY_MARGIN
+                        stop_at = min(deadline, reply_window)
+
+                wake = stop_at
+                if probes_sent < SSDP_PROBES:
+                    wake = min(wake, next_probe)
+                if now >= wake and probes_sent == SSDP_PROBES:
+                    break
+
+                if not sel.select(timeout=max(0.0, wake - now)):
+                    continue
+
+                # Drain everything that is queued before waiting again
+                while True:
+                    try:
+                        data, addr = sock.recvfrom(1024)
+                    except (BlockingIOError, InterruptedError):
+                        break
+                    responses.append((data, addr))
+                if probes_sent == SSDP_PROBES:
+                    idle_until = time.monotonic() + SSDP_IDLE_TIMEOUT
+                    stop_at = min(deadline, max(reply_window, idle_until))
+        finally:
+            sel.close()
+            sock.close()
+
+        return responses
+
     def discover_all(self) -> Dict[str, List[SmartDevice]]:
         """Run all discovery methods."""
         results = {
@@ -428,36 +585,127 @@ class SmartHomeManager:
         }
         return results
 
+    def discover_all_async(self) -> Dict[str, Any]:
+        """Start discovery in the background and return a job to poll."""
+        import uuid
+        job_id = str(uuid.uuid4())[:8]
+        job = {
+            "job_id": job_id,
+            "status": "running",
+            "started_at": datetime.datetime.now().isoformat(),
+        }
+        with self._discovery_lock:
+            self._discovery_jobs[job_id] = job
+            self._prune_discovery_jobs()
+
+        future = self._discovery_executor.submit(self.discover_all)
+        future.add_done_callback(lambda f: self._finish_discovery_job(job_id, f))
+        return dict(job)
+
+    def _finish_discovery_job(self, job_id: str, future):
+        """Record the outcome of a background discovery job."""
+        with self._discovery_lock:
+            job = self._discovery_jobs.get(job_id)
+            if job is None:
+                return
+            job["finished_at"] = datetime.datetime.now().isoformat()
+            try:
+                job["result"] = future.result()
+                job["status"] = "done"
+            except Exception as e:
+                job["error"] = str(e)
+                job["status"] = "error"
+
+    def _prune_discovery_jobs(self):
+        """Drop the oldest finished jobs beyond DISCOVERY_JOB_HISTORY."""
+        finished = [jid for jid, job in self._discovery_jobs.items()
+                    if job["status"] != "running"]
+        for jid in finished[:max(0, len(finished) - DISCOVERY_JOB_HISTORY)]:
+            del self._discovery_jobs[jid]
+
+    def get_discovery_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a snapshot of a background discovery job, or None if unknown."""
+        with self._discovery_lock:
+            job = self._discovery_jobs.get(job_id)
+            return dict(job) if job is not None else None
+
     # ==================== DEVICE CONTROL ====================
 
     def get_device(self, device_id: str) -> Optional[SmartDevice]:
         """Get a device by ID."""
         return self.devices.get(device_id)
 
+    def _add_device(self, device: SmartDevice):
+        """Insert or replace a device and keep the name index current."""
+        with self._devices_lock:
+            previous = self.devices.get(device.id)
+            if previous is not None:
+                old_key = previous.name.lower()
+                if self._name_index.get(old_key) == device.id:
+                    del self._name_index[old_key]
+                self._unindex_device(previous)
+            self.devices[device.id] = device
+            self._name_index.setdefault(device.name.lower(), device.id)
+            self._index_device(device)
+            self._devices_version += 1
+            self._status_dirty = True
+
+    def _index_device(self, device: SmartDevice):
+        """Add a device to the type and room indexes."""
+        self._by_type[device.device_type].append(device.id)
+        if device.room:
+            self._by_room[device.room.lower()].append(device.id)
+
+    def _unindex_device(self, device: SmartDevice):
+        """Remove a device from the type and room indexes."""
+        for index, key in ((self._by_type, device.device_type),
+                           (self._by_room, device.room.lower() if device.room else None)):
+            ids = index.get(key)
+            if ids and device.id in ids:
+                ids.remove(device.id)
+                if not ids:
+                    del index[key]
+
     def get_device_by_name(self, name: str) -> Optional[SmartDevice]:
-        """Find a device by name (fuzzy match)."""
+        """Find a device by name (exact match first, then substring)."""
         name_lower = name.lower()
-        for device in self.devices.values():
-            if name_lower in device.name.lower():
-                return device
-        return None
+        with self._devices_lock:
+            device_id = self._name_index.get(name_lower)
+            if device_id is not None and device_id in self.devices:
+                return self.devices[device_id]
+
+            if self._name_matches_version != self._devices_version:
+                self._name_matches = {}
+                self._name_matches_version = self._devices_version
+            if name_lower not in self._name_matches:
+                self._name_matches[name_lower] = next(
+                    (d.id for d in self.devices.values() if name_lower in d.name.lower()),
+                    None,
+                )
+            device_id = self._name_matches[name_lower]
+            return self.devices.get(device_id) if device_id is not None else None
 
     def get_devices_by_room(self, room: str) -> List[SmartDevice]:
         """Get all devices in a room."""
         room_lower = room.lower()
-        return [d for d in self.devices.values()
-                if d.room and room_lower in d.room.lower()]
+        with self._devices_lock:
+            return [self.devices[i]
+                    for key, ids in self._by_room.items() if room_lower in key
+                    for i in ids]
 
     def get_devices_by_type(self, device_type: DeviceType) -> List[SmartDevice]:
         """Get all devices of a type."""
-        return [d for d in self.devices.values()
-                if d.device_type == device_type]
+        with self._devices_lock:
+            return [self.devices[i] for i in self._by_type.get(device_type, ())]
 
     def set_device_room(self, device_id: str, room: str) -> bool:
         """Assign a device to a room."""
         device = self.devices.get(device_id)
         if device:
-            device.room = room
+            with self._devices_lock:
+                self._unindex_device(device)
+                device.room = room
+                self._index_device(device)
             self._save_device(device)
             return True
         return False
@@ -524,12 +772,14 @@ class SmartHomeManager:
                 state['on'] = True
 
         try:
-            response = requests.put(url, json=state, timeout=5)
+            response = self._http.put(url, json=state, timeout=5)
             result = response.json()
 
             # Update local state
-            device.state.update(state)
-            device.last_seen = datetime.datetime.now().isoformat()
+            with self._devices_lock:
+                device.state.update(state)
+                device.last_seen = datetime.datetime.now().isoformat()
+                self._status_dirty = True
 
             return {
                 "success": True,
@@ -556,18 +806,17 @@ class SmartHomeManager:
             created_at=datetime.datetime.now().isoformat()
         )
 
-        self.scenes[scene_id] = scene
+        with self._devices_lock:
+            self.scenes[scene_id] = scene
+            self._status_dirty = True
 
         # Save to database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO scenes (id, name, description, actions, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (scene.id, scene.name, scene.description,
-              json.dumps(scene.actions), scene.created_at))
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            conn.execute("""
+                INSERT INTO scenes (id, name, description, actions, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (scene.id, scene.name, scene.description,
+                  _dumps(scene.actions), scene.created_at))
 
         return scene
 
@@ -592,12 +841,11 @@ class SmartHomeManager:
 
         # Update last used
         scene.last_used = datetime.datetime.now().isoformat()
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("UPDATE scenes SET last_used = ? WHERE id = ?",
-                      (scene.last_used, scene.id))
-        conn.commit()
-        conn.close()
+        with self._devices_lock:
+            self._status_dirty = True
+        with self._transaction() as conn:
+            conn.execute("UPDATE scenes SET last_used = ? WHERE id = ?",
+                         (scene.last_used, scene.id))
 
         return {
             "success": True,
@@ -617,39 +865,52 @@ class SmartHomeManager:
 
     def get_all_devices(self) -> List[SmartDevice]:
         """Get all registered devices."""
-        return list(self.devices.values())
+        with self._devices_lock:
+            return list(self.devices.values())
 
     def get_home_status(self) -> Dict[str, Any]:
-        """Get overall smart home status."""
-        devices = self.get_all_devices()
-
-        online = sum(1 for d in devices if d.status == DeviceStatus.ONLINE)
-        offline = sum(1 for d in devices if d.status == DeviceStatus.OFFLINE)
-
-        by_type = {}
-        for d in devices:
-            t = d.device_type.value
-            by_type[t] = by_type.get(t, 0) + 1
-
-        by_room = {}
-        for d in devices:
-            r = d.room or "Unassigned"
-            by_room[r] = by_room.get(r, 0) + 1
+        """Get overall smart home status (cached until the next state change)."""
+        with self._devices_lock:
+            if self._status_dirty or self._status_cache is None:
+                self._status_cache = self._build_home_status()
+                self._status_dirty = False
+            status = self._status_cache
+
+        # Callers get their own copy so changes to it cannot leak into the cache
+        return {
+            **status,
+            "by_type": dict(status["by_type"]),
+            "by_room": dict(status["by_room"]),
+            "lights": dict(status["lights"]),
+        }
 
-        # Lights status
-        lights = self.get_devices_by_type(DeviceType.LIGHT)
-        lights_on = sum(1 for l in lights if l.state.get('on', False))
+    def _build_home_status(self) -> Dict[str, Any]:
+        """Summarize devices for get_home_status (caller holds the devices lock)."""
+        online = offline = lights = lights_on = 0
+        by_type: Counter = Counter()
+        by_room: Counter = Counter()
+        for d in self.devices.values():
+            if d.status == DeviceStatus.ONLINE:
+                online += 1
+            elif d.status == DeviceStatus.OFFLINE:
+                offline += 1
+            by_type[d.device_type.value] += 1
+            by_room[d.room or "Unassigned"] += 1
+            if d.device_type == DeviceType.LIGHT:
+                lights += 1
+                if d.state.get('on', False):
+                    lights_on += 1
 
         return {
-            "total_devices": len(devices),
+            "total_devices": len(self.devices),
             "online": online,
             "offline": offline,
-            "by_type": by_type,
-            "by_room": by_room,
+            "by_type": dict(by_type),
+            "by_room": dict(by_room),
             "lights": {
-                "total": len(lights),
+                "total": lights,
                 "on": lights_on,
-                "off": len(lights) - lights_on
+                "off": lights - lights_on
             },
             "scenes": len(self.scenes),
             "routines": len(self.routines)
@@ -657,28 +918,49 @@ class SmartHomeManager:
 
     def refresh_device_status(self, device_id: str = None) -> bool:
         """Refresh status for one or all devices."""
-        if device_id:
-            devices = [self.devices.get(device_id)] if device_id in self.devices else []
-        else:
-            devices = list(self.devices.values())
-
-        for device in devices:
-            if device.manufacturer == "Philips" and device.device_type == DeviceType.LIGHT:
-                # Refresh Hue light
-                hue_id = device.metadata.get('hue_id')
-                if hue_id and self._hue_bridge_ip and self._hue_username:
-                    try:
-                        url = f"http://{self._hue_bridge_ip}/api/{self._hue_username}/lights/{hue_id}"
-                        response = requests.get(url, timeout=3)
-                        data = response.json()
-                        device.state = data.get('state', {})
-                        device.status = DeviceStatus.ONLINE if data.get('state', {}).get('reachable') else DeviceStatus.OFFLINE
-                        device.last_seen = datetime.datetime.now().isoformat()
-                    except Exception:
-                        device.status = DeviceStatus.OFFLINE
+        with self._devices_lock:
+            if device_id:
+                devices = [self.devices.get(device_id)] if device_id in self.devices else []
+            else:
+                devices = list(self.devices.values())
+
+        if not self._hue_bridge_ip or not self._hue_username:
+            return True
 
+        hue_devices = [
+            d for d in devices
+            if d.manufacturer == "Philips" and d.device_type == DeviceType.LIGHT
+            and d.metadata.get('hue_id')
+        ]
+        if not hue_devices:
+            return True
+
+        # Poll the bridge concurrently, then apply results on this thread
+        workers = min(HUE_REFRESH_WORKERS, len(hue_devices))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._fetch_hue_state, hue_devices))
+
+        now = datetime.datetime.now().isoformat()
+        with self._devices_lock:
+            for device, state, ok in results:
+                if not ok:
+                    device.status = DeviceStatus.OFFLINE
+                    continue
+                device.state = state
+                device.status = DeviceStatus.ONLINE if state.get('reachable') else DeviceStatus.OFFLINE
+                device.last_seen = now
+            self._status_dirty = True
         return True
 
+    def _fetch_hue_state(self, device: SmartDevice) -> Tuple[SmartDevice, Dict[str, Any], bool]:
+        """Fetch the current state of one Hue light from the bridge."""
+        try:
+            url = f"http://{self._hue_bridge_ip}/api/{self._hue_username}/lights/{device.metadata['hue_id']}"
+            data = self._http.get(url, timeout=3).json()
+            return device, data.get('state', {}), True
+        except Exception:
+            return device, {}, False
+
 
 # ================================================================================
 # GLOBAL INSTANCE
@@ -699,20 +981,61 @@ def get_smarthome_manager() -> SmartHomeManager:
 # EXECUTOR FUNCTIONS
 # ================================================================================
 
-def discover_devices() -> str:
-    """Discover all smart home devices."""
-    manager = get_smarthome_manager()
-    results = manager.discover_all()
-
+def _discovery_summary(results: Dict[str, List[SmartDevice]]) -> Dict[str, Any]:
+    """Summarize discover_all() results for a reply."""
     total = sum(len(v) for v in results.values())
-
-    return json.dumps({
-        "success": True,
+    return {
         "message": f"Discovered {total} device(s)",
         "hue_lights": len(results.get('hue_lights', [])),
         "network_devices": len(results.get('network_devices', [])),
         "devices": [d.to_dict() for devices in results.values() for d in devices]
-    })
+    }
+
+
+def discover_devices(background: bool = False) -> str:
+    """
+    Discover all smart home devices.
+
+    With background=True, returns a job id immediately; poll it with
+    get_discovery_result_cmd().
+    """
+    manager = get_smarthome_manager()
+    if background:
+        job = manager.discover_all_async()
+        return _dumps({
+            "success": True,
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "message": "Discovery started"
+        })
+
+    results = manager.discover_all()
+    return _dumps({"success": True, **_discovery_summary(results)})
+
+
+def get_discovery_result_cmd(job_id: str) -> str:
+    """Get the status or results of a background discovery job."""
+    manager = get_smarthome_manager()
+    job = manager.get_discovery_result(job_id)
+    if job is None:
+        return _dumps({
+            "success": False,
+            "error": f"Discovery job not found: {job_id}"
+        })
+
+    reply = {
+        "success": job["status"] != "error",
+        "job_id": job_id,
+        "status": job["status"],
+        "started_at": job["started_at"],
+    }
+    if "finished_at" in job:
+        reply["finished_at"] = job["finished_at"]
+    if "result" in job:
+        reply.update(_discovery_summary(job["result"]))
+    if "error" in job:
+        reply["error"] = job["error"]
+    return _dumps(reply)
 
 
 def list_devices(device_type: str = None, room: str = None) -> str:
@@ -741,7 +1064,7 @@ def list_devices(device_type: str = None, room: str = None) -> str:
             lines.append(f"{status_icon} {d.name} ({d.device_type.value}){room_str}")
         message = "\n".join(lines)
 
-    return json.dumps({
+    return _dumps({
         "success": True,
         "count": len(devices),
         "devices": [d.to_dict() for d in devices],
@@ -755,13 +1078,13 @@ def control_device_cmd(device_name: str, action: str, **params) -> str:
 
     device = manager.get_device_by_name(device_name)
     if not device:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Device not found: {device_name}"
         })
 
     result = manager.control_device(device.id, action, params)
-    return json.dumps(result)
+    return _dumps(result)
 
 
 def get_home_status() -> str:
@@ -776,7 +1099,7 @@ def get_home_status() -> str:
     if status['scenes'] > 0:
         lines.append(f"  Scenes: {status['scenes']}")
 
-    return json.dumps({
+    return _dumps({
         "success": True,
         **status,
         "formatted": "\n".join(lines)
@@ -802,7 +1125,7 @@ def create_scene_cmd(name: str, devices_actions: List[Dict[str, Any]],
 
     scene = manager.create_scene(name, actions, description)
 
-    return json.dumps({
+    return _dumps({
         "success": True,
         "message": f"Created scene '{name}'",
         "scene": scene.to_dict()
@@ -815,13 +1138,13 @@ def activate_scene_cmd(scene_name: str) -> str:
 
     scene = manager.get_scene_by_name(scene_name)
     if not scene:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Scene not found: {scene_name}"
         })
 
     result = manager.activate_scene(scene.id)
-    return json.dumps(result)
+    return _dumps(result)
 
 
 def assign_room_cmd(device_name: str, room: str) -> str:
@@ -830,14 +1153,14 @@ def assign_room_cmd(device_name: str, room: str) -> str:
 
     device = manager.get_device_by_name(device_name)
     if not device:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Device not found: {device_name}"
         })
 
     manager.set_device_room(device.id, room)
 
-    return json.dumps({
+    return _dumps({
         "success": True,
         "message": f"Assigned {device.name} to {room}"
     })
@@ -851,7 +1174,10 @@ def execute_smarthome_command(action: str, params: Dict[str, Any] = None) -> str
     action_lower = action.lower().strip()
 
     if action_lower in ['discover', 'scan', 'find_devices']:
-        return discover_devices()
+        return discover_devices(background=bool(params.get('async', params.get('background'))))
+
+    elif action_lower in ['discovery_status', 'discovery_result', 'discover_result']:
+        return get_discovery_result_cmd(params.get('job_id', ''))
 
     elif action_lower in ['list', 'list_devices', 'devices', 'show_devices']:
         return list_devices(
@@ -886,11 +1212,11 @@ def execute_smarthome_command(action: str, params: Dict[str, Any] = None) -> str
         )
 
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Unknown smart home action: {action}",
             "available_actions": [
-                "discover", "list_devices", "status",
+                "discover", "discovery_status", "list_devices", "status",
                 "control", "create_scene", "activate_scene", "assign_room"
             ]
         })
@@ -905,6 +1231,7 @@ __all__ = [
     'DeviceStatus',
     'get_smarthome_manager',
     'discover_devices',
+    'get_discovery_result_cmd',
     'list_devices',
     'control_device_cmd',
     'get_home_status',
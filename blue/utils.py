@@ -10,8 +10,15 @@ import hashlib
 import json
 import logging
 import re
+import sys
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # ================================================================================
 # LOGGING
@@ -435,6 +442,30 @@ def clean_response_text(text: str) -> str:
     return text.strip()
 
 
+# ================================================================================
+# SERIALIZATION & DATACLASSES
+# ================================================================================
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def json_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize to compact JSON text, with orjson when it is installed.
+
+    ``default`` converts otherwise unsupported objects; with orjson it
+    also receives dataclass instances instead of orjson's own encoding.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS if default is not None else 0
+        return orjson.dumps(obj, default=default, option=option).decode()
+    return json.dumps(obj, separators=(",", ":"), default=default)
+
+
+json_loads: Callable[[Any], Any] = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
 # ================================================================================
 # CONVERSATION STATE
 # ================================================================================